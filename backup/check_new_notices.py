@@ -1,41 +1,43 @@
-import json
 import os
-from datetime import datetime, timedelta
+import sys
+import glob
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.archive import NoticeArchive
+from src.snapshot_diff import SnapshotDiffer, iter_sources, latest_archive_days
+from src.utils import load_config
 
 def check_new_notices():
-    # data 폴더의 최신 2개 파일 비교
-    files = sorted([f for f in os.listdir('data') if f.endswith('.json')])
-    
+    """최근 두 상태 비교 (스냅샷 파일이 두 개 이상 있으면 최신 두 파일, 없으면 아카이브의 최근 두 날짜)"""
+    files = sorted(glob.glob('data/notices_*.json'))[-2:]
+    archive, days = None, None
     if len(files) < 2:
+        files = []
+        archive = NoticeArchive(load_config().get('archive'))
+        archive.load()
+        days = latest_archive_days(archive)
+    
+    results = list(SnapshotDiffer().diff_stream(iter_sources(files, archive, days)))
+    if not results:
         print("비교할 이전 데이터가 없습니다.")
         return
     
-    # 최신 파일과 이전 파일 로드
-    with open(f'data/{files[-1]}', 'r', encoding='utf-8') as f:
-        current = json.load(f)
-    with open(f'data/{files[-2]}', 'r', encoding='utf-8') as f:
-        previous = json.load(f)
-    
     # 새 공지사항 찾기
-    new_notices = []
-    for curr_univ in current:
-        prev_univ = next((u for u in previous if u['code'] == curr_univ['code']), None)
-        if prev_univ and curr_univ['success']:
-            prev_titles = {n['title'] for n in prev_univ.get('notices', [])}
-            for notice in curr_univ['notices']:
-                if notice['title'] not in prev_titles:
-                    new_notices.append({
-                        'university': curr_univ['university'],
-                        'notice': notice
-                    })
+    new_notices = [
+        {'university': university['university'], 'notice': notice}
+        for university in results[-1]['universities']
+        for notice in university['added']
+    ]
     
     # 결과 출력
     if new_notices:
         print(f"\n🆕 새로운 공지사항 {len(new_notices)}개 발견!")
         for item in new_notices:
             print(f"\n[{item['university']}]")
-            print(f"제목: {item['notice']['title']}")
-            print(f"날짜: {item['notice']['date']}")
+            print(f"제목: {item['notice']['notice_title']}")
+            print(f"날짜: {item['notice']['notice_date']}")
     else:
         print("\n새로운 공지사항이 없습니다.")
 
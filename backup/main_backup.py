@@ -3,6 +3,12 @@ import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.archive import NoticeArchive, add_snapshot
 
 def load_config():
     with open('config.json', 'r', encoding='utf-8') as f:
@@ -99,19 +105,14 @@ def crawl_university(univ_info):
     }
 
 def save_results(results):
-    """결과를 JSON 파일로 저장"""
-    # data 폴더가 없으면 생성
-    if not os.path.exists('data'):
-        os.makedirs('data')
-    
-    # 날짜별 파일명
-    filename = f"data/notices_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    """결과를 공지사항 아카이브에 추가 (새 공지사항만 저장)"""
+    archive = NoticeArchive(load_config().get('archive'))
+    archive.load()
+    added = add_snapshot(archive, results, datetime.now().isoformat(timespec='seconds'))
+    stats = archive.flush()
     
-    print(f"\n결과 저장 완료: {filename}")
-    return filename
+    print(f"\n결과 저장 완료: {archive.log_path} (새 공지사항 {added}개, 전체 {stats['notices']}개)")
+    return str(archive.log_path)
 
 def main():
     print("대학 공지사항 크롤러 시작")
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+DB 경로 벤치마크
+로컬 PostgREST 대역(fake_postgrest.py)에 지연과 오류를 주입하고 SupabaseManager/WriteSpool의
+처리량, 왕복 횟수, 배치 크기, 장애 중 스풀 동작을 측정 (Supabase 사용량 소모 없음)
+
+사용법:
+    python benchmarks/db_benchmark.py [--rows 20000] [--latency 0.03] [--filter write] [--output results.json]
+"""
+
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_postgrest import FakePostgrest, FAKE_KEY
+from src.database import SupabaseManager
+from src.spool import WriteSpool
+
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+
+UNIVERSITY_COUNT = 50
+
+def make_notices(count: int, offset: int = 0) -> Dict[str, List[Dict]]:
+    """대학별 합성 공지사항"""
+    notices: Dict[str, List[Dict]] = {}
+    for i in range(offset, offset + count):
+        notices.setdefault(f"대학 {i % UNIVERSITY_COUNT}", []).append({
+            'notice_title': f"공지사항 {i}",
+            'notice_link': f"https://example.ac.kr/notice/{i}",
+            'notice_date': '2025-03-02'
+        })
+    return notices
+
+def prepared_rows(db_manager: SupabaseManager, notices: Dict[str, List[Dict]]) -> List[Dict]:
+    """저장용 행 목록"""
+    rows = []
+    for university_name, items in notices.items():
+        rows.extend(db_manager.prepare_notices(items, university_name))
+    return rows
+
+def bench_write(args) -> List[Dict[str, Any]]:
+    """배치 크기 x 동시 요청 수별 저장 처리량 (새 행, 전부 중복인 재전송)"""
+    results = []
+    for batch_size in (100, 500, 1000):
+        for concurrency in (1, 4):
+            with FakePostgrest(latency=args.latency, jitter=args.jitter) as server:
+                db_manager = SupabaseManager(server.url, FAKE_KEY, batch_size=batch_size, concurrency=concurrency)
+                rows = prepared_rows(db_manager, make_notices(args.rows))
+                
+                started = time.perf_counter()
+                inserted, failed = db_manager.upsert_rows(rows)
+                elapsed = time.perf_counter() - started
+                
+                started = time.perf_counter()
+                db_manager.upsert_rows(rows)
+                duplicate_elapsed = time.perf_counter() - started
+                
+                stats = server.stats()
+                db_manager.close()
+            
+            results.append({
+                'batch_size': batch_size,
+                'concurrency': concurrency,
+                'rows': len(rows),
+                'inserted': len(inserted),
+                'failed': len(failed),
+                'seconds': round(elapsed, 3),
+                'rows_per_second': round(len(rows) / elapsed),
+                'duplicate_seconds': round(duplicate_elapsed, 3),
+                'round_trips': db_manager.round_trips,
+                'mean_batch_size': stats['mean_batch_size'],
+                'max_in_flight': stats['max_in_flight']
+            })
+            print(f"write  batch={batch_size:<5} concurrency={concurrency}  {elapsed:>7.3f}s  "
+                  f"{len(rows) / elapsed:>9.0f} rows/s  round_trips={db_manager.round_trips}")
+    return results
+
+def bench_read(args) -> List[Dict[str, Any]]:
+    """커서 페이지 조회, 최근 공지사항, 통계 조회 지연"""
+    results = []
+    with FakePostgrest() as server:
+        db_manager = SupabaseManager(server.url, FAKE_KEY, batch_size=1000)
+        db_manager.upsert_rows(prepared_rows(db_manager, make_notices(args.rows)))
+        server.set_conditions(latency=args.latency, jitter=args.jitter)
+        
+        cases = [
+            ('iter_notices page=500', lambda: sum(1 for _ in db_manager.iter_notices(page_size=500))),
+            ('iter_notices page=2000 columns=2',
+             lambda: sum(1 for _ in db_manager.iter_notices(columns=['notice_title', 'notice_link'], page_size=2000))),
+            ('get_recent_notices limit=200', lambda: len(db_manager.get_recent_notices('대학 7', limit=200))),
+            ('get_all_university_stats', lambda: len(db_manager.get_all_university_stats())),
+            ('iter_fingerprints page=1000', lambda: sum(1 for _ in db_manager.iter_fingerprints(1000))),
+        ]
+        for name, func in cases:
+            server.reset_stats()
+            round_trips = db_manager.round_trips
+            started = time.perf_counter()
+            count = func()
+            elapsed = time.perf_counter() - started
+            results.append({
+                'name': name,
+                'rows': count,
+                'seconds': round(elapsed, 3),
+                'round_trips': db_manager.round_trips - round_trips,
+                'rows_returned': server.stats()['rows_returned']
+            })
+            print(f"read   {name:<36} {elapsed:>7.3f}s  rows={count}  round_trips={db_manager.round_trips - round_trips}")
+        db_manager.close()
+    return results
+
+def bench_spool(args) -> List[Dict[str, Any]]:
+    """장애(503, 응답 유실) 중 스풀 저장: 모든 행이 중복 없이 한 번씩 저장되는지와 지연 확인"""
+    results = []
+    scenarios = [
+        ('healthy', {}),
+        ('outage_3s', {'outage': 3.0}),
+        ('lost_responses_20pct', {'error_rate': 0.2, 'error_mode': 'reset_after'}),
+        ('gateway_errors_20pct', {'error_rate': 0.2, 'error_mode': 'gateway'}),
+    ]
+    
+    for name, scenario in scenarios:
+        spool_dir = tempfile.mkdtemp(prefix='spool_bench_')
+        with FakePostgrest(latency=args.latency, jitter=args.jitter, seed=1) as server:
+            db_manager = SupabaseManager(server.url, FAKE_KEY, batch_size=500)
+            spool = WriteSpool(db_manager, {
+                'dir': spool_dir,
+                'batch_rows': 500,
+                'flush_interval_seconds': 0.2,
+                'max_backoff_seconds': 1,
+                'drain_timeout_seconds': 60,
+                'fsync': False
+            })
+            
+            server.set_conditions(error_rate=scenario.get('error_rate', 0.0),
+                                  error_mode=scenario.get('error_mode', 'unavailable'),
+                                  down=bool(scenario.get('outage')))
+            if scenario.get('outage'):
+                threading.Timer(scenario['outage'], server.set_conditions, kwargs={'down': False}).start()
+            
+            started = time.perf_counter()
+            notices = make_notices(args.spool_rows)
+            add_seconds = 0.0
+            for university_name, items in notices.items():
+                add_started = time.perf_counter()
+                spool.add(items, university_name)
+                add_seconds += time.perf_counter() - add_started
+            spool.close()
+            elapsed = time.perf_counter() - started
+            
+            stored = server.row_count()
+            stats = spool.stats()
+            server_stats = server.stats()
+            db_manager.close()
+        shutil.rmtree(spool_dir, ignore_errors=True)
+        
+        expected = sum(len(items) for items in notices.values())
+        results.append({
+            'name': name,
+            'rows': expected,
+            'stored': stored,
+            'complete': stored == expected and stats['pending_bytes'] == 0,
+            'rejected': stats['rejected'],
+            'retries': stats['retries'],
+            'seconds': round(elapsed, 3),
+            'add_ms_total': round(add_seconds * 1000, 1),
+            'requests': server_stats['requests'],
+            'injected_errors': server_stats['injected_errors']
+        })
+        print(f"spool  {name:<24} {elapsed:>7.3f}s  stored={stored}/{expected}  rejected={stats['rejected']}  "
+              f"retries={stats['retries']}  add={add_seconds * 1000:.1f}ms")
+    return results
+
+BENCHMARKS = {'write': bench_write, 'read': bench_read, 'spool': bench_spool}
+
+def main() -> int:
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(description='DB 경로 벤치마크 (로컬 PostgREST 대역)')
+    parser.add_argument('--rows', type=int, default=20000, help='저장/조회 벤치마크 행 수')
+    parser.add_argument('--spool-rows', type=int, default=5000, help='스풀 벤치마크 행 수')
+    parser.add_argument('--latency', type=float, default=0.03, help='요청당 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.01, help='추가 무작위 지연 최대값 (초)')
+    parser.add_argument('--filter', help='이 이름의 벤치마크만 실행 (write, read, spool)')
+    parser.add_argument('--output', help='결과 JSON 경로')
+    args = parser.parse_args()
+    
+    # 주입한 오류의 재시도 로그는 결과에 포함되므로 출력하지 않음
+    logging.basicConfig(level=logging.CRITICAL)
+    
+    results = {
+        'timestamp': datetime.now().isoformat(),
+        'latency': args.latency,
+        'jitter': args.jitter
+    }
+    for name, bench in BENCHMARKS.items():
+        if args.filter and args.filter != name:
+            continue
+        results[name] = bench(args)
+    
+    output = Path(args.output) if args.output else RESULTS_DIR / f"db_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output}")
+    
+    incomplete = [result['name'] for result in results.get('spool', []) if not result['complete']]
+    if incomplete:
+        print(f"스풀 저장 누락: {', '.join(incomplete)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+스냅샷 비교 벤치마크
+합성 스냅샷(대학 수 x 공지사항 수 x 스냅샷 수)을 만들어 src/snapshot_diff.py의 스트리밍 비교 시간을 측정하고
+같은 두 스냅샷을 기존 check_new_notices.py 방식(대학마다 이전 스냅샷 선형 탐색)으로 비교한 시간과 비교
+
+사용법:
+    python benchmarks/diff_benchmark.py [--universities 3000] [--notices 20] [--snapshots 100] [--output results.json]
+"""
+
+import sys
+import json
+import time
+import random
+import shutil
+import logging
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.snapshot_diff import SnapshotDiffer, iter_sources, load_snapshot_file
+
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+
+def write_snapshots(directory: Path, args) -> List[str]:
+    """게시판처럼 매 스냅샷마다 일부 대학에 새 공지사항이 올라오는 합성 스냅샷 작성"""
+    rng = random.Random(1)
+    boards = {
+        code: [(f"공지사항 {code}-{i}", f"https://example.ac.kr/{code}/{i}") for i in range(args.notices)]
+        for code in (f"u{i}" for i in range(args.universities))
+    }
+    started = datetime(2025, 3, 2)
+    next_id = args.notices
+    paths = []
+    
+    for n in range(args.snapshots):
+        results = []
+        for code, board in boards.items():
+            if rng.random() < args.churn:
+                board.insert(0, (f"공지사항 {code}-{next_id}", f"https://example.ac.kr/{code}/{next_id}"))
+                board.pop()
+                next_id += 1
+            results.append({
+                'university': f"대학 {code}",
+                'code': code,
+                'success': rng.random() > 0.01,
+                'notices': [{'title': title, 'date': '2025. 3. 2.', 'link': link} for title, link in board],
+                'crawled_at': (started + timedelta(hours=n)).isoformat()
+            })
+        
+        path = directory / f"notices_{(started + timedelta(hours=n)).strftime('%Y%m%d_%H%M%S')}.json"
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False)
+        paths.append(str(path))
+    return paths
+
+def legacy_diff(previous: List[Dict], current: List[Dict]) -> int:
+    """기존 check_new_notices.py 비교 (대학마다 next()로 이전 스냅샷 탐색, 제목만 비교)"""
+    new_notices = 0
+    for curr_univ in current:
+        prev_univ = next((u for u in previous if u['code'] == curr_univ['code']), None)
+        if prev_univ and curr_univ['success']:
+            prev_titles = {n['title'] for n in prev_univ.get('notices', [])}
+            new_notices += sum(1 for notice in curr_univ['notices'] if notice['title'] not in prev_titles)
+    return new_notices
+
+def main() -> int:
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(description='스냅샷 비교 벤치마크')
+    parser.add_argument('--universities', type=int, default=3000, help='대학 수')
+    parser.add_argument('--notices', type=int, default=20, help='대학별 공지사항 수')
+    parser.add_argument('--snapshots', type=int, default=100, help='스냅샷 수')
+    parser.add_argument('--churn', type=float, default=0.05, help='스냅샷마다 새 공지사항이 올라오는 대학 비율')
+    parser.add_argument('--output', help='결과 JSON 경로')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    directory = Path(tempfile.mkdtemp(prefix='diff_bench_'))
+    try:
+        paths = write_snapshots(directory, args)
+        
+        started = time.perf_counter()
+        added = sum(result['summary']['added'] for result in SnapshotDiffer().diff_stream(iter_sources(paths)))
+        stream_seconds = time.perf_counter() - started
+        
+        with open(paths[-2], 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+        with open(paths[-1], 'r', encoding='utf-8') as f:
+            current = json.load(f)
+        started = time.perf_counter()
+        legacy_diff(previous, current)
+        legacy_pair_seconds = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        snapshots = [load_snapshot_file(path) for path in paths[-2:]]
+        load_seconds = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        SnapshotDiffer().diff(*snapshots)
+        pair_seconds = time.perf_counter() - started
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    
+    results: Dict[str, Any] = {
+        'timestamp': datetime.now().isoformat(),
+        'universities': args.universities,
+        'notices': args.notices,
+        'snapshots': args.snapshots,
+        'notices_per_snapshot': args.universities * args.notices,
+        'added_total': added,
+        'stream_seconds': round(stream_seconds, 3),
+        'pair_load_seconds': round(load_seconds, 3),
+        'pair_diff_seconds': round(pair_seconds, 3),
+        'legacy_pair_diff_seconds': round(legacy_pair_seconds, 3)
+    }
+    print(f"스트리밍 비교 {args.snapshots}개 스냅샷: {stream_seconds:.2f}s (추가 {added}개)")
+    print(f"두 스냅샷: 읽기 {load_seconds:.3f}s, 비교 {pair_seconds:.3f}s (기존 방식 비교 {legacy_pair_seconds:.3f}s)")
+    
+    output = Path(args.output) if args.output else RESULTS_DIR / f"diff_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
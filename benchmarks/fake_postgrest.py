@@ -0,0 +1,570 @@
+#!/usr/bin/env python3
+"""
+로컬 PostgREST 대역 서버
+SupabaseManager가 사용하는 PostgREST API 일부(select 필터/정렬/limit/offset/or, insert, upsert, delete, count)를
+SQLite로 구현한 프로세스 내 HTTP 서버. 지연과 오류를 주입해 네트워크 조건을 흉내내고 요청/배치 크기를 집계
+
+사용법:
+    with FakePostgrest(latency=0.02, error_rate=0.05) as server:
+        db_manager = SupabaseManager(server.url, FAKE_KEY)
+    
+    python benchmarks/fake_postgrest.py --port 54321 --latency 0.02   # 단독 실행 (SUPABASE_URL=http://127.0.0.1:54321)
+"""
+
+import sys
+import json
+import time
+import random
+import sqlite3
+import argparse
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit, parse_qsl
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.sqlite_database import SQLiteManager
+
+# supabase 클라이언트의 키 형식 검사(JWT 형태)를 통과하는 가짜 키
+FAKE_KEY = 'fake.service-role.key'
+
+# 주입 가능한 오류 종류
+#   unavailable: 503 + PostgREST JSON 오류 (DB 연결 실패)
+#   gateway:     502 + JSON이 아닌 본문 (게이트웨이 오류)
+#   reset:       처리하지 않고 응답 없이 연결 종료
+#   reset_after: 처리(커밋)한 뒤 응답 없이 연결 종료 (응답 유실)
+ERROR_MODES = ('unavailable', 'gateway', 'reset', 'reset_after')
+
+COMPARISON_OPERATORS = {'eq': '=', 'neq': '<>', 'gt': '>', 'gte': '>=', 'lt': '<', 'lte': '<='}
+RESERVED_PARAMS = {'select', 'order', 'limit', 'offset', 'on_conflict', 'columns'}
+
+class PostgrestError(Exception):
+    """PostgREST 형식 오류 응답"""
+    
+    def __init__(self, status: int, code: str, message: str, details: str = None, hint: str = None):
+        super().__init__(message)
+        self.status = status
+        self.body = {'code': code, 'message': message, 'details': details, 'hint': hint}
+
+def _split_top_level(text: str) -> List[str]:
+    """따옴표와 괄호 안의 쉼표를 제외하고 쉼표로 분리"""
+    parts, current, depth, quoted = [], [], 0, False
+    for char in text:
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char == '(':
+            depth += 1
+        elif not quoted and char == ')':
+            depth -= 1
+        elif not quoted and depth == 0 and char == ',':
+            parts.append(''.join(current))
+            current = []
+            continue
+        current.append(char)
+    parts.append(''.join(current))
+    return [part for part in parts if part != '']
+
+def _unquote(value: str) -> str:
+    """큰따옴표로 감싼 값의 따옴표 제거"""
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1].replace('\\"', '"')
+    return value
+
+class FakePostgrest:
+    """SQLite 기반 PostgREST 대역 (지연/오류 주입, 요청 통계)"""
+    
+    def __init__(self, path: str = ':memory:', table_name: str = 'university_notices',
+                 stats_table_name: str = 'university_notice_stats', latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, error_mode: str = 'unavailable', seed: int = None,
+                 host: str = '127.0.0.1', port: int = 0):
+        self.table_name = table_name
+        self.stats_table_name = stats_table_name
+        self.host = host
+        self.port = port
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._forced_errors: List[str] = []
+        self.down = False
+        self.set_conditions(latency=latency, jitter=jitter, error_rate=error_rate, error_mode=error_mode)
+        self.reset_stats()
+        
+        # 공지사항 테이블과 인덱스는 SQLite 백엔드와 동일하게 생성
+        self.storage = SQLiteManager(path, table_name)
+        self.conn = self.storage.conn
+        self._db_lock = self.storage._lock
+        with self._db_lock:
+            # 통계 테이블(트리거로 유지) 대신 같은 컬럼의 집계 뷰
+            self.conn.execute(f"""
+                CREATE VIEW IF NOT EXISTS {stats_table_name} AS
+                SELECT university_name, COUNT(*) AS total_notices, MAX(crawled_at) AS latest_crawl,
+                       MAX(notice_date) AS latest_notice_date
+                FROM {table_name} GROUP BY university_name
+            """)
+        self._columns = {name: self._table_columns(name) for name in (table_name, stats_table_name)}
+    
+    def _table_columns(self, table: str) -> List[str]:
+        """테이블/뷰 컬럼 목록"""
+        with self._db_lock:
+            return [row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")]
+    
+    # 서버 수명 주기
+    
+    @property
+    def url(self) -> str:
+        """Supabase 프로젝트 URL 형태의 주소 (클라이언트가 /rest/v1을 붙임)"""
+        return f"http://{self.host}:{self.port}"
+    
+    def start(self) -> 'FakePostgrest':
+        """백그라운드 스레드에서 서버 시작"""
+        self._server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._server.daemon_threads = True
+        self._server.fake = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name='fake-postgrest', daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        """서버와 DB 연결 종료"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        self.storage.close()
+    
+    def __enter__(self) -> 'FakePostgrest':
+        return self.start()
+    
+    def __exit__(self, *exc_info):
+        self.stop()
+    
+    # 네트워크 조건
+    
+    def set_conditions(self, latency: float = None, jitter: float = None, error_rate: float = None,
+                       error_mode: str = None, down: bool = None):
+        """지연(초), 추가 무작위 지연, 오류 비율/종류, 장애 상태 변경 (실행 중에도 가능)"""
+        if error_mode is not None and error_mode not in ERROR_MODES:
+            raise ValueError(f"알 수 없는 오류 종류: {error_mode}")
+        
+        with self._lock:
+            if latency is not None:
+                self.latency = latency
+            if jitter is not None:
+                self.jitter = jitter
+            if error_rate is not None:
+                self.error_rate = error_rate
+            if error_mode is not None:
+                self.error_mode = error_mode
+            if down is not None:
+                self.down = down
+    
+    def fail_next(self, count: int = 1, mode: str = 'unavailable'):
+        """다음 count개 요청을 지정한 오류로 실패시킴"""
+        if mode not in ERROR_MODES:
+            raise ValueError(f"알 수 없는 오류 종류: {mode}")
+        with self._lock:
+            self._forced_errors.extend([mode] * count)
+    
+    def _next_error(self) -> Tuple[float, Optional[str]]:
+        """이번 요청의 지연 시간과 주입할 오류"""
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            if self._forced_errors:
+                return delay, self._forced_errors.pop(0)
+            if self.down:
+                return delay, self.error_mode
+            if self.error_rate and self._random.random() < self.error_rate:
+                return delay, self.error_mode
+            return delay, None
+    
+    # 통계
+    
+    def reset_stats(self):
+        """요청 통계 초기화"""
+        with self._lock:
+            self.requests: Counter = Counter()
+            self.injected_errors: Counter = Counter()
+            self.batch_sizes: List[int] = []
+            self.rows_written = 0
+            self.rows_returned = 0
+            self.in_flight = 0
+            self.max_in_flight = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """요청 수, 배치 크기, 동시 요청 수 통계"""
+        with self._lock:
+            return {
+                'requests': sum(self.requests.values()),
+                'requests_by_method': dict(self.requests),
+                'injected_errors': dict(self.injected_errors),
+                'write_requests': len(self.batch_sizes),
+                'mean_batch_size': round(sum(self.batch_sizes) / len(self.batch_sizes), 1) if self.batch_sizes else 0,
+                'max_batch_size': max(self.batch_sizes, default=0),
+                'rows_written': self.rows_written,
+                'rows_returned': self.rows_returned,
+                'max_in_flight': self.max_in_flight
+            }
+    
+    def row_count(self) -> int:
+        """저장된 공지사항 수"""
+        with self._db_lock:
+            return self.conn.execute(f"SELECT COUNT(*) FROM {self.table_name}").fetchone()[0]
+    
+    # 요청 처리
+    
+    def handle(self, method: str, path: str, headers: Dict[str, str], body: bytes) -> Tuple[int, Dict[str, str], bytes]:
+        """PostgREST 요청 하나를 처리하고 (상태 코드, 헤더, 본문) 반환"""
+        parsed = urlsplit(path)
+        prefix = '/rest/v1/'
+        if not parsed.path.startswith(prefix):
+            raise PostgrestError(404, 'PGRST125', f"Invalid path specified in request URL: {parsed.path}")
+        
+        table = parsed.path[len(prefix):].strip('/')
+        if table not in self._columns:
+            raise PostgrestError(404, '42P01', f'relation "public.{table}" does not exist')
+        
+        params = parse_qsl(parsed.query, keep_blank_values=True)
+        prefer = self._parse_prefer(headers.get('prefer', ''))
+        
+        if method in ('GET', 'HEAD'):
+            return self._select(table, params, prefer, include_body=method == 'GET')
+        if method == 'POST':
+            return self._insert(table, params, prefer, body)
+        if method == 'DELETE':
+            return self._delete(table, params, prefer)
+        raise PostgrestError(405, 'PGRST117', f"Unsupported HTTP method: {method}")
+    
+    @staticmethod
+    def _parse_prefer(header: str) -> Dict[str, str]:
+        """Prefer 헤더 (return=..., count=..., resolution=...)"""
+        prefer = {}
+        for item in header.split(','):
+            key, _, value = item.strip().partition('=')
+            if key:
+                prefer[key] = value
+        return prefer
+    
+    def _column(self, table: str, name: str) -> str:
+        """컬럼 이름 검증 후 반환"""
+        if name not in self._columns[table]:
+            raise PostgrestError(400, '42703', f"column {table}.{name} does not exist")
+        return name
+    
+    def _select_list(self, table: str, params: List[Tuple[str, str]]) -> str:
+        """select 파라미터를 SQL 컬럼 목록으로 변환"""
+        select = next((value for key, value in params if key == 'select'), '*')
+        columns = [column.strip() for column in select.split(',') if column.strip()]
+        if not columns or columns == ['*']:
+            return '*'
+        return ', '.join(self._column(table, column) for column in columns)
+    
+    def _where(self, table: str, params: List[Tuple[str, str]]) -> Tuple[str, List[Any]]:
+        """필터 파라미터를 WHERE 절로 변환 (여러 필터는 AND)"""
+        clauses, values = [], []
+        for key, value in params:
+            if key in RESERVED_PARAMS:
+                continue
+            if key in ('or', 'and', 'not.or', 'not.and'):
+                clause, clause_values = self._logic(table, key, value)
+            else:
+                clause, clause_values = self._condition(table, key, value)
+            clauses.append(clause)
+            values.extend(clause_values)
+        
+        if not clauses:
+            return '', []
+        return 'WHERE ' + ' AND '.join(clauses), values
+    
+    def _logic(self, table: str, operator: str, expression: str) -> Tuple[str, List[Any]]:
+        """or=(a.eq.1,and(b.lt.2,c.gt.3)) 형태의 논리 조건"""
+        negate = operator.startswith('not.')
+        operator = operator[4:] if negate else operator
+        if not (expression.startswith('(') and expression.endswith(')')):
+            raise PostgrestError(400, 'PGRST100', f'"failed to parse logic tree ({expression})"')
+        
+        clauses, values = [], []
+        for item in _split_top_level(expression[1:-1]):
+            head, _, rest = item.partition('(')
+            if rest and head in ('or', 'and', 'not.or', 'not.and'):
+                clause, item_values = self._logic(table, head, '(' + rest)
+            else:
+                column, _, condition = item.partition('.')
+                clause, item_values = self._condition(table, column, condition)
+            clauses.append(clause)
+            values.extend(item_values)
+        
+        sql = '(' + f' {operator.upper()} '.join(clauses) + ')'
+        return (f"NOT {sql}" if negate else sql), values
+    
+    def _condition(self, table: str, column: str, expression: str) -> Tuple[str, List[Any]]:
+        """column=op.value 필터 하나"""
+        negate = expression.startswith('not.')
+        if negate:
+            expression = expression[4:]
+        
+        operator, _, value = expression.partition('.')
+        column = self._column(table, column)
+        
+        if operator in COMPARISON_OPERATORS:
+            sql, values = f"{column} {COMPARISON_OPERATORS[operator]} ?", [_unquote(value)]
+        elif operator == 'is':
+            literal = {'null': 'NULL', 'true': '1', 'false': '0'}.get(value.lower())
+            if literal is None:
+                raise PostgrestError(400, 'PGRST100', f'"failed to parse filter (is.{value})"')
+            sql, values = f"{column} IS {literal}", []
+        elif operator == 'in':
+            if not (value.startswith('(') and value.endswith(')')):
+                raise PostgrestError(400, 'PGRST100', f'"failed to parse filter (in.{value})"')
+            items = [_unquote(item) for item in _split_top_level(value[1:-1])]
+            sql, values = f"{column} IN ({', '.join('?' for _ in items)})", items
+        elif operator in ('like', 'ilike'):
+            sql, values = f"{column} LIKE ?", [_unquote(value).replace('*', '%')]
+        else:
+            raise PostgrestError(400, 'PGRST100', f'"failed to parse filter ({expression})"')
+        
+        return (f"NOT ({sql})" if negate else sql), values
+    
+    def _order(self, table: str, params: List[Tuple[str, str]]) -> str:
+        """order=col.desc,col2 를 ORDER BY 절로 변환 (NULL 순서는 PostgreSQL 기본값과 동일)"""
+        order = next((value for key, value in params if key == 'order'), None)
+        if not order:
+            return ''
+        
+        terms = []
+        for term in order.split(','):
+            parts = term.split('.')
+            column = self._column(table, parts[0])
+            descending = 'desc' in parts[1:]
+            nulls_first = 'nullsfirst' in parts[1:] or (descending and 'nullslast' not in parts[1:])
+            terms.append(f"{column} {'DESC' if descending else 'ASC'} NULLS {'FIRST' if nulls_first else 'LAST'}")
+        return 'ORDER BY ' + ', '.join(terms)
+    
+    @staticmethod
+    def _int_param(params: List[Tuple[str, str]], name: str) -> Optional[int]:
+        """limit, offset 정수 파라미터"""
+        value = next((value for key, value in params if key == name), None)
+        if value is None:
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            raise PostgrestError(400, 'PGRST100', f'"failed to parse {name} ({value})"')
+    
+    def _select(self, table: str, params, prefer: Dict[str, str], include_body: bool = True):
+        """GET: 필터/정렬/페이지 조회 (count=exact 면 Content-Range에 전체 개수)"""
+        where, values = self._where(table, params)
+        limit = self._int_param(params, 'limit')
+        offset = self._int_param(params, 'offset') or 0
+        
+        sql = f"SELECT {self._select_list(table, params)} FROM {table} {where} {self._order(table, params)}"
+        if limit is not None or offset:
+            sql += f" LIMIT {limit if limit is not None else -1} OFFSET {offset}"
+        
+        with self._db_lock:
+            rows = [dict(row) for row in self.conn.execute(sql, values)]
+            total = None
+            if prefer.get('count') in ('exact', 'planned', 'estimated'):
+                total = self.conn.execute(f"SELECT COUNT(*) FROM {table} {where}", values).fetchone()[0]
+        
+        with self._lock:
+            self.rows_returned += len(rows)
+        
+        content_range = f"{offset}-{offset + len(rows) - 1}" if rows else '*'
+        headers = {'Content-Range': f"{content_range}/{total if total is not None else '*'}"}
+        return 200, headers, (json.dumps(rows, ensure_ascii=False).encode('utf-8') if include_body else b'')
+    
+    def _insert(self, table: str, params, prefer: Dict[str, str], body: bytes):
+        """POST: insert/upsert (resolution=ignore-duplicates 또는 merge-duplicates, on_conflict 컬럼)"""
+        if table != self.table_name:
+            raise PostgrestError(405, 'PGRST117', f"cannot insert into view {table}")
+        
+        try:
+            payload = json.loads(body or b'[]')
+        except json.JSONDecodeError as e:
+            raise PostgrestError(400, 'PGRST102', f"Empty or invalid json: {str(e)}")
+        rows = payload if isinstance(payload, list) else [payload]
+        if not rows:
+            return 201, {'Content-Range': '*/*'}, b'[]'
+        
+        columns = list(rows[0].keys())
+        if any(set(row.keys()) != set(columns) for row in rows):
+            raise PostgrestError(400, 'PGRST102', "All object keys must match")
+        for column in columns:
+            if column not in self._columns[table]:
+                raise PostgrestError(400, 'PGRST204', f"Could not find the '{column}' column of '{table}' in the schema cache")
+        
+        conflict_sql = ''
+        resolution = prefer.get('resolution')
+        if resolution:
+            on_conflict = next((value for key, value in params if key == 'on_conflict'), 'id')
+            target = ', '.join(self._column(table, column) for column in on_conflict.split(','))
+            if resolution == 'ignore-duplicates':
+                conflict_sql = f"ON CONFLICT({target}) DO NOTHING"
+            else:
+                updates = ', '.join(f"{column} = excluded.{column}" for column in columns)
+                conflict_sql = f"ON CONFLICT({target}) DO UPDATE SET {updates}"
+        
+        returning = self._select_list(table, params)
+        # SQLite 변수 개수 제한에 맞춰 나눠 실행 (한 트랜잭션)
+        chunk_size = max(1, 30000 // len(columns))
+        inserted = []
+        with self._db_lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                for i in range(0, len(rows), chunk_size):
+                    chunk = rows[i:i + chunk_size]
+                    placeholders = ', '.join('(' + ', '.join('?' for _ in columns) + ')' for _ in chunk)
+                    # 배열 컬럼(categories TEXT[])은 SQLite 저장소와 같이 JSON 문자열로 저장
+                    values = [json.dumps(row[column], ensure_ascii=False) if isinstance(row[column], list) else row[column]
+                              for row in chunk for column in columns]
+                    cursor = self.conn.execute(
+                        f"INSERT INTO {table} ({', '.join(columns)}) VALUES {placeholders} {conflict_sql} RETURNING {returning}",
+                        values
+                    )
+                    inserted.extend(dict(row) for row in cursor)
+                self.conn.execute("COMMIT")
+            except BaseException as e:
+                self.conn.execute("ROLLBACK")
+                raise self._database_error(e)
+        
+        with self._lock:
+            self.batch_sizes.append(len(rows))
+            self.rows_written += len(inserted)
+        
+        headers = {'Content-Range': f"*/{len(inserted)}"}
+        if prefer.get('return') == 'representation':
+            return 201, headers, json.dumps(inserted, ensure_ascii=False).encode('utf-8')
+        return 201, headers, b''
+    
+    def _delete(self, table: str, params, prefer: Dict[str, str]):
+        """DELETE: 필터에 맞는 행 삭제 (count=exact 면 Content-Range에 삭제 수)"""
+        if table != self.table_name:
+            raise PostgrestError(405, 'PGRST117', f"cannot delete from view {table}")
+        
+        where, values = self._where(table, params)
+        with self._db_lock:
+            try:
+                deleted = [dict(row) for row in self.conn.execute(
+                    f"DELETE FROM {table} {where} RETURNING {self._select_list(table, params)}", values
+                )]
+            except sqlite3.Error as e:
+                raise self._database_error(e)
+        
+        headers = {'Content-Range': f"*/{len(deleted)}"}
+        if prefer.get('return') == 'representation':
+            return 200, headers, json.dumps(deleted, ensure_ascii=False).encode('utf-8')
+        return 204, headers, b''
+    
+    @staticmethod
+    def _database_error(error: BaseException) -> BaseException:
+        """SQLite 예외를 PostgreSQL 오류 코드의 PostgREST 응답으로 변환"""
+        if isinstance(error, PostgrestError) or not isinstance(error, Exception):
+            return error
+        
+        message = str(error)
+        if 'UNIQUE constraint failed' in message:
+            return PostgrestError(409, '23505', 'duplicate key value violates unique constraint', message)
+        if 'NOT NULL constraint failed' in message:
+            return PostgrestError(400, '23502', 'null value violates not-null constraint', message)
+        if isinstance(error, (sqlite3.InterfaceError, sqlite3.ProgrammingError, KeyError, TypeError)):
+            return PostgrestError(400, '22P02', 'invalid input syntax', message)
+        return PostgrestError(500, 'XX000', message)
+
+class _Handler(BaseHTTPRequestHandler):
+    """HTTP 요청을 FakePostgrest로 전달 (keep-alive 유지)"""
+    
+    protocol_version = 'HTTP/1.1'
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def _dispatch(self):
+        fake: FakePostgrest = self.server.fake
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        
+        with fake._lock:
+            fake.requests[self.command] += 1
+            fake.in_flight += 1
+            fake.max_in_flight = max(fake.max_in_flight, fake.in_flight)
+        
+        try:
+            delay, error = fake._next_error()
+            if delay:
+                time.sleep(delay)
+            if error:
+                with fake._lock:
+                    fake.injected_errors[error] += 1
+            
+            if error == 'reset':
+                self.close_connection = True
+                return
+            if error == 'unavailable':
+                self._send(503, {}, json.dumps({
+                    'code': 'PGRST000', 'message': 'Could not connect with the database', 'details': None, 'hint': None
+                }).encode('utf-8'))
+                return
+            if error == 'gateway':
+                self._send(502, {}, b'<html><body>502 Bad Gateway</body></html>', 'text/html')
+                return
+            
+            try:
+                status, headers, payload = fake.handle(self.command, self.path, {
+                    key.lower(): value for key, value in self.headers.items()
+                }, body)
+            except PostgrestError as e:
+                status, headers, payload = e.status, {}, json.dumps(e.body, ensure_ascii=False).encode('utf-8')
+            
+            if error == 'reset_after':
+                self.close_connection = True
+                return
+            self._send(status, headers, payload)
+        finally:
+            with fake._lock:
+                fake.in_flight -= 1
+    
+    def _send(self, status: int, headers: Dict[str, str], payload: bytes, content_type: str = 'application/json'):
+        self.send_response(status)
+        self.send_header('Content-Type', f"{content_type}; charset=utf-8")
+        self.send_header('Content-Length', str(len(payload)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        if payload and self.command != 'HEAD':
+            self.wfile.write(payload)
+    
+    do_GET = do_HEAD = do_POST = do_DELETE = _dispatch
+
+def main() -> int:
+    """명령행 진입점 (단독 서버 실행)"""
+    parser = argparse.ArgumentParser(description='로컬 PostgREST 대역 서버')
+    parser.add_argument('--db', default=':memory:', help='SQLite 파일 경로')
+    parser.add_argument('--port', type=int, default=54321)
+    parser.add_argument('--latency', type=float, default=0.0, help='요청당 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='추가 무작위 지연 최대값 (초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='오류 주입 비율')
+    parser.add_argument('--error-mode', choices=ERROR_MODES, default='unavailable')
+    args = parser.parse_args()
+    
+    server = FakePostgrest(args.db, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                           error_mode=args.error_mode, port=args.port).start()
+    print(f"SUPABASE_URL={server.url} SUPABASE_KEY={FAKE_KEY}")
+    try:
+        while True:
+            time.sleep(10)
+            print(json.dumps(server.stats(), ensure_ascii=False))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
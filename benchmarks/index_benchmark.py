@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+지문 인덱스 벤치마크
+합성 레코드로 mmap 지문 인덱스를 만들고 열기 시간, 지문 조회(있음/없음), 대학/날짜 범위 조회 지연과
+실행 한 번 분량(마지막 확인 날짜 갱신 + 새 공지사항)의 델타 저장 시간을 측정
+
+사용법:
+    python benchmarks/index_benchmark.py [--entries 2000000] [--lookups 100000] [--output results.json]
+"""
+
+import sys
+import json
+import time
+import random
+import shutil
+import hashlib
+import logging
+import argparse
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.fingerprint_index import FingerprintIndex
+
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+
+UNIVERSITY_COUNT = 400
+RANGE_QUERIES = 1000
+# 실행 한 번에 마지막 확인 날짜가 바뀌는 공지사항 수와 새 공지사항 수
+RUN_REFRESHES = 10000
+RUN_NEW = 500
+
+def main() -> int:
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(description='지문 인덱스 벤치마크')
+    parser.add_argument('--entries', type=int, default=2000000, help='인덱스 레코드 수')
+    parser.add_argument('--lookups', type=int, default=100000, help='조회 횟수')
+    parser.add_argument('--output', help='결과 JSON 경로')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    rng = random.Random(1)
+    directory = tempfile.mkdtemp(prefix='index_bench_')
+    try:
+        index = FingerprintIndex(directory)
+        names = [f"대학 {i}" for i in range(UNIVERSITY_COUNT)]
+        fingerprints = [hashlib.sha256(str(i).encode()).digest() for i in range(args.entries)]
+        
+        started = time.perf_counter()
+        for i, fingerprint in enumerate(fingerprints):
+            index.put((fingerprint, index.university_id(names[i % UNIVERSITY_COUNT]),
+                       20200101 + (i % 12) * 100 + i % 28, i + 1, 20250101, 20250101, i // 100 * 4096))
+        index.merge(args.entries + 1, 0)
+        build_seconds = time.perf_counter() - started
+        index.close()
+        
+        started = time.perf_counter()
+        index = FingerprintIndex(directory)
+        index.open()
+        open_ms = (time.perf_counter() - started) * 1000
+        
+        present = [fingerprints[rng.randrange(args.entries)].hex() for _ in range(args.lookups)]
+        absent = [hashlib.sha256(f"absent {i}".encode()).hexdigest() for i in range(args.lookups)]
+        
+        started = time.perf_counter()
+        found = sum(1 for fingerprint in present if fingerprint in index)
+        hit_us = (time.perf_counter() - started) / args.lookups * 1e6
+        
+        started = time.perf_counter()
+        found_absent = sum(1 for fingerprint in absent if fingerprint in index)
+        miss_us = (time.perf_counter() - started) / args.lookups * 1e6
+        
+        started = time.perf_counter()
+        ranged = sum(len(list(index.range(names[i % UNIVERSITY_COUNT], '2020-03-01', '2020-04-30'))) for i in range(RANGE_QUERIES))
+        range_ms = (time.perf_counter() - started) * 1000 / RANGE_QUERIES
+        
+        # 실행 한 번 분량의 갱신과 새 레코드를 델타 파일에 추가 (기본 인덱스는 다시 쓰지 않음)
+        started = time.perf_counter()
+        for fingerprint in rng.sample(fingerprints, min(RUN_REFRESHES, args.entries)):
+            entry = index.get(fingerprint)
+            index.put(entry[:5] + (20250102,) + entry[6:])
+        for i in range(RUN_NEW):
+            index.put((hashlib.sha256(f"new {i}".encode()).digest(), index.university_id(names[i % UNIVERSITY_COUNT]),
+                       20250102, args.entries + 1 + i, 20250102, 20250102, 0))
+        index.save(args.entries + RUN_NEW + 1, 0)
+        delta_save_ms = (time.perf_counter() - started) * 1000
+        
+        size_bytes = index.stats()['size_bytes']
+        index.close()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    
+    if found != args.lookups or found_absent:
+        print(f"조회 결과 오류: 있음 {found}/{args.lookups}, 없음 오탐 {found_absent}")
+        return 1
+    
+    results = {
+        'timestamp': datetime.now().isoformat(),
+        'entries': args.entries,
+        'size_bytes': size_bytes,
+        'build_seconds': round(build_seconds, 3),
+        'open_ms': round(open_ms, 3),
+        'lookup_hit_us': round(hit_us, 2),
+        'lookup_miss_us': round(miss_us, 2),
+        'range_ms': round(range_ms, 3),
+        'range_rows_per_query': ranged // RANGE_QUERIES,
+        'delta_save_ms': round(delta_save_ms, 3)
+    }
+    print(f"레코드 {args.entries}개 ({size_bytes / 1024 / 1024:.1f}MB), 생성 {build_seconds:.1f}s, 열기 {open_ms:.2f}ms")
+    print(f"지문 조회: 있음 {hit_us:.1f}us, 없음 {miss_us:.1f}us / 범위 조회 {range_ms:.2f}ms ({ranged // RANGE_QUERIES}개)")
+    print(f"델타 저장 (갱신 {RUN_REFRESHES}개, 새 레코드 {RUN_NEW}개): {delta_save_ms:.1f}ms")
+    
+    output = Path(args.output) if args.output else RESULTS_DIR / f"index_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+추출 핫패스 마이크로벤치마크
+고정된 게시판 HTML 코퍼스로 패턴 감지, 템플릿 매칭, 추출기, 날짜/텍스트 정제 성능을 측정
+
+사용법:
+    python benchmarks/run_benchmarks.py run [--filter detect] [--output results.json]
+    python benchmarks/run_benchmarks.py compare base.json new.json [--threshold 0.2]
+"""
+
+import os
+import sys
+import json
+import copy
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from bs4 import BeautifulSoup
+
+from src.crawler import SmartCrawler
+from src.patterns import PatternDetector
+from src.templates import TemplateManager
+from src.keywords import KeywordMatcher
+from src.utils import load_config, clean_text, parse_date, is_notice_relevant
+
+CORPUS_DIR = Path(__file__).resolve().parent / 'corpus'
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+
+# parse_date 입력 샘플 (게시판에서 실제로 나타나는 형식)
+DATE_SAMPLES = [
+    '2025-06-17', '2025.06.17', '2025/6/7', '25.06.17', '25-6-7',
+    '2025년 6월 17일', '6월 17일', '06-17', '2025. 5. 29.', '등록일 2025-06-17 14:20',
+    '작성일: 25/06/17', '조회 1234', '', '공지'
+]
+
+def measure(func: Callable[[], Any], repeat: int = 5, min_time: float = 0.05) -> Dict[str, float]:
+    """함수 1회 호출당 소요 시간 측정 (초)"""
+    # 한 번의 측정이 min_time 이상 걸리도록 반복 횟수 보정
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or number >= 100000:
+            break
+        number *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+    
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - started) / number)
+    
+    return {
+        'number': number,
+        'best': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.fmean(timings)
+    }
+
+def load_corpus() -> List[Tuple[str, Dict, str]]:
+    """코퍼스 목록 (파일명, 메타데이터, HTML) 로드"""
+    with open(CORPUS_DIR / 'manifest.json', 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    
+    corpus = []
+    for file_name, meta in manifest.items():
+        html = (CORPUS_DIR / file_name).read_text(encoding='utf-8')
+        corpus.append((file_name, meta, html))
+    return corpus
+
+def build_cases(config: Dict[str, Any]) -> List[Tuple[str, Callable[[], Any]]]:
+    """벤치마크 케이스 목록 생성"""
+    detector = PatternDetector(config)
+    template_manager = TemplateManager(str(project_root / 'data' / 'templates.json'))
+    crawler = SmartCrawler(config)
+    crawler.template_manager = template_manager
+    
+    cases: List[Tuple[str, Callable[[], Any]]] = []
+    titles: List[str] = []
+    
+    for file_name, meta, html in load_corpus():
+        url = meta['url']
+        soup = BeautifulSoup(html, 'lxml')
+        titles.extend(a.get_text() for a in soup.select('a'))
+        
+        cases.append((f"parse[{file_name}]", lambda html=html: BeautifulSoup(html, 'lxml')))
+        cases.append((f"detect_notice_structure[{file_name}]", lambda soup=soup: detector.detect_notice_structure(soup)))
+        cases.append((f"match_template[{file_name}]", lambda soup=soup, url=url: template_manager.match_template(soup, url)))
+        
+        for system_name, system in template_manager.system_templates.items():
+            selectors = system['selectors']
+            cases.append((
+                f"_validate_template[{file_name}:{system_name}]",
+                lambda soup=soup, selectors=selectors: template_manager._validate_template(soup, selectors)
+            ))
+        
+        # 추출기는 실제 크롤링과 같은 입력(매칭된 템플릿, 감지된 구조)으로 측정
+        template_result = template_manager.match_template(soup, url)
+        if template_result['matched']:
+            template = template_result['template']
+            cases.append((
+                f"_crawl_with_template[{file_name}]",
+                lambda soup=soup, template=template, url=url: crawler._crawl_with_template(soup, template, url)
+            ))
+        
+        auto_result = detector.detect_notice_structure(soup)
+        if auto_result['structure']:
+            structure = auto_result['structure']
+            cases.append((
+                f"_extract_notices_from_structure[{file_name}]",
+                lambda soup=soup, structure=structure, url=url: crawler._extract_notices_from_structure(soup, structure, url)
+            ))
+        
+        cases.append((
+            f"_try_custom_selectors[{file_name}]",
+            lambda soup=soup, url=url: crawler._try_custom_selectors(soup, url, 'benchmark')
+        ))
+    
+    cases.append(('parse_date[samples]', lambda: [parse_date(sample) for sample in DATE_SAMPLES]))
+    cases.append(('clean_text[titles]', lambda: [clean_text(title) for title in titles]))
+    
+    keyword_matcher = KeywordMatcher.from_config(config.get('keywords'))
+    cases.append(('is_notice_relevant[titles]', lambda: [is_notice_relevant(title) for title in titles]))
+    cases.append(('KeywordMatcher.tag_many[titles]', lambda: keyword_matcher.tag_many(titles)))
+    
+    return cases
+
+def benchmark_config() -> Dict[str, Any]:
+    """부수 효과(라우팅 파일 기록, 계측)를 끈 설정 반환"""
+    config = copy.deepcopy(load_config(str(project_root / 'config.json')))
+    config.setdefault('instrumentation', {})['enabled'] = False
+    config.setdefault('tracing', {})['enabled'] = False
+    config.setdefault('routing', {})['enabled'] = False
+    return config
+
+def current_commit() -> str:
+    """현재 git 커밋 해시 반환"""
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=project_root, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except Exception:
+        return 'unknown'
+
+def run(args) -> int:
+    """벤치마크 실행 후 JSON 저장"""
+    os.chdir(project_root)
+    commit = current_commit()
+    results = {
+        'meta': {
+            'commit': commit,
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat
+        },
+        'benchmarks': {}
+    }
+    
+    for name, func in build_cases(benchmark_config()):
+        if args.filter and args.filter not in name:
+            continue
+        stats = measure(func, repeat=args.repeat)
+        results['benchmarks'][name] = stats
+        print(f"{name:<70} {stats['median'] * 1e6:>12.1f} µs")
+    
+    output = Path(args.output) if args.output else RESULTS_DIR / f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    
+    print(f"\n결과 저장: {output}")
+    return 0
+
+def compare(args) -> int:
+    """두 결과 파일 비교 후 임계값을 넘는 회귀 표시"""
+    with open(args.base, 'r', encoding='utf-8') as f:
+        base = json.load(f)
+    with open(args.new, 'r', encoding='utf-8') as f:
+        new = json.load(f)
+    
+    print(f"기준: {base['meta']['commit']}  비교: {new['meta']['commit']}  임계값: {args.threshold:.0%}\n")
+    
+    regressions = []
+    for name, new_stats in new['benchmarks'].items():
+        base_stats = base['benchmarks'].get(name)
+        if not base_stats or base_stats['median'] <= 0:
+            continue
+        
+        ratio = new_stats['median'] / base_stats['median']
+        flag = ''
+        if ratio > 1 + args.threshold:
+            flag = '  << 회귀'
+            regressions.append({'name': name, 'ratio': round(ratio, 3)})
+        elif ratio < 1 - args.threshold:
+            flag = '  개선'
+        
+        print(f"{name:<70} {base_stats['median'] * 1e6:>10.1f} → {new_stats['median'] * 1e6:>10.1f} µs  x{ratio:.2f}{flag}")
+    
+    if args.json:
+        print(json.dumps({'regressions': regressions}, ensure_ascii=False))
+    
+    if regressions:
+        print(f"\n회귀 {len(regressions)}건 발견")
+        return 1
+    
+    print("\n회귀 없음")
+    return 0
+
+def main() -> int:
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(description='추출 핫패스 마이크로벤치마크')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    run_parser = subparsers.add_parser('run', help='벤치마크 실행')
+    run_parser.add_argument('--repeat', type=int, default=5, help='측정 반복 횟수')
+    run_parser.add_argument('--filter', help='이름에 이 문자열이 포함된 케이스만 실행')
+    run_parser.add_argument('--output', help='결과 JSON 경로')
+    run_parser.set_defaults(func=run)
+    
+    compare_parser = subparsers.add_parser('compare', help='두 결과 비교')
+    compare_parser.add_argument('base', help='기준 결과 JSON')
+    compare_parser.add_argument('new', help='비교할 결과 JSON')
+    compare_parser.add_argument('--threshold', type=float, default=0.2, help='회귀로 판단할 중앙값 증가 비율')
+    compare_parser.add_argument('--json', action='store_true', help='회귀 목록을 JSON으로도 출력')
+    compare_parser.set_defaults(func=compare)
+    
+    args = parser.parse_args()
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
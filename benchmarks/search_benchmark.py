@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+검색 인덱스 벤치마크
+입시 공지사항 어휘로 만든 합성 제목을 여러 세그먼트로 색인하고 검색어별 지연(필터 포함)과 인덱스 크기를 측정
+
+사용법:
+    python benchmarks/search_benchmark.py [--documents 500000] [--segments 8] [--output results.json]
+"""
+
+import sys
+import json
+import time
+import random
+import shutil
+import logging
+import argparse
+import tempfile
+import statistics
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.search_index import NoticeSearchIndex
+
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+
+UNIVERSITY_COUNT = 300
+
+WORDS = [
+    '2026학년도', '2025학년도', '수시모집', '정시모집', '편입학', '추가합격자', '합격자', '발표', '안내', '재외국민',
+    '특별전형', '등록금', '납부', '기숙사', '면접', '일정', '변경', '서류', '제출', '모집요강', '장학금', '신청',
+    '학생부종합전형', '논술전형', '실기고사', '충원', '예비번호', '결과', '공고', '입학설명회', '온라인', '접수',
+    '마감', '연장', '정정', '고사장', '수험표', '출력', '전형료', '환불', 'SW특기자', '외국인', '학부모', '설명회'
+]
+
+QUERIES = [
+    ('수시', {}),
+    ('추가합격', {}),
+    ('편입 OR 추가합격', {}),
+    ('수시 면접 -재외국민', {}),
+    ('"등록금 납부"', {}),
+    ('수시', {'university_name': '대학 7'}),
+    ('합격자 발표', {'since': '2024-03-01', 'until': '2024-12-31'}),
+]
+
+def make_documents(count: int):
+    """합성 아카이브 레코드 (여러 해에 걸친 공지 날짜)"""
+    rng = random.Random(1)
+    start = date(2020, 1, 1)
+    for i in range(1, count + 1):
+        yield {
+            'id': i,
+            'university_name': f"대학 {rng.randrange(UNIVERSITY_COUNT)}",
+            'notice_title': ' '.join(rng.sample(WORDS, rng.randint(3, 7))),
+            'notice_date': (start + timedelta(days=i * 2000 // count)).isoformat()
+        }
+
+def main() -> int:
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(description='검색 인덱스 벤치마크')
+    parser.add_argument('--documents', type=int, default=500000, help='공지사항 수')
+    parser.add_argument('--segments', type=int, default=8, help='나눠 추가할 세그먼트 수 (실행 횟수 대신)')
+    parser.add_argument('--repeat', type=int, default=5, help='검색어별 반복 횟수')
+    parser.add_argument('--output', help='결과 JSON 경로')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING)
+    directory = tempfile.mkdtemp(prefix='search_bench_')
+    try:
+        index = NoticeSearchIndex(directory, max_segments=args.segments)
+        per_segment = -(-args.documents // args.segments)
+        started = time.perf_counter()
+        for i, document in enumerate(make_documents(args.documents), 1):
+            index.add(document)
+            if i % per_segment == 0:
+                index.flush()
+        index.flush()
+        build_seconds = time.perf_counter() - started
+        index.close()
+        
+        started = time.perf_counter()
+        index = NoticeSearchIndex(directory)
+        index.open()
+        open_ms = (time.perf_counter() - started) * 1000
+        
+        queries = []
+        for query, filters in QUERIES:
+            timings = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                hits = index.search(query, limit=20, **filters)
+                timings.append((time.perf_counter() - started) * 1000)
+            queries.append({'query': query, 'filters': filters, 'hits': len(hits), 'median_ms': round(statistics.median(timings), 2)})
+            print(f"{query:<24} {json.dumps(filters, ensure_ascii=False):<48} {statistics.median(timings):>8.2f}ms")
+        
+        stats = index.stats()
+        index.close()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    
+    results = {
+        'timestamp': datetime.now().isoformat(),
+        'documents': args.documents,
+        'build_seconds': round(build_seconds, 3),
+        'open_ms': round(open_ms, 3),
+        'index': stats,
+        'queries': queries
+    }
+    print(f"공지사항 {args.documents}개, 생성 {build_seconds:.1f}s, 열기 {open_ms:.2f}ms, "
+          f"세그먼트 {stats['segments']}개, {stats['size_bytes'] / 1024 / 1024:.1f}MB")
+    
+    output = Path(args.output) if args.output else RESULTS_DIR / f"search_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,7 +9,7 @@ import json
 import logging
 import asyncio
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Union
 import sys
 from pathlib import Path
 
@@ -18,7 +18,14 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from src.crawler import SmartCrawler
-from src.database import SupabaseManager
+from src.storage import create_storage
+from src.metrics import MetricsExporter
+from src.profiling import CrawlProfiler
+from src.runlog import RunLog, RunSummary
+from src.write_buffer import NoticeWriteBuffer
+from src.spool import WriteSpool
+from src.seenset import SeenSet
+from src.archive import NoticeArchive
 from src.utils import setup_logging, load_config
 
 def main():
@@ -48,20 +55,51 @@ def main():
         
         logger.info(f"처리할 대학 수: {len(batch_universities)}")
         
-        # 데이터베이스 매니저 초기화
-        db_manager = SupabaseManager(
-            url=os.getenv('SUPABASE_URL'),
-            key=os.getenv('SUPABASE_KEY')
-        )
-        
         # 크롤러 초기화
         crawler = SmartCrawler(config)
         
-        # 크롤링 실행
-        results = run_crawling(crawler, batch_universities, db_manager)
+        # 저장소 초기화 (database.backend 설정, 크롤러와 단계별 계측 공유)
+        db_manager = create_storage(config, crawler.stage_timer)
+        
+        # 지표 내보내기 (METRICS_PORT 지정 시 실행 중 HTTP로 노출)
+        metrics_config = config.get('metrics', {})
+        exporter = MetricsExporter(crawler, db_manager)
+        if metrics_config.get('port'):
+            exporter.serve(int(metrics_config['port']), metrics_config.get('host', '127.0.0.1'))
+        
+        # 프로파일러 (PROFILE_UNIVERSITIES, PROFILE_RUN 지정 시에만 동작)
+        profiler = CrawlProfiler(config.get('profiling'))
+        
+        # 크롤링 실행 (대학별 결과와 공지사항을 NDJSON 실행 로그에 즉시 기록)
+        run_log = RunLog(config.get('run_log'))
+        
+        # 이미 저장된 공지사항 지문 (파일이 없으면 DB에서 채움)
+        seen_set = SeenSet(config.get('seen_set'))
+        seen_set.load(db_manager)
+        
+        # 쓰기 경로: 로컬 저널에 먼저 기록하는 스풀 (비활성화 시 메모리 버퍼)
+        spool_config = config.get('spool', {})
+        if spool_config.get('enabled', True):
+            write_buffer = WriteSpool(db_manager, spool_config, seen_set)
+        else:
+            write_buffer = NoticeWriteBuffer(db_manager, config.get('database'), seen_set)
+        
+        # 공지사항 아카이브 (처음 본 공지사항만 압축 로그에 추가)
+        archive = NoticeArchive(config.get('archive'))
+        archive.load()
+        
+        with profiler.profile_run():
+            results = run_crawling(crawler, batch_universities, write_buffer, profiler, run_log, archive)
+        
+        seen_set.save()
+        db_manager.close()
+        results['seen_set'] = seen_set.stats()
+        results['writes'] = write_buffer.stats()
+        results['profiles'] = profiler.profiles
         
         # 결과 리포트 생성
         generate_report(results, batch_universities)
+        exporter.write_textfile(metrics_config.get('textfile_path', 'logs/crawler.prom'))
         
         logger.info("크롤링 완료")
         
@@ -69,20 +107,11 @@ def main():
         logger.error(f"크롤링 중 오류 발생: {str(e)}", exc_info=True)
         sys.exit(1)
 
-def run_crawling(crawler: SmartCrawler, universities: List[Dict], db_manager: SupabaseManager) -> Dict[str, Any]:
-    """크롤링 실행"""
+def crawl_stream(crawler: SmartCrawler, universities: List[Dict], write_buffer: Union[WriteSpool, NoticeWriteBuffer],
+                 profiler: CrawlProfiler = None) -> Iterator[Dict[str, Any]]:
+    """대학별로 공지사항 레코드와 결과 레코드, 버퍼 저장 시 저장 레코드를 생성되는 즉시 반환"""
     logger = logging.getLogger(__name__)
-    
-    results = {
-        'total': len(universities),
-        'success': 0,
-        'failed': 0,
-        'auto_detect': 0,
-        'template': 0,
-        'custom': 0,
-        'failed_universities': [],
-        'notices_count': 0
-    }
+    profiler = profiler or CrawlProfiler()
     
     for i, university in enumerate(universities, 1):
         univ_name = university['name']
@@ -90,44 +119,102 @@ def run_crawling(crawler: SmartCrawler, universities: List[Dict], db_manager: Su
         
         logger.info(f"[{i}/{len(universities)}] {univ_name} 크롤링 시작")
         
+        outcome = {
+            'type': 'outcome',
+            'university': univ_name,
+            'code': university.get('code'),
+            'url': univ_url,
+            'success': False,
+            'method': None,
+            'notices': 0,
+            'saved': 0,
+            'error': None
+        }
+        notices = []
+        flushed = {}
+        
         try:
-            # 크롤링 실행
-            crawl_result = crawler.crawl_university(univ_url, univ_name)
-            
-            if crawl_result['success']:
-                notices = crawl_result['notices']
-                method = crawl_result['method']
+            # 대학 단위 부모 스팬 (크롤링부터 DB 저장까지)
+            with crawler.stage_timer.span('university', univ_name, url=univ_url) as span:
+                # 크롤링 실행
+                with profiler.profile_university(univ_name):
+                    crawl_result = crawler.crawl_university(univ_url, univ_name)
+                span.set('method', crawl_result['method'])
+                span.set('rows', len(crawl_result['notices']))
                 
-                # 데이터베이스에 저장
-                if notices:
-                    saved_count = db_manager.save_notices(notices, univ_name)
-                    logger.info(f"{univ_name}: {saved_count}개 공지사항 저장 완료 (방법: {method})")
+                if crawl_result['success']:
+                    notices = crawl_result['notices']
+                    method = crawl_result['method']
+                    outcome.update(success=True, method=method, notices=len(notices))
+                    
+                    # 쓰기 버퍼에 추가 (기준을 넘으면 여러 대학분을 한 번에 저장)
+                    if notices:
+                        flushed = write_buffer.add(notices, univ_name)
+                        logger.info(f"{univ_name}: {len(notices)}개 공지사항 저장 대기 (방법: {method})")
+                        span.set('queued', len(notices))
+                    else:
+                        logger.warning(f"{univ_name}: 공지사항을 찾을 수 없음")
                     
-                    results['notices_count'] += saved_count
-                    results[method] += 1
                 else:
-                    logger.warning(f"{univ_name}: 공지사항을 찾을 수 없음")
-                
-                results['success'] += 1
-                
-            else:
-                error_msg = crawl_result.get('error', '알 수 없는 오류')
-                logger.error(f"{univ_name} 크롤링 실패: {error_msg}")
-                results['failed'] += 1
-                results['failed_universities'].append({
-                    'name': univ_name,
-                    'url': univ_url,
-                    'error': error_msg
-                })
+                    error_msg = crawl_result.get('error', '알 수 없는 오류')
+                    logger.error(f"{univ_name} 크롤링 실패: {error_msg}")
+                    span.set('error', error_msg)
+                    outcome['error'] = error_msg
                 
         except Exception as e:
             logger.error(f"{univ_name} 크롤링 중 예외 발생: {str(e)}", exc_info=True)
-            results['failed'] += 1
-            results['failed_universities'].append({
-                'name': univ_name,
-                'url': univ_url,
-                'error': str(e)
-            })
+            outcome['error'] = str(e)
+        
+        for notice in notices:
+            yield {'type': 'notice', 'university': univ_name, 'code': outcome['code'], **notice}
+        yield outcome
+        yield from _saved_records(flushed)
+    
+    # 남은 행 최종 저장
+    yield from _saved_records(write_buffer.close())
+
+def _saved_records(flushed: Dict[str, int]) -> Iterator[Dict[str, Any]]:
+    """버퍼 저장 결과를 대학별 저장 레코드로 변환"""
+    logger = logging.getLogger(__name__)
+    for univ_name, saved_count in flushed.items():
+        logger.info(f"{univ_name}: {saved_count}개 공지사항 저장 완료")
+        yield {'type': 'saved', 'university': univ_name, 'saved': saved_count}
+
+def run_crawling(crawler: SmartCrawler, universities: List[Dict], write_buffer: Union[WriteSpool, NoticeWriteBuffer],
+                 profiler: CrawlProfiler = None, run_log: RunLog = None,
+                 archive: NoticeArchive = None) -> Dict[str, Any]:
+    """크롤링 실행"""
+    run_log = run_log or RunLog({'enabled': False})
+    archive = archive or NoticeArchive({'enabled': False})
+    summary = RunSummary(len(universities))
+    
+    # 레코드를 하나씩 기록하고 요약에 반영하므로 배치 크기와 무관하게 메모리 사용량 일정
+    try:
+        for record in crawl_stream(crawler, universities, write_buffer, profiler):
+            run_log.write(record)
+            summary.add(record)
+            if record['type'] == 'notice':
+                archive.add(record['university'], record, code=record['code'])
+            elif record['type'] == 'outcome' and record['success']:
+                archive.mark_crawled(record['university'], code=record['code'])
+    finally:
+        run_log_file = run_log.close()
+        archive_stats = archive.flush()
+    
+    results = summary.to_results()
+    results['run_log'] = run_log_file
+    results['archive'] = archive_stats
+    
+    results['selenium_render_times'] = crawler.get_render_times()
+    results['stage_latency'] = crawler.stage_timer.summary()
+    results['memory_peaks'] = crawler.memory_tracker.summary()
+    crawler.memory_tracker.close()
+    
+    results['trace_file'] = crawler.tracer.close()
+    
+    # 대학별 전략 라우팅 테이블 저장
+    crawler.router.save_routes()
+    results['routes'] = crawler.router.get_route_stats()
     
     return results
 
@@ -152,11 +239,24 @@ def generate_report(results: Dict[str, Any], universities: List[Dict]):
             '성공률': f"{(results['success'] / results['total'] * 100):.1f}%" if results['total'] > 0 else "0%",
             '총 공지사항 수': results['notices_count']
         },
+        'saved_by_university': results.get('saved_by_university', {}),
         'methods': {
             '자동 감지': results['auto_detect'],
             '템플릿 사용': results['template'],
-            '수동 설정': results['custom']
+            '수동 설정': results['custom'],
+            'XHR': results['xhr'],
+            'Selenium': results['selenium']
         },
+        'routes': results['routes'],
+        'selenium_render_times': results['selenium_render_times'],
+        'stage_latency': results['stage_latency'],
+        'memory_peaks': results['memory_peaks'],
+        'seen_set': results.get('seen_set'),
+        'writes': results.get('writes'),
+        'profiles': results.get('profiles', []),
+        'trace_file': results.get('trace_file'),
+        'run_log': results.get('run_log'),
+        'archive': results.get('archive'),
         'failed_universities': results['failed_universities']
     }
     
@@ -177,6 +277,8 @@ def generate_report(results: Dict[str, Any], universities: List[Dict]):
     logger.info(f"자동 감지: {results['auto_detect']}개")
     logger.info(f"템플릿: {results['template']}개")
     logger.info(f"수동 설정: {results['custom']}개")
+    logger.info(f"XHR: {results['xhr']}개")
+    logger.info(f"Selenium: {results['selenium']}개")
     
     if results['failed_universities']:
         logger.info("-" * 30)
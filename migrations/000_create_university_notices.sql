@@ -0,0 +1,16 @@
+-- 공지사항 기본 테이블
+-- 새 프로젝트에서 처음 실행 (기존 테이블이 있으면 변경 없음)
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS university_notices (
+    id BIGSERIAL PRIMARY KEY,
+    university_name VARCHAR(100) NOT NULL,
+    notice_date DATE,
+    notice_title TEXT NOT NULL,
+    notice_link TEXT,
+    crawled_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+COMMIT;
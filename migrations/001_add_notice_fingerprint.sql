@@ -0,0 +1,27 @@
+-- 공지사항 고유 지문 컬럼 추가
+-- fingerprint = sha256(university_name || chr(31) || notice_title) hex
+-- (src/utils.py notice_fingerprint와 동일한 식)
+
+CREATE EXTENSION IF NOT EXISTS pgcrypto;
+
+BEGIN;
+
+ALTER TABLE university_notices ADD COLUMN IF NOT EXISTS fingerprint CHAR(64);
+
+-- 기존 행 지문 채우기
+UPDATE university_notices
+SET fingerprint = encode(digest(university_name || chr(31) || notice_title, 'sha256'), 'hex')
+WHERE fingerprint IS NULL;
+
+-- 기존 중복 행 정리 (가장 먼저 저장된 행만 유지)
+DELETE FROM university_notices a
+USING university_notices b
+WHERE a.fingerprint = b.fingerprint
+  AND a.id > b.id;
+
+ALTER TABLE university_notices ALTER COLUMN fingerprint SET NOT NULL;
+
+-- upsert(on_conflict=fingerprint)의 충돌 대상
+CREATE UNIQUE INDEX IF NOT EXISTS idx_notice_fingerprint ON university_notices(fingerprint);
+
+COMMIT;
@@ -0,0 +1,78 @@
+-- 대학별 공지사항 통계 테이블
+-- 삽입/삭제 트리거로 유지하여 get_university_stats, get_all_university_stats가 한 행 조회로 끝나도록 함
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS university_notice_stats (
+    university_name VARCHAR(100) PRIMARY KEY,
+    total_notices BIGINT NOT NULL DEFAULT 0,
+    latest_crawl TIMESTAMP WITH TIME ZONE,
+    latest_notice_date DATE,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- 통계 테이블 미적용 시 대체 조회(정렬된 단일 행)용 인덱스
+CREATE INDEX IF NOT EXISTS idx_university_crawled_at ON university_notices(university_name, crawled_at DESC);
+
+-- 삽입: 문장 단위로 대학별 증분 반영
+CREATE OR REPLACE FUNCTION university_notice_stats_on_insert() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO university_notice_stats AS s (university_name, total_notices, latest_crawl, latest_notice_date, updated_at)
+    SELECT university_name, COUNT(*), MAX(crawled_at), MAX(notice_date), NOW()
+    FROM new_rows
+    GROUP BY university_name
+    ON CONFLICT (university_name) DO UPDATE SET
+        total_notices = s.total_notices + EXCLUDED.total_notices,
+        latest_crawl = GREATEST(s.latest_crawl, EXCLUDED.latest_crawl),
+        latest_notice_date = GREATEST(s.latest_notice_date, EXCLUDED.latest_notice_date),
+        updated_at = NOW();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 삭제: 최대값이 바뀔 수 있으므로 영향받은 대학만 다시 집계 (보관 기간 정리 시에만 발생)
+CREATE OR REPLACE FUNCTION university_notice_stats_on_delete() RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE university_notice_stats s
+    SET total_notices = agg.total_notices,
+        latest_crawl = agg.latest_crawl,
+        latest_notice_date = agg.latest_notice_date,
+        updated_at = NOW()
+    FROM (
+        SELECT d.university_name,
+               COUNT(n.id) AS total_notices,
+               MAX(n.crawled_at) AS latest_crawl,
+               MAX(n.notice_date) AS latest_notice_date
+        FROM (SELECT DISTINCT university_name FROM old_rows) d
+        LEFT JOIN university_notices n ON n.university_name = d.university_name
+        GROUP BY d.university_name
+    ) agg
+    WHERE s.university_name = agg.university_name;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_university_notice_stats_insert ON university_notices;
+CREATE TRIGGER trg_university_notice_stats_insert
+    AFTER INSERT ON university_notices
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION university_notice_stats_on_insert();
+
+DROP TRIGGER IF EXISTS trg_university_notice_stats_delete ON university_notices;
+CREATE TRIGGER trg_university_notice_stats_delete
+    AFTER DELETE ON university_notices
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION university_notice_stats_on_delete();
+
+-- 기존 데이터로 초기화
+INSERT INTO university_notice_stats (university_name, total_notices, latest_crawl, latest_notice_date, updated_at)
+SELECT university_name, COUNT(*), MAX(crawled_at), MAX(notice_date), NOW()
+FROM university_notices
+GROUP BY university_name
+ON CONFLICT (university_name) DO UPDATE SET
+    total_notices = EXCLUDED.total_notices,
+    latest_crawl = EXCLUDED.latest_crawl,
+    latest_notice_date = EXCLUDED.latest_notice_date,
+    updated_at = NOW();
+
+COMMIT;
@@ -0,0 +1,37 @@
+-- 크롤러 조회 패턴에 맞춘 인덱스
+--   최근 공지사항/내보내기: WHERE university_name = ? ORDER BY crawled_at DESC, id DESC LIMIT n (커서 조건 포함)
+--   전체 최신순 내보내기:   ORDER BY crawled_at DESC, id DESC LIMIT n
+--   보관 기간 정리:         WHERE crawled_at < cutoff AND id > ? ORDER BY id
+--   통계 대체 조회:         WHERE university_name = ? AND notice_date IS NOT NULL ORDER BY notice_date DESC LIMIT 1
+
+BEGIN;
+
+-- 지문 고유 인덱스를 제약 조건으로 승격 (upsert on_conflict=fingerprint 대상)
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conrelid = 'university_notices'::regclass AND conname = 'uq_notice_fingerprint'
+    ) THEN
+        ALTER TABLE university_notices
+            ADD CONSTRAINT uq_notice_fingerprint UNIQUE USING INDEX idx_notice_fingerprint;
+    END IF;
+END;
+$$;
+
+-- 같은 시각의 행도 id로 순서가 정해지도록 커서 컬럼 전체를 인덱스에 포함
+CREATE INDEX IF NOT EXISTS idx_university_crawled_at_id ON university_notices(university_name, crawled_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_crawled_at_id ON university_notices(crawled_at DESC, id DESC);
+
+-- 최신 공지 날짜 조회 (NULL 날짜는 제외)
+CREATE INDEX IF NOT EXISTS idx_university_notice_date ON university_notices(university_name, notice_date DESC)
+    WHERE notice_date IS NOT NULL;
+
+-- 위 인덱스의 앞부분과 겹치는 인덱스 정리
+DROP INDEX IF EXISTS idx_university_crawled_at;
+DROP INDEX IF EXISTS idx_crawled_at;
+DROP INDEX IF EXISTS idx_university_date;
+
+COMMIT;
+
+ANALYZE university_notices;
@@ -0,0 +1,14 @@
+-- 공지사항 분류 컬럼 추가
+-- categories = src/keywords.py KeywordMatcher가 제목으로 붙인 분류 목록 (config.json keywords.categories, 예: {수시,합격자발표})
+-- 기존 행은 빈 배열로 두고 이후 저장되는 행부터 채움
+
+BEGIN;
+
+ALTER TABLE university_notices ADD COLUMN IF NOT EXISTS categories TEXT[] NOT NULL DEFAULT '{}';
+
+-- 분류별 조회 (?categories=cs.{수시} → categories @> '{수시}')
+CREATE INDEX IF NOT EXISTS idx_notice_categories ON university_notices USING GIN (categories);
+
+COMMIT;
+
+ANALYZE university_notices;
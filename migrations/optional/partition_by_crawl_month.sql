@@ -0,0 +1,134 @@
+-- (선택) university_notices를 crawled_at 기준 월별 파티션 테이블로 전환
+-- 000~004 적용 후, 쓰기를 멈춘 상태에서 실행
+--
+-- 파티션 테이블의 고유 제약에는 파티션 키가 포함되어야 하므로 지문 전역 중복 확인은
+-- university_notice_fingerprints 테이블과 BEFORE INSERT 트리거로 처리
+-- 적용 후 config.json 의 database.partitioned 를 true로 설정 (upsert 대신 insert, 중복 행은 트리거가 제외)
+--
+-- 기존 테이블은 university_notices_unpartitioned 로 남겨 두므로 확인 후 직접 삭제
+-- 이후에는 매월 SELECT create_university_notice_partition(NOW() + INTERVAL '12 months'); 로 파티션을 미리 생성
+
+BEGIN;
+
+-- 지문 전역 고유 테이블
+CREATE TABLE IF NOT EXISTS university_notice_fingerprints (
+    fingerprint CHAR(64) PRIMARY KEY
+);
+
+INSERT INTO university_notice_fingerprints (fingerprint)
+SELECT fingerprint FROM university_notices
+ON CONFLICT DO NOTHING;
+
+-- 기존 테이블과 인덱스 이름 변경 (새 테이블에서 같은 이름 사용)
+ALTER TABLE university_notices RENAME TO university_notices_unpartitioned;
+
+DO $$
+DECLARE
+    r RECORD;
+BEGIN
+    FOR r IN SELECT indexname FROM pg_indexes WHERE tablename = 'university_notices_unpartitioned' LOOP
+        EXECUTE format('ALTER INDEX %I RENAME TO %I', r.indexname, r.indexname || '_unpartitioned');
+    END LOOP;
+END;
+$$;
+
+CREATE TABLE university_notices (
+    id BIGINT NOT NULL DEFAULT nextval('university_notices_id_seq'),
+    university_name VARCHAR(100) NOT NULL,
+    notice_date DATE,
+    notice_title TEXT NOT NULL,
+    notice_link TEXT,
+    fingerprint CHAR(64) NOT NULL,
+    categories TEXT[] NOT NULL DEFAULT '{}',
+    crawled_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (id, crawled_at)
+) PARTITION BY RANGE (crawled_at);
+
+-- 기존 테이블을 삭제해도 id 시퀀스가 남도록 소유 테이블 변경
+ALTER SEQUENCE university_notices_id_seq OWNED BY university_notices.id;
+
+CREATE OR REPLACE FUNCTION create_university_notice_partition(month DATE) RETURNS VOID AS $$
+DECLARE
+    start_month DATE := date_trunc('month', month)::DATE;
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF university_notices FOR VALUES FROM (%L) TO (%L)',
+        'university_notices_' || to_char(start_month, 'YYYYMM'),
+        start_month,
+        (start_month + INTERVAL '1 month')::DATE
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+-- 기존 데이터의 첫 달부터 12개월 뒤까지 파티션 생성 (범위 밖의 행은 기본 파티션)
+SELECT create_university_notice_partition(month::DATE)
+FROM generate_series(
+    date_trunc('month', COALESCE((SELECT MIN(crawled_at) FROM university_notices_unpartitioned), NOW())),
+    date_trunc('month', NOW() + INTERVAL '12 months'),
+    INTERVAL '1 month'
+) AS month;
+
+CREATE TABLE IF NOT EXISTS university_notices_default PARTITION OF university_notices DEFAULT;
+
+-- 003과 같은 조회 패턴용 인덱스 (파티션마다 생성됨)
+CREATE INDEX idx_university_crawled_at_id ON university_notices(university_name, crawled_at DESC, id DESC);
+CREATE INDEX idx_crawled_at_id ON university_notices(crawled_at DESC, id DESC);
+CREATE INDEX idx_university_notice_date ON university_notices(university_name, notice_date DESC)
+    WHERE notice_date IS NOT NULL;
+CREATE INDEX idx_notice_fingerprint ON university_notices(fingerprint);
+CREATE INDEX idx_notice_categories ON university_notices USING GIN (categories);
+
+-- 기존 데이터 복사 (트리거 생성 전이라 통계와 지문 테이블은 그대로)
+INSERT INTO university_notices (id, university_name, notice_date, notice_title, notice_link, fingerprint, categories, crawled_at, created_at)
+SELECT id, university_name, notice_date, notice_title, notice_link, fingerprint, categories, COALESCE(crawled_at, created_at, NOW()), created_at
+FROM university_notices_unpartitioned;
+
+-- 이미 있는 지문의 행은 저장하지 않음 (insert 응답에서도 빠지므로 새로 저장된 행만 반환됨)
+CREATE OR REPLACE FUNCTION university_notices_skip_duplicate() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO university_notice_fingerprints (fingerprint) VALUES (NEW.fingerprint)
+    ON CONFLICT DO NOTHING;
+    IF NOT FOUND THEN
+        RETURN NULL;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 삭제된 공지사항은 다시 저장될 수 있도록 지문도 삭제
+CREATE OR REPLACE FUNCTION university_notices_release_fingerprints() RETURNS TRIGGER AS $$
+BEGIN
+    DELETE FROM university_notice_fingerprints f
+    USING old_rows o
+    WHERE f.fingerprint = o.fingerprint;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_university_notices_skip_duplicate
+    BEFORE INSERT ON university_notices
+    FOR EACH ROW EXECUTE FUNCTION university_notices_skip_duplicate();
+
+CREATE TRIGGER trg_university_notices_release_fingerprints
+    AFTER DELETE ON university_notices
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION university_notices_release_fingerprints();
+
+-- 002의 통계 트리거를 새 테이블로 옮김
+DROP TRIGGER IF EXISTS trg_university_notice_stats_insert ON university_notices_unpartitioned;
+DROP TRIGGER IF EXISTS trg_university_notice_stats_delete ON university_notices_unpartitioned;
+
+CREATE TRIGGER trg_university_notice_stats_insert
+    AFTER INSERT ON university_notices
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION university_notice_stats_on_insert();
+
+CREATE TRIGGER trg_university_notice_stats_delete
+    AFTER DELETE ON university_notices
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION university_notice_stats_on_delete();
+
+COMMIT;
+
+ANALYZE university_notices;
@@ -9,6 +9,8 @@ __description__ = "지능형 대학 공지사항 크롤러"
 
 from .crawler import SmartCrawler
 from .database import SupabaseManager
+from .sqlite_database import SQLiteManager
+from .storage import NoticeStorage, create_storage
 from .patterns import PatternDetector
 from .templates import TemplateManager
 from .utils import (
@@ -23,6 +25,9 @@ from .utils import (
 __all__ = [
     'SmartCrawler',
     'SupabaseManager', 
+    'SQLiteManager',
+    'NoticeStorage',
+    'create_storage',
     'PatternDetector',
     'TemplateManager',
     'setup_logging',
@@ -0,0 +1,562 @@
+"""
+공지사항 아카이브 모듈
+공지사항을 지문 기준으로 한 번만 압축 로그(gzip 멤버를 이어 붙인 NDJSON)에 추가하고
+마지막 확인 날짜가 바뀐 공지사항 id만 확인 로그에 추가 (실행마다 스냅샷 JSON을 새로 만드는 대신 사용)
+공지사항별 처음/마지막 확인 날짜는 mmap 지문 인덱스에서 조회하며, 사이드카 인덱스에는 로그 위치와 대학별 크롤링 성공 날짜만 기록
+"""
+
+import os
+import sys
+import shutil
+import gzip
+import json
+import zlib
+import logging
+import argparse
+from bisect import bisect_right
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterator, Iterable, Tuple
+
+from .utils import notice_fingerprint, university_key, clean_notice_title, parse_date
+from .fingerprint_index import FingerprintIndex, DEFAULT_DELTA_MAX, encode_date, decode_date
+from .search_index import NoticeSearchIndex
+
+LOG_NAME = 'notices.ndjson.gz'
+SEEN_LOG_NAME = 'seen.ndjson.gz'
+INDEX_NAME = 'index.json'
+INDEX_VERSION = 2
+
+def record_key(record: Dict[str, Any]) -> str:
+    """아카이브 레코드의 대학 키"""
+    return university_key(record['university_name'], record.get('code'))
+
+def id_ranges(ids: List[int]) -> List[List[int]]:
+    """정렬된 id 목록 → [처음, 끝] 연속 구간 목록"""
+    ranges: List[List[int]] = []
+    for entry_id in ids:
+        if ranges and entry_id == ranges[-1][1] + 1:
+            ranges[-1][1] = entry_id
+        else:
+            ranges.append([entry_id, entry_id])
+    return ranges
+
+class NoticeArchive:
+    """추가 전용 압축 공지사항 로그, 확인 로그와 사이드카 인덱스"""
+    
+    def __init__(self, config: Dict[str, Any] = None):
+        self.logger = logging.getLogger(__name__)
+        config = config or {}
+        self.enabled = config.get('enabled', True)
+        self.dir = Path(config.get('dir', 'data/archive'))
+        self.log_path = self.dir / LOG_NAME
+        self.seen_log_path = self.dir / SEEN_LOG_NAME
+        self.index_path = self.dir / INDEX_NAME
+        self.compress_level = config.get('compress_level', 9)
+        # 중복 확인과 처음/마지막 확인 날짜 조회용 mmap 지문 인덱스 (로그와 확인 로그로 다시 만들 수 있음)
+        self.fingerprint_index = FingerprintIndex(self.dir, config.get('fingerprint_delta_max', DEFAULT_DELTA_MAX))
+        # 제목 검색용 바이그램 역색인 (실행마다 새 공지사항만 세그먼트로 추가)
+        self.use_search_index = config.get('search_index', True)
+        self.search_index = NoticeSearchIndex(self.dir / 'search', config.get('search_max_segments', 8))
+        
+        self.next_id = 1
+        # [바이트 위치, 길이, 첫 id, 레코드 수] (멤버의 id는 연속)
+        self.members: List[List[int]] = []
+        # 사이드카 인덱스에 기록된 확인 로그 끝 위치
+        self.seen_bytes = 0
+        # 대학 키별 크롤링에 성공한 날짜 (오름차순, 배치 범위 밖이거나 실패한 날은 비교에서 제외하기 위해 사용)
+        self.crawled: Dict[str, List[str]] = {}
+        # 코드로 구분한 대학 키 → 대학 이름
+        self.names: Dict[str, str] = {}
+        # 로그에 추가할 대기 중인 공지사항의 지문 → [id, 마지막 확인 날짜] (None이면 지문 인덱스 준비 전)
+        self._recent: Optional[Dict[str, list]] = None
+        self._pending: List[Dict[str, Any]] = []
+        # 이번 실행에서 마지막 확인 날짜가 바뀐 id → 날짜 (확인 로그에 추가)
+        self._seen: Dict[int, str] = {}
+        self._dirty = False
+        self.added = 0
+        self.refreshed = 0
+    
+    def load(self) -> bool:
+        """인덱스 로드 (인덱스 뒤에 남은 로그는 다시 색인하거나 잘린 부분 제거)"""
+        if not self.enabled:
+            return False
+        
+        try:
+            if self.index_path.exists():
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+                if index.get('version') != INDEX_VERSION:
+                    raise ValueError(f"지원하지 않는 인덱스 버전: {index.get('version')}")
+                
+                self.next_id = index['next_id']
+                self.members = index['members']
+                self.seen_bytes = index['seen_bytes']
+                self.crawled = index['crawled']
+                self.names = index['names']
+            
+            self._recover_tail()
+            self.logger.info(f"아카이브 로드 완료: {self.next_id - 1}개 공지사항, 멤버 {len(self.members)}개")
+            return True
+        
+        except Exception as e:
+            self.logger.error(f"아카이브 로드 실패, 로그에서 인덱스 재구성: {str(e)}")
+            self.next_id, self.members, self.seen_bytes, self.crawled, self.names = 1, [], 0, {}, {}
+            self._recover_tail()
+            return False
+    
+    def _indexed_end(self) -> int:
+        """인덱스에 기록된 로그 끝 위치"""
+        if not self.members:
+            return 0
+        offset, length = self.members[-1][0], self.members[-1][1]
+        return offset + length
+    
+    def _recover_tail(self):
+        """인덱스 저장 전에 중단된 실행의 로그/확인 로그 추가분 처리"""
+        end = self._indexed_end()
+        records, valid_end = self._read_tail(self.log_path, end)
+        if records:
+            self.members.append([end, valid_end - end, records[0]['id'], len(records)])
+            self.next_id = max(self.next_id, records[-1]['id'] + 1)
+            self._dirty = True
+            self.logger.info(f"아카이브 로그 끝부분 {len(records)}개 공지사항 다시 색인")
+        
+        items, valid_end = self._read_tail(self.seen_log_path, self.seen_bytes)
+        if items:
+            self.seen_bytes = valid_end
+            self._dirty = True
+            self.logger.info("확인 로그 끝부분 다시 색인")
+    
+    def _read_tail(self, path: Path, end: int) -> Tuple[List[Dict[str, Any]], int]:
+        """인덱스에 기록된 위치 뒤의 온전한 멤버의 레코드와 그 끝 위치 (기록 중 중단된 멤버는 잘라냄, 해당 내용은 다음 실행에서 다시 기록됨)"""
+        if not path.exists() or path.stat().st_size <= end:
+            return [], end
+        
+        with open(path, 'rb') as f:
+            f.seek(end)
+            tail = f.read()
+        
+        records, position = [], 0
+        while position < len(tail):
+            decompressor = zlib.decompressobj(wbits=31)
+            try:
+                payload = decompressor.decompress(tail[position:])
+                if not decompressor.eof:
+                    raise EOFError("멤버 끝 표시 없음")
+                lines = [json.loads(line) for line in payload.splitlines() if line]
+            except (zlib.error, EOFError, ValueError) as e:
+                self.logger.warning(f"{path.name}의 불완전한 끝부분 제거 ({len(tail) - position}바이트): {str(e)}")
+                with open(path, 'rb+') as f:
+                    f.truncate(end + position)
+                break
+            records.extend(lines)
+            position = len(tail) - len(decompressor.unused_data)
+        return records, end + position
+    
+    def ensure_index(self):
+        """지문 인덱스 열기 (인덱스에 없는 공지사항과 확인 기록만 로그에서 읽어 반영, 인덱스가 없으면 로그 전체로 생성)"""
+        if self._recent is not None:
+            return
+        self._recent = {}
+        
+        index = self.fingerprint_index
+        index.open()
+        covered_next_id, covered_seen_bytes = index.covered_next_id, index.covered_seen_bytes
+        if covered_next_id >= self.next_id and covered_seen_bytes >= self.seen_bytes:
+            return
+        
+        entries = {}
+        unindexed = [member for member in self.members if member[2] + member[3] > covered_next_id]
+        for offset, record in self._iter_member_records(unindexed):
+            if record['id'] >= covered_next_id:
+                entries[record['id']] = index.entry(record, offset)
+        
+        # 이미 인덱스에 있는 공지사항의 확인 기록은 해당 레코드만 읽어 지문으로 찾음
+        seen = self._read_seen(covered_seen_bytes, self.seen_bytes)
+        missing = [entry_id for entry_id in seen if entry_id not in entries]
+        for record in self._read_members(self._members_for(missing)):
+            if record['id'] in seen:
+                entry = index.get(bytes.fromhex(record['fingerprint']))
+                if entry is not None:
+                    entries[record['id']] = entry
+        for entry_id, day in seen.items():
+            entry = entries.get(entry_id)
+            if entry is not None and encode_date(day) > entry[5]:
+                entries[entry_id] = entry[:5] + (encode_date(day),) + entry[6:]
+        
+        for entry in entries.values():
+            index.put(entry)
+        index.save(self.next_id, self.seen_bytes)
+        self.logger.info(f"지문 인덱스에 로그의 공지사항 {len(entries)}개 반영")
+    
+    def _read_seen(self, start: int, end: int) -> Dict[int, str]:
+        """확인 로그 범위의 id → 마지막 확인 날짜"""
+        if end <= start or not self.seen_log_path.exists():
+            return {}
+        
+        with open(self.seen_log_path, 'rb') as f:
+            f.seek(start)
+            data = f.read(end - start)
+        
+        seen: Dict[int, str] = {}
+        for line in gzip.decompress(data).splitlines():
+            if not line:
+                continue
+            item = json.loads(line)
+            for first_id, last_id in item['ids']:
+                for entry_id in range(first_id, last_id + 1):
+                    if item['day'] > seen.get(entry_id, ''):
+                        seen[entry_id] = item['day']
+        return seen
+    
+    def mark_crawled(self, university_name: str, seen_at: str = None, code: str = None):
+        """대학 크롤링 성공 날짜 기록 (공지사항이 없어도 기록)"""
+        if not self.enabled:
+            return
+        
+        day = (seen_at or datetime.now().isoformat(timespec='seconds'))[:10]
+        key = university_key(university_name, code)
+        if key != university_name and self.names.get(key) != university_name:
+            self.names[key] = university_name
+            self._dirty = True
+        days = self.crawled.setdefault(key, [])
+        if not days or (days[-1] != day and day not in days):
+            days.append(day)
+            days.sort()
+            self._dirty = True
+    
+    def crawled_on(self, day: str) -> Optional[set]:
+        """해당 날짜에 크롤링에 성공한 대학 키 (크롤링 날짜 기록 이전 날짜면 None)"""
+        first_days = [days[0] for days in self.crawled.values() if days]
+        if not first_days or day < min(first_days):
+            return None
+        return {key for key, days in self.crawled.items() if day in days}
+    
+    def university_name(self, key: str) -> str:
+        """대학 키 → 대학 이름"""
+        return self.names.get(key, key)
+    
+    def keys(self) -> set:
+        """공지사항이 있거나 크롤링한 적이 있는 모든 대학 키"""
+        self.ensure_index()
+        return set(self.fingerprint_index.universities) | self.crawled.keys() | {record_key(record) for record in self._pending}
+    
+    def keys_for(self, university: str) -> List[str]:
+        """대학 코드나 이름에 해당하는 대학 키 (이름이면 모든 캠퍼스/게시판)"""
+        return [key for key in self.keys() if key == university or self.names.get(key) == university]
+    
+    def add(self, university_name: str, notice: Dict[str, Any], seen_at: str = None, code: str = None) -> bool:
+        """공지사항 확인 기록 (처음 보는 공지사항이면 로그에 추가할 대기 목록에 넣고 True 반환, 지문은 대학 키와 제목)"""
+        if not self.enabled:
+            return False
+        
+        title = clean_notice_title(notice.get('notice_title'))
+        if not title:
+            return False
+        
+        seen_at = seen_at or datetime.now().isoformat(timespec='seconds')
+        day = seen_at[:10]
+        key = university_key(university_name, code)
+        fingerprint = notice_fingerprint(key, title)
+        self.ensure_index()
+        
+        # 이미 있는 공지사항은 지문 인덱스(또는 대기 목록)의 마지막 확인 날짜만 갱신
+        pending = self._recent.get(fingerprint)
+        if pending is not None:
+            if day > pending[1]:
+                pending[1] = self._seen[pending[0]] = day
+                self.refreshed += 1
+            return False
+        
+        entry = self.fingerprint_index.get(bytes.fromhex(fingerprint))
+        if entry is not None:
+            if encode_date(day) > entry[5]:
+                self.fingerprint_index.put(entry[:5] + (encode_date(day),) + entry[6:])
+                self._seen[entry[3]] = day
+                self.refreshed += 1
+            return False
+        
+        record = {
+            'id': self.next_id,
+            'university_name': university_name,
+            'code': code,
+            'notice_title': title,
+            'notice_link': notice.get('notice_link'),
+            'notice_date': notice.get('notice_date'),
+            'fingerprint': fingerprint,
+            'first_seen': seen_at
+        }
+        self.next_id += 1
+        self._pending.append(record)
+        self._recent[fingerprint] = [record['id'], day]
+        if key != university_name:
+            self.names[key] = university_name
+        self.added += 1
+        self._dirty = True
+        return True
+    
+    def add_many(self, university_name: str, notices: Iterable[Dict[str, Any]], seen_at: str = None,
+                 code: str = None) -> int:
+        """여러 공지사항 확인 기록 후 새로 추가된 수 반환"""
+        return sum(1 for notice in notices if self.add(university_name, notice, seen_at, code))
+    
+    def flush(self) -> Optional[Dict[str, Any]]:
+        """새 공지사항과 확인 기록을 각 로그에 gzip 멤버 하나로 추가하고 인덱스 저장"""
+        if not self.enabled:
+            return None
+        
+        try:
+            if self._pending:
+                offset, length = self._append_member(self.log_path, self._pending)
+                self.members.append([offset, length, self._pending[0]['id'], len(self._pending)])
+                self.logger.info(f"아카이브에 새 공지사항 {len(self._pending)}개 추가 ({length}바이트)")
+                for record in self._pending:
+                    self.fingerprint_index.put(
+                        self.fingerprint_index.entry(record, offset, self._recent[record['fingerprint']][1]))
+                self._pending = []
+                self._dirty = True
+            
+            if self._seen:
+                # 날짜별로 id 구간만 기록 (같은 게시판의 공지사항은 id가 대부분 연속)
+                by_day: Dict[str, List[int]] = {}
+                for entry_id, day in self._seen.items():
+                    by_day.setdefault(day, []).append(entry_id)
+                offset, length = self._append_member(self.seen_log_path, [
+                    {'day': day, 'ids': id_ranges(sorted(ids))} for day, ids in sorted(by_day.items())
+                ])
+                self.seen_bytes = offset + length
+                self._seen = {}
+                self._dirty = True
+            
+            if self._dirty:
+                self._save_index()
+                self._dirty = False
+        
+        except Exception as e:
+            self.logger.error(f"아카이브 저장 실패: {str(e)}")
+            return self.stats()
+        
+        # 로그에 기록된 뒤에만 지문 인덱스에 반영 (실패해도 다음 실행에서 인덱스에 없는 로그 범위를 다시 읽어 반영)
+        try:
+            if self._recent is not None:
+                self.fingerprint_index.save(self.next_id, self.seen_bytes)
+        except Exception as e:
+            self.logger.error(f"지문 인덱스 갱신 실패: {str(e)}")
+        
+        if self.use_search_index:
+            self.sync_search_index()
+        
+        return self.stats()
+    
+    def _append_member(self, path: Path, items: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """NDJSON 항목을 gzip 멤버 하나로 로그 끝에 추가하고 (위치, 길이) 반환"""
+        payload = ''.join(
+            json.dumps(item, ensure_ascii=False, separators=(',', ':')) + '\n' for item in items
+        ).encode('utf-8')
+        # mtime=0으로 같은 내용이면 같은 바이트가 되도록 함
+        member = gzip.compress(payload, compresslevel=self.compress_level, mtime=0)
+        
+        self.dir.mkdir(parents=True, exist_ok=True)
+        with open(path, 'ab') as f:
+            offset = f.seek(0, os.SEEK_END)
+            f.write(member)
+            f.flush()
+            os.fsync(f.fileno())
+        return offset, len(member)
+    
+    def _save_index(self):
+        """인덱스 저장 (대학별로 한 줄씩 써서 git diff가 바뀐 대학만 보이도록 함, 원자적 교체)"""
+        self.dir.mkdir(parents=True, exist_ok=True)
+        temp_path = self.index_path.with_suffix('.tmp')
+        
+        def dump(value) -> str:
+            return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+        
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write('{\n')
+            f.write(f'"version":{INDEX_VERSION},\n')
+            f.write(f'"next_id":{self.next_id},\n')
+            f.write(f'"members":{dump(self.members)},\n')
+            f.write(f'"seen_bytes":{self.seen_bytes},\n')
+            f.write(f'"names":{dump(dict(sorted(self.names.items())))},\n')
+            f.write('"crawled":{')
+            keys = sorted(self.crawled)
+            for i, key in enumerate(keys):
+                f.write(f"\n{dump(key)}:{dump(self.crawled[key])}{',' if i < len(keys) - 1 else ''}")
+            f.write('\n}\n}\n')
+        os.replace(temp_path, self.index_path)
+    
+    def _iter_member_records(self, members: List[List[int]]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """지정한 멤버 범위만 읽어 (멤버 위치, 레코드) 반환"""
+        if not members or not self.log_path.exists():
+            return
+        
+        with open(self.log_path, 'rb') as f:
+            for offset, length, _, _ in members:
+                f.seek(offset)
+                for line in gzip.decompress(f.read(length)).splitlines():
+                    if line:
+                        yield offset, json.loads(line)
+    
+    def _read_members(self, members: List[List[int]]) -> Iterator[Dict[str, Any]]:
+        """지정한 멤버 범위만 읽어 레코드 반환"""
+        for _, record in self._iter_member_records(members):
+            yield record
+    
+    def _members_for(self, ids: Iterable[int]) -> List[List[int]]:
+        """id 목록이 들어 있는 멤버 (멤버의 id는 연속이므로 첫 id로 이분 탐색)"""
+        first_ids = [member[2] for member in self.members]
+        member_indexes = sorted({bisect_right(first_ids, entry_id) - 1 for entry_id in ids})
+        return [self.members[i] for i in member_indexes if i >= 0]
+    
+    def sync_search_index(self):
+        """검색 인덱스에 아직 없는 멤버의 공지사항 추가"""
+        try:
+            # 열 수 없는 인덱스(이전 형식 세그먼트 등)는 지우고 처음부터 다시 색인
+            if not self.search_index.segments and not self.search_index.open() and self.search_index.manifest_path.exists():
+                shutil.rmtree(self.search_index.dir, ignore_errors=True)
+            
+            covered_next_id = self.search_index.covered_next_id
+            if covered_next_id >= self.next_id:
+                return
+            
+            for record in self._read_members([member for member in self.members if member[2] + member[3] > covered_next_id]):
+                self.search_index.add(record)
+            self.search_index.flush()
+        
+        except Exception as e:
+            self.logger.error(f"검색 인덱스 갱신 실패: {str(e)}")
+    
+    def rebuild_search_index(self) -> Dict[str, Any]:
+        """로그 전체로 검색 인덱스 다시 생성 (세그먼트 하나)"""
+        self.search_index.close()
+        shutil.rmtree(self.search_index.dir, ignore_errors=True)
+        self.search_index = NoticeSearchIndex(self.search_index.dir, self.search_index.max_segments)
+        self.sync_search_index()
+        return self.search_index.stats()
+    
+    def rebuild_fingerprint_index(self) -> Dict[str, Any]:
+        """로그와 확인 로그 전체로 지문 인덱스 다시 생성"""
+        self.fingerprint_index.remove()
+        self._recent = None
+        self.ensure_index()
+        return self.fingerprint_index.stats()
+    
+    def iter_notices(self, university: str = None, since: str = None, until: str = None) -> Iterator[Dict[str, Any]]:
+        """공지 날짜 범위의 공지사항 조회 (대학 코드나 이름, 보조 인덱스로 필요한 멤버만 읽음, 처음/마지막 확인 날짜 포함)"""
+        keys = self.keys_for(university) if university else self.keys()
+        wanted = {entry['archive_id'] for key in keys for entry in self.fingerprint_index.range(key, since, until)}
+        yield from self.iter_records(wanted)
+    
+    def iter_records(self, ids: Iterable[int]) -> Iterator[Dict[str, Any]]:
+        """id 목록의 공지사항을 id 순서로 조회 (해당 id가 들어 있는 멤버만 읽음)"""
+        wanted = set(ids)
+        if not wanted:
+            return
+        self.ensure_index()
+        
+        for record in self._read_members(self._members_for(wanted)):
+            if record['id'] in wanted:
+                entry = self.fingerprint_index.get(bytes.fromhex(record['fingerprint']))
+                record['first_seen_date'] = record['first_seen'][:10]
+                record['last_seen_date'] = decode_date(entry[5]) if entry else record['first_seen_date']
+                yield record
+    
+    def iter_states(self) -> Iterator[Tuple[str, int, str, str]]:
+        """모든 공지사항의 (대학 키, id, 처음 확인 날짜, 마지막 확인 날짜) (지문 인덱스만 읽음)"""
+        self.ensure_index()
+        universities = self.fingerprint_index.universities
+        for entry in self.fingerprint_index.entries():
+            yield universities[entry[1]], entry[3], decode_date(entry[4]), decode_date(entry[5])
+        for record in self._pending:
+            yield record_key(record), record['id'], record['first_seen'][:10], self._recent[record['fingerprint']][1]
+    
+    def seen_days(self) -> List[str]:
+        """크롤링에 성공한 날짜 목록 (오름차순)"""
+        return sorted({day for days in self.crawled.values() for day in days})
+    
+    def stats(self) -> Dict[str, Any]:
+        """리포트용 통계"""
+        return {
+            'enabled': self.enabled,
+            'notices': self.next_id - 1,
+            'added': self.added,
+            'refreshed': self.refreshed,
+            'members': len(self.members),
+            'log_bytes': self.log_path.stat().st_size if self.log_path.exists() else 0,
+            'seen_log_bytes': self.seen_bytes,
+            'index_bytes': self.index_path.stat().st_size if self.index_path.exists() else 0,
+            'fingerprint_index': self.fingerprint_index.stats(),
+            'search_index': self.search_index.stats() if self.use_search_index else None
+        }
+
+def add_snapshot(archive: NoticeArchive, snapshot: List[Dict[str, Any]], seen_at: str = None) -> int:
+    """스냅샷 형식({university, code, success, notices:[{title, date, link}], crawled_at}) 결과를 아카이브에 추가"""
+    added = 0
+    for result in snapshot:
+        if not result.get('success'):
+            continue
+        archive.mark_crawled(result['university'], result.get('crawled_at') or seen_at, result.get('code'))
+        for notice in result.get('notices', []):
+            added += archive.add(result['university'], {
+                'notice_title': notice.get('title'),
+                'notice_link': notice.get('link'),
+                'notice_date': parse_date(notice.get('date')) or notice.get('date')
+            }, result.get('crawled_at') or seen_at, result.get('code'))
+    return added
+
+def import_snapshots(archive: NoticeArchive, paths: List[str]) -> Dict[str, Any]:
+    """기존 notices_YYYYMMDD_HHMMSS.json 스냅샷을 시간 순서로 아카이브에 추가"""
+    logger = logging.getLogger(__name__)
+    imported = 0
+    
+    for path in sorted(paths, key=lambda p: Path(p).name):
+        with open(path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+        
+        # crawled_at이 없는 결과는 파일 이름의 시각을 확인 시각으로 사용
+        try:
+            file_time = datetime.strptime(Path(path).stem, 'notices_%Y%m%d_%H%M%S').isoformat()
+        except ValueError:
+            file_time = datetime.fromtimestamp(Path(path).stat().st_mtime).isoformat(timespec='seconds')
+        
+        imported += add_snapshot(archive, snapshot, file_time)
+        logger.info(f"{path}: 누적 새 공지사항 {imported}개")
+    
+    stats = archive.flush()
+    stats['snapshots'] = len(paths)
+    return stats
+
+if __name__ == "__main__":
+    from src.utils import setup_logging, load_config
+    
+    parser = argparse.ArgumentParser(description='공지사항 아카이브')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    import_parser = subparsers.add_parser('import', help='스냅샷 JSON 가져오기')
+    import_parser.add_argument('paths', nargs='+', help='notices_*.json 파일')
+    import_parser.add_argument('--delete', action='store_true', help='가져온 스냅샷 파일 삭제')
+    
+    subparsers.add_parser('stats', help='아카이브 통계')
+    
+    query_parser = subparsers.add_parser('query', help='공지사항 조회 (NDJSON 출력)')
+    query_parser.add_argument('--university', help='대학 코드나 이름 (이름이면 모든 캠퍼스/게시판)')
+    query_parser.add_argument('--since', help='공지 날짜 시작 (YYYY-MM-DD)')
+    query_parser.add_argument('--until', help='공지 날짜 끝 (YYYY-MM-DD)')
+    args = parser.parse_args()
+    
+    setup_logging()
+    archive = NoticeArchive(load_config().get('archive'))
+    archive.load()
+    
+    if args.command == 'import':
+        print(json.dumps(import_snapshots(archive, args.paths), ensure_ascii=False, indent=2))
+        if args.delete:
+            for path in args.paths:
+                os.remove(path)
+    elif args.command == 'stats':
+        print(json.dumps(archive.stats(), ensure_ascii=False, indent=2))
+    else:
+        for record in archive.iter_notices(args.university, args.since, args.until):
+            sys.stdout.write(json.dumps(record, ensure_ascii=False) + '\n')
@@ -0,0 +1,175 @@
+"""
+비동기 Supabase 데이터 접근 모듈
+연결 풀을 공유하는 비동기 PostgREST 클라이언트로 여러 배치 저장과 조회를 동시 실행
+"""
+
+import time
+import asyncio
+import logging
+import threading
+from typing import List, Dict, Any, Tuple, Iterable, Coroutine
+
+import httpx
+from postgrest import AsyncPostgrestClient
+from postgrest.exceptions import APIError
+
+from .storage import PartialWriteError
+
+class _PooledPostgrestClient(AsyncPostgrestClient):
+    """동시 실행 한도에 맞춘 연결 풀을 사용하는 PostgREST 클라이언트"""
+    
+    def __init__(self, base_url: str, headers: Dict[str, str], timeout: float, max_connections: int):
+        self.max_connections = max_connections
+        super().__init__(base_url, headers=headers, timeout=timeout)
+    
+    def create_session(self, base_url: str, headers: Dict[str, str], timeout) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections)
+        )
+
+class AsyncSupabaseClient:
+    """비동기 Supabase 클라이언트 (전용 이벤트 루프 스레드에서 실행)"""
+    
+    def __init__(self, url: str, key: str, table_name: str = "university_notices", max_concurrency: int = 4,
+                 timeout: float = 30, metrics=None, partitioned: bool = False):
+        self.logger = logging.getLogger(__name__)
+        self.url = url
+        self.key = key
+        self.table_name = table_name
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.partitioned = partitioned
+        # round_trips, inserted_count, stage_timer, is_row_error를 가진 객체 (SupabaseManager)
+        self.metrics = metrics
+        
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='async-supabase', daemon=True)
+        self._thread.start()
+        self._client: _PooledPostgrestClient = self.run(self._create_client())
+        self._semaphore: asyncio.Semaphore = self.run(self._create_semaphore())
+    
+    async def _create_client(self) -> _PooledPostgrestClient:
+        """이벤트 루프 안에서 클라이언트 생성"""
+        headers = {
+            'apikey': self.key,
+            'Authorization': f"Bearer {self.key}",
+            'Accept': 'application/json',
+            'Content-Type': 'application/json'
+        }
+        return _PooledPostgrestClient(f"{self.url}/rest/v1", headers, self.timeout, self.max_concurrency)
+    
+    async def _create_semaphore(self) -> asyncio.Semaphore:
+        """이벤트 루프 안에서 동시 실행 제한 생성"""
+        return asyncio.Semaphore(self.max_concurrency)
+    
+    def run(self, coroutine: Coroutine) -> Any:
+        """동기 코드에서 코루틴 실행 후 결과 반환 (동기 파사드용)"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+    
+    async def _execute(self, query):
+        """동시 실행 한도 안에서 요청 실행"""
+        async with self._semaphore:
+            started = time.perf_counter()
+            try:
+                return await query.execute()
+            finally:
+                if self.metrics is not None:
+                    self.metrics.round_trips += 1
+                    self.metrics.stage_timer.record('db_request', time.perf_counter() - started)
+    
+    async def write_rows(self, rows: List[Dict]) -> List[Dict]:
+        """행 목록을 한 번의 upsert 요청으로 저장 (새로 삽입된 행 반환)"""
+        table = self._client.from_(self.table_name)
+        if self.partitioned:
+            query = table.insert(rows)
+        else:
+            query = table.upsert(rows, on_conflict="fingerprint", ignore_duplicates=True)
+        response = await self._execute(query)
+        
+        inserted = response.data or []
+        if self.metrics is not None:
+            self.metrics.inserted_count += len(inserted)
+        return inserted
+    
+    async def upsert_batches(self, batches: Iterable[List[Dict]], raise_errors: bool = False) -> Tuple[List[Dict], List[Dict]]:
+        """여러 배치를 동시에 저장하고 (삽입된 행, 실패한 행) 반환 (raise_errors면 모든 배치가 끝난 뒤 PartialWriteError 전달)"""
+        inserted: List[Dict] = []
+        failed: List[Dict] = []
+        try:
+            await self._gather(self._write_isolating_failures(batch, inserted, failed, raise_errors) for batch in batches)
+        except Exception as e:
+            if self.metrics is not None:
+                self.metrics.failed_rows += len(failed)
+            raise PartialWriteError(e, inserted) from e
+        return inserted, failed
+    
+    @staticmethod
+    async def _gather(coroutines: Iterable[Coroutine]):
+        """모든 코루틴이 끝날 때까지 기다린 뒤 첫 예외 전달 (먼저 실패한 배치가 있어도 다른 배치의 삽입 결과가 모두 모이도록)"""
+        results = await asyncio.gather(*coroutines, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+    
+    async def _write_isolating_failures(self, rows: List[Dict], inserted: List[Dict], failed: List[Dict],
+                                        raise_errors: bool):
+        """행 오류로 실패한 배치는 절반씩 나눠 동시에 재시도하여 문제 행만 제외"""
+        try:
+            inserted.extend(await self.write_rows(rows))
+        
+        except Exception as e:
+            if not self._is_row_error(e):
+                if raise_errors:
+                    raise
+                self.logger.error(f"배치 저장 중 오류 ({len(rows)}개): {str(e)}")
+                failed.extend(rows)
+                return
+            
+            if len(rows) == 1:
+                row = rows[0]
+                self.logger.error(f"{row.get('university_name')} 공지사항 저장 실패 ({row.get('notice_title')}): {str(e)}")
+                failed.append(row)
+                return
+            
+            middle = len(rows) // 2
+            await self._gather((
+                self._write_isolating_failures(rows[:middle], inserted, failed, raise_errors),
+                self._write_isolating_failures(rows[middle:], inserted, failed, raise_errors)
+            ))
+    
+    def _is_row_error(self, error: Exception) -> bool:
+        """배치를 나눠 재시도할 행 단위 오류인지 확인"""
+        if self.metrics is not None:
+            return self.metrics.is_row_error(error)
+        return isinstance(error, APIError)
+    
+    async def existing_fingerprints(self, fingerprints: List[str], chunk_size: int = 100) -> set:
+        """이미 저장된 지문을 여러 요청으로 나눠 동시에 조회"""
+        existing = set()
+        
+        async def lookup(chunk: List[str]):
+            response = await self._execute(
+                self._client
+                .from_(self.table_name)
+                .select("fingerprint")
+                .in_("fingerprint", chunk)
+            )
+            existing.update(row['fingerprint'] for row in response.data or [])
+        
+        await self._gather(lookup(fingerprints[i:i + chunk_size]) for i in range(0, len(fingerprints), chunk_size))
+        return existing
+    
+    async def close(self):
+        """연결 풀 종료"""
+        await self._client.aclose()
+    
+    def shutdown(self):
+        """연결 풀과 이벤트 루프 종료"""
+        try:
+            self.run(self.close())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(5)
@@ -6,7 +6,7 @@
 import re
 import logging
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -22,23 +22,57 @@ from collections import Counter
 
 from .patterns import PatternDetector
 from .templates import TemplateManager
+from .routing import StrategyRouter
+from .instrumentation import StageTimer
+from .tracing import Tracer
+from .memory import MemoryTracker
 from .utils import clean_text, parse_date, is_valid_url
 
+# 부분 파싱 시 제거할 요소 (스타일, 인라인 SVG, 주석)
+NOISE_PATTERN = re.compile(r'<(style|svg|noscript)\b.*?</\1\s*>|<!--.*?-->', re.S | re.I)
+
+# 부분 파싱 시 스크립트는 본문만 비움 (src 속성은 템플릿의 시스템 지표로 쓰이므로 유지)
+SCRIPT_PATTERN = re.compile(r'(<script\b[^>]*>).*?</script\s*>', re.S | re.I)
+
+# Selenium 네트워크 로그에서 XHR 엔드포인트 후보로 보는 응답 (정적 전략으로 다시 파싱 가능한 HTML 조각)
+XHR_RESOURCE_TYPES = ('XHR', 'Fetch')
+XHR_MIME_TYPES = ('text/html', 'application/xhtml+xml')
+
+# 부분 파싱 시 남길 요소 (시스템 지표가 있는 head와 스크립트, 목록형 요소, div 기반 게시판)
+PARTIAL_PARSE_TAGS = ['head', 'script', 'table', 'ul', 'ol', 'div']
+
 class SmartCrawler:
     """지능형 대학 공지사항 크롤러"""
     
+    # 정적 HTML에 적용하는 전략 (비용이 낮은 순)
+    STATIC_STRATEGIES = ['template', 'auto_detect', 'custom']
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.pattern_detector = PatternDetector(config)
         self.template_manager = TemplateManager()
+        self.router = StrategyRouter(config.get('routing'))
+        tracing_config = config.get('tracing', {})
+        self.tracer = Tracer(tracing_config.get('enabled', False), tracing_config.get('output_dir', 'logs'))
+        self.stage_timer = StageTimer(config.get('instrumentation', {}).get('enabled', True), self.tracer)
+        self.memory_tracker = MemoryTracker(config.get('memory'))
+        self._partial_parse = False
         self.session = self._create_session()
         self.stats = {
             'auto_detect': 0,
             'template': 0,
             'custom': 0,
+            'xhr': 0,
+            'selenium': 0,
             'failed': 0
         }
+        # 대학별 Selenium 렌더링 소요 시간 (초)
+        self.render_times: Dict[str, float] = {}
+        # Selenium 폴백 중 목록을 렌더링한 XHR 엔드포인트 (라우팅에 기록 후 제거)
+        self.discovered_endpoints: Dict[str, str] = {}
+        self.bytes_fetched = 0
+        self.notices_extracted = 0
         
     def _create_session(self) -> requests.Session:
         """HTTP 세션 생성"""
@@ -51,70 +85,223 @@ class SmartCrawler:
     def crawl_university(self, url: str, univ_name: str) -> Dict[str, Any]:
         """대학 공지사항 크롤링 메인 함수"""
         self.logger.info(f"{univ_name} 크롤링 시작: {url}")
+        self.stage_timer.current_university = univ_name
+        self.memory_tracker.start(univ_name)
+        self._partial_parse = False
         
         try:
-            # 1. 기본 HTML 가져오기
-            soup = self._get_soup(url)
-            if not soup:
-                return self._create_result(False, error="페이지 로드 실패")
-            
-            # 2. 템플릿 확인
-            template_result = self.template_manager.match_template(soup, url)
-            if template_result['matched']:
-                self.logger.info(f"{univ_name}: 템플릿 매칭 성공 - {template_result['template_name']}")
-                notices = self._crawl_with_template(soup, template_result['template'], url)
-                if notices:
-                    self.stats['template'] += 1
-                    return self._create_result(True, notices=notices, method='template')
-            
-            # 3. 자동 패턴 감지
-            auto_result = self.pattern_detector.detect_notice_structure(soup)
-            if auto_result['confidence'] >= self.config['detection']['min_confidence']:
-                self.logger.info(f"{univ_name}: 자동 감지 성공 (신뢰도: {auto_result['confidence']:.2f})")
-                notices = self._extract_notices_from_structure(soup, auto_result['structure'], url)
+            with self.stage_timer.span('total'):
+                return self._crawl_university(url, univ_name)
+        finally:
+            self.memory_tracker.finish(univ_name, partial_parse=self._partial_parse)
+    
+    def _crawl_university(self, url: str, univ_name: str) -> Dict[str, Any]:
+        """저장된 전략 분기 및 전체 전략 순차 시도"""
+        try:
+            # 1. 저장된 전략이 있으면 바로 해당 전략으로 분기
+            route = self.router.get_route(univ_name)
+            if route and route.get('strategy') and not self.router.needs_full_check(univ_name):
+                notices = self._crawl_with_route(route, url, univ_name)
                 if notices:
-                    self.stats['auto_detect'] += 1
-                    return self._create_result(True, notices=notices, method='auto_detect')
-            
-            # 4. 수동 설정 확인
-            custom_result = self._try_custom_selectors(soup, url, univ_name)
-            if custom_result:
-                self.logger.info(f"{univ_name}: 수동 설정 성공")
-                self.stats['custom'] += 1
-                return self._create_result(True, notices=custom_result, method='custom')
+                    self.logger.info(f"{univ_name}: 저장된 전략 성공 - {route['strategy']}")
+                    self.router.record_success(univ_name, route['strategy'], endpoint=self.discovered_endpoints.pop(univ_name, None))
+                    self.stats[route['strategy']] += 1
+                    return self._create_result(True, notices=notices, method=route['strategy'])
+                
+                self.logger.info(f"{univ_name}: 저장된 전략({route['strategy']}) 실패, 전체 전략 재확인")
+                self.router.record_failure(univ_name)
             
-            # 5. Selenium 폴백
-            if self.config['fallback']['use_selenium']:
-                selenium_result = self._try_selenium_fallback(url, univ_name)
-                if selenium_result:
-                    self.logger.info(f"{univ_name}: Selenium 폴백 성공")
-                    return self._create_result(True, notices=selenium_result, method='selenium')
+            # 2. 저렴한 전략부터 순서대로 시도
+            endpoint = route.get('endpoint') if route else None
+            method, notices, error = self._crawl_full_sequence(url, univ_name, endpoint)
+            if notices:
+                # Selenium 성공 시 발견한 엔드포인트를 기록하여 다음 전체 재확인 때 XHR을 먼저 시도
+                if method == 'xhr':
+                    record_endpoint = endpoint
+                else:
+                    record_endpoint = self.discovered_endpoints.pop(univ_name, None)
+                self.router.record_success(univ_name, method, endpoint=record_endpoint, full_check=True)
+                self.stats[method] += 1
+                return self._create_result(True, notices=notices, method=method)
             
             # 모든 방법 실패
             self.stats['failed'] += 1
-            return self._create_result(False, error="모든 크롤링 방법 실패")
+            return self._create_result(False, error=error)
             
         except Exception as e:
             self.logger.error(f"{univ_name} 크롤링 중 오류: {str(e)}", exc_info=True)
             self.stats['failed'] += 1
             return self._create_result(False, error=str(e))
     
-    def _get_soup(self, url: str) -> Optional[BeautifulSoup]:
-        """URL에서 BeautifulSoup 객체 생성"""
+    def _crawl_full_sequence(self, url: str, univ_name: str, endpoint: str = None) -> Tuple[Optional[str], List[Dict], Optional[str]]:
+        """템플릿 → 자동 감지 → 수동 설정 → XHR → Selenium 순서로 크롤링"""
+        # 1. 기본 HTML 가져오기 (저장된 전략 시도에서 설정된 부분 파싱 표시와 구분)
+        partial_before, self._partial_parse = self._partial_parse, False
+        soup = self._get_soup(url)
+        partial = self._partial_parse
+        self._partial_parse = partial or partial_before
+        if not soup:
+            return None, [], "페이지 로드 실패"
+        
+        # 2~4. 정적 HTML 기반 전략 (추출 직후 트리 해제)
+        try:
+            method, notices = self._try_static_strategies(soup, url, univ_name)
+        finally:
+            soup.decompose()
+        
+        # 부분 파싱한 트리에서 찾지 못하면 전체 파싱으로 한 번 더 시도
+        if not notices and partial:
+            self.logger.info(f"{univ_name}: 부분 파싱 결과 없음, 전체 파싱으로 재시도")
+            soup = self._get_soup(url, allow_partial=False)
+            if soup:
+                try:
+                    method, notices = self._try_static_strategies(soup, url, univ_name)
+                finally:
+                    soup.decompose()
+        if notices:
+            return method, notices, None
+        
+        # 5. 알려진 XHR 엔드포인트
+        if endpoint:
+            notices = self._crawl_with_route({'strategy': 'xhr', 'endpoint': endpoint}, url, univ_name)
+            if notices:
+                self.logger.info(f"{univ_name}: XHR 엔드포인트 성공 - {endpoint}")
+                return 'xhr', notices, None
+        
+        # 6. Selenium 폴백
+        if self.config['fallback']['use_selenium']:
+            with self.stage_timer.span('selenium', url=url) as span:
+                selenium_result = self._try_selenium_fallback(url, univ_name)
+                span.set('rows', len(selenium_result))
+            if selenium_result:
+                self.logger.info(f"{univ_name}: Selenium 폴백 성공 ({self.render_times[univ_name]:.1f}초)")
+                return 'selenium', selenium_result, None
+        
+        return None, [], "모든 크롤링 방법 실패"
+    
+    def _try_static_strategies(self, soup: BeautifulSoup, url: str, univ_name: str) -> Tuple[Optional[str], List[Dict]]:
+        """정적 HTML에 대해 저렴한 전략부터 차례로 시도"""
+        for strategy in self.STATIC_STRATEGIES:
+            notices = self._run_static_strategy(strategy, soup, url, univ_name)
+            self.memory_tracker.sample()
+            if notices:
+                return strategy, notices
+        
+        return None, []
+    
+    def _run_static_strategy(self, strategy: str, soup: BeautifulSoup, url: str, univ_name: str) -> List[Dict]:
+        """정적 HTML 전략 하나 실행"""
+        if strategy == 'template':
+            with self.stage_timer.span('template_match') as span:
+                template_result = self.template_manager.match_template(soup, url)
+                if template_result['matched']:
+                    span.set('template_name', template_result['template_name'])
+                    span.set('match_type', template_result['match_type'])
+                    span.set('selector', template_result['template'].get('list_selector'))
+            if template_result['matched']:
+                self.logger.info(f"{univ_name}: 템플릿 매칭 성공 - {template_result['template_name']}")
+                return self._crawl_with_template(soup, template_result['template'], url)
+        
+        elif strategy == 'auto_detect':
+            with self.stage_timer.span('auto_detect') as span:
+                auto_result = self.pattern_detector.detect_notice_structure(soup)
+                span.set('confidence', round(auto_result['confidence'], 3))
+                if auto_result['structure']:
+                    span.set('selector', f"{auto_result['structure']['container_selector']} {auto_result['structure']['item_selector']}")
+            if auto_result['confidence'] >= self.config['detection']['min_confidence']:
+                self.logger.info(f"{univ_name}: 자동 감지 성공 (신뢰도: {auto_result['confidence']:.2f})")
+                return self._extract_notices_from_structure(soup, auto_result['structure'], url)
+        
+        elif strategy == 'custom':
+            with self.stage_timer.span('custom_selectors') as span:
+                custom_result = self._try_custom_selectors(soup, url, univ_name)
+                span.set('rows', len(custom_result))
+            if custom_result:
+                self.logger.info(f"{univ_name}: 수동 설정 성공")
+                return custom_result
+        
+        return []
+    
+    def _crawl_with_route(self, route: Dict, url: str, univ_name: str) -> List[Dict]:
+        """저장된 전략 하나만 실행"""
+        strategy = route['strategy']
+        
+        if strategy == 'selenium':
+            if not self.config['fallback']['use_selenium']:
+                return []
+            with self.stage_timer.span('selenium', url=url) as span:
+                selenium_result = self._try_selenium_fallback(url, univ_name)
+                span.set('rows', len(selenium_result))
+                return selenium_result
+        
+        if strategy == 'xhr':
+            # 목록을 렌더링하는 XHR 응답을 직접 가져와 정적 전략 적용
+            endpoint = route.get('endpoint')
+            if not endpoint:
+                return []
+            soup = self._get_soup(endpoint)
+            if not soup:
+                return []
+            try:
+                _, notices = self._try_static_strategies(soup, url, univ_name)
+            finally:
+                soup.decompose()
+            return notices
+        
+        soup = self._get_soup(url)
+        if not soup:
+            return []
+        try:
+            return self._run_static_strategy(strategy, soup, url, univ_name)
+        finally:
+            soup.decompose()
+    
+    def _get_soup(self, url: str, allow_partial: bool = True) -> Optional[BeautifulSoup]:
+        """URL에서 BeautifulSoup 객체 생성 (allow_partial이면 크기 상한을 넘는 페이지는 부분 파싱)"""
         try:
-            response = self.session.get(
-                url, 
-                timeout=self.config['crawler']['timeout']
-            )
-            response.raise_for_status()
-            response.encoding = response.apparent_encoding
+            with self.stage_timer.span('fetch', url=url) as span:
+                response = self.session.get(
+                    url, 
+                    timeout=self.config['crawler']['timeout']
+                )
+                span.set('status', response.status_code)
+                span.set('bytes', len(response.content))
+                if response.history:
+                    span.set('redirects', [r.url for r in response.history] + [response.url])
+                response.raise_for_status()
+            self.bytes_fetched += len(response.content)
+            oversized = allow_partial and self.memory_tracker.exceeds_page_limit(len(response.content))
+            
+            with self.stage_timer.span('decode') as span:
+                response.encoding = response.apparent_encoding
+                html = response.text
+                span.set('encoding', response.encoding)
+            del response
+            
+            # 페이지 크기 상한을 넘으면 필요한 요소만 부분 파싱
+            if oversized:
+                soup = self._parse_partial(html, url)
+            else:
+                with self.stage_timer.span('parse', chars=len(html)):
+                    soup = BeautifulSoup(html, 'lxml')
+            del html
             
-            return BeautifulSoup(response.text, 'lxml')
+            self.memory_tracker.sample()
+            return soup
             
         except Exception as e:
             self.logger.error(f"페이지 로드 실패 {url}: {str(e)}")
             return None
     
+    def _parse_partial(self, html: str, url: str) -> BeautifulSoup:
+        """스타일, 스크립트 본문을 제거하고 head, 목록형 요소, div만 파싱"""
+        self.logger.info(f"페이지 크기 상한 초과, 부분 파싱 사용: {url} ({len(html)}자)")
+        self._partial_parse = True
+        
+        with self.stage_timer.span('parse', chars=len(html), partial=True):
+            stripped = SCRIPT_PATTERN.sub(r'\1</script>', NOISE_PATTERN.sub('', html))
+            return BeautifulSoup(stripped, 'lxml', parse_only=SoupStrainer(PARTIAL_PARSE_TAGS))
+    
     def _crawl_with_template(self, soup: BeautifulSoup, template: Dict, base_url: str) -> List[Dict]:
         """템플릿을 사용한 크롤링"""
         notices = []
@@ -267,33 +454,51 @@ class SmartCrawler:
     def _try_selenium_fallback(self, url: str, univ_name: str) -> List[Dict]:
         """Selenium을 사용한 폴백 크롤링"""
         driver = None
+        started = time.monotonic()
+        # 페이지 로드와 렌더링 대기를 모두 포함하는 최종 마감 시간
+        deadline = started + self.config['crawler']['selenium_timeout']
         try:
             # Chrome 드라이버 설정
             options = Options()
             for option in self.config['selenium']['chrome_options']:
                 options.add_argument(option)
+            record_endpoints = self.config['fallback'].get('record_xhr_endpoints', True)
+            if record_endpoints:
+                # XHR 엔드포인트 발견용 네트워크 로그
+                options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
             
             driver = webdriver.Chrome(options=options)
-            driver.set_page_load_timeout(self.config['selenium_timeout'])
+            driver.set_page_load_timeout(self.config['crawler']['selenium_timeout'])
+            
+            # 불필요한 리소스 요청 차단
+            self._block_heavy_resources(driver)
             
-            # 페이지 로드
+            # 페이지 로드 후 목록이 렌더링될 때까지 대기
             driver.get(url)
-            time.sleep(2)  # 동적 콘텐츠 로드 대기
+            selector = self._wait_for_notice_rows(driver, deadline)
+            if not selector:
+                self.logger.warning(f"{univ_name}: 렌더링 대기 시간 초과")
+                return []
             
-            # HTML 가져오기
-            soup = BeautifulSoup(driver.page_source, 'lxml')
+            # HTML 가져오기 (원본 문자열은 파싱 직후 해제)
+            page_source = driver.page_source
+            soup = BeautifulSoup(page_source, 'lxml')
+            del page_source
+            self.memory_tracker.sample()
             
-            # 일반적인 선택자로 시도
-            for selector in self.config['fallback']['selenium_selectors']:
-                try:
-                    elements = soup.select(selector)
-                    if len(elements) >= 3:  # 최소 3개 이상의 항목
-                        # 패턴 감지 재시도
-                        auto_result = self.pattern_detector.detect_notice_structure(soup)
-                        if auto_result['confidence'] >= 0.5:  # 더 낮은 임계값
-                            return self._extract_notices_from_structure(soup, auto_result['structure'], url)
-                except:
-                    continue
+            # 패턴 감지 재시도
+            try:
+                auto_result = self.pattern_detector.detect_notice_structure(soup)
+                if auto_result['confidence'] >= 0.5:  # 더 낮은 임계값
+                    notices = self._extract_notices_from_structure(soup, auto_result['structure'], url)
+                    if notices and record_endpoints:
+                        endpoint = self._find_xhr_endpoint(driver, url, notices)
+                        if endpoint:
+                            self.logger.info(f"{univ_name}: XHR 엔드포인트 발견 - {endpoint}")
+                            self.discovered_endpoints[univ_name] = endpoint
+                    return notices
+            finally:
+                soup.decompose()
             
             return []
             
@@ -303,6 +508,80 @@ class SmartCrawler:
         finally:
             if driver:
                 driver.quit()
+            self.render_times[univ_name] = round(time.monotonic() - started, 3)
+    
+    def _block_heavy_resources(self, driver):
+        """이미지, 폰트, 미디어, 분석 스크립트 요청 차단"""
+        blocked_patterns = self.config['selenium'].get('blocked_url_patterns', [])
+        if not blocked_patterns:
+            return
+        
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_patterns})
+        except WebDriverException as e:
+            self.logger.debug(f"리소스 차단 설정 실패: {str(e)}")
+    
+    def _find_xhr_endpoint(self, driver, url: str, notices: List[Dict]) -> Optional[str]:
+        """네트워크 로그에서 렌더링된 공지 제목을 담은 같은 호스트의 GET XHR 응답 URL 찾기"""
+        try:
+            entries = driver.get_log('performance')
+        except WebDriverException as e:
+            self.logger.debug(f"네트워크 로그 조회 실패: {str(e)}")
+            return None
+        
+        host = urlparse(url).netloc
+        get_requests = set()
+        candidates = []
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, TypeError, ValueError):
+                continue
+            params = message.get('params', {})
+            if message.get('method') == 'Network.requestWillBeSent':
+                if params.get('request', {}).get('method') == 'GET':
+                    get_requests.add(params.get('requestId'))
+            elif message.get('method') == 'Network.responseReceived':
+                response = params.get('response', {})
+                if (params.get('type') in XHR_RESOURCE_TYPES
+                        and response.get('status') == 200
+                        and response.get('mimeType') in XHR_MIME_TYPES
+                        and urlparse(response.get('url', '')).netloc == host):
+                    candidates.append((params.get('requestId'), response['url']))
+        
+        # GET으로 다시 요청할 수 있고 본문에 공지 제목이 들어 있는 응답만 엔드포인트로 인정
+        titles = [notice['notice_title'] for notice in notices[:3] if notice.get('notice_title')]
+        for request_id, endpoint in candidates:
+            if request_id not in get_requests:
+                continue
+            try:
+                body = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id}).get('body', '')
+            except WebDriverException:
+                continue
+            # 제목은 정리된 텍스트이므로 응답도 텍스트로 바꿔 비교 (엔티티, 공백 차이 무시)
+            text = clean_text(BeautifulSoup(body, 'lxml').get_text()) if body else ''
+            if titles and all(title in text for title in titles):
+                return endpoint
+        
+        return None
+    
+    def _wait_for_notice_rows(self, driver, deadline: float) -> Optional[str]:
+        """설정된 선택자의 항목이 min_notices개 이상 나타날 때까지 대기"""
+        selectors = self.config['fallback']['selenium_selectors']
+        min_notices = self.config['detection']['min_notices']
+        
+        def rows_rendered(drv):
+            for selector in selectors:
+                if len(drv.find_elements(By.CSS_SELECTOR, selector)) >= min_notices:
+                    return selector
+            return False
+        
+        remaining = max(deadline - time.monotonic(), 0.1)
+        try:
+            return WebDriverWait(driver, remaining, poll_frequency=0.25).until(rows_rendered)
+        except TimeoutException:
+            return None
     
     def _is_valid_notice(self, notice: Dict) -> bool:
         """공지사항 유효성 검사"""
@@ -320,20 +599,25 @@ class SmartCrawler:
     
     def _validate_notices(self, notices: List[Dict]) -> List[Dict]:
         """공지사항 목록 검증 및 정제"""
-        valid_notices = []
-        
-        for notice in notices:
-            if self._is_valid_notice(notice):
-                # 중복 제거 (제목 기준)
-                if not any(n['notice_title'] == notice['notice_title'] for n in valid_notices):
-                    valid_notices.append(notice)
-        
-        # 최대 개수 제한
-        max_notices = self.config['validation']['max_notices_per_university']
-        return valid_notices[:max_notices]
+        with self.stage_timer.span('validation', rows_in=len(notices)) as span:
+            valid_notices = []
+            
+            for notice in notices:
+                if self._is_valid_notice(notice):
+                    # 중복 제거 (제목 기준)
+                    if not any(n['notice_title'] == notice['notice_title'] for n in valid_notices):
+                        valid_notices.append(notice)
+            
+            # 최대 개수 제한
+            max_notices = self.config['validation']['max_notices_per_university']
+            span.set('rows_out', min(len(valid_notices), max_notices))
+            return valid_notices[:max_notices]
     
     def _create_result(self, success: bool, notices: List[Dict] = None, method: str = None, error: str = None) -> Dict:
         """결과 딕셔너리 생성"""
+        if success and notices:
+            self.notices_extracted += len(notices)
+        
         return {
             'success': success,
             'notices': notices or [],
@@ -345,3 +629,7 @@ class SmartCrawler:
     def get_stats(self) -> Dict[str, int]:
         """크롤링 통계 반환"""
         return self.stats.copy()
+    
+    def get_render_times(self) -> Dict[str, float]:
+        """대학별 Selenium 렌더링 소요 시간 반환 (느린 순)"""
+        return dict(sorted(self.render_times.items(), key=lambda item: item[1], reverse=True))
@@ -4,275 +4,300 @@ Supabase 데이터베이스 관리 모듈
 """
 
 import logging
-from typing import List, Dict, Any, Optional
-from datetime import datetime, date
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 import json
 from supabase import create_client, Client
 from postgrest.exceptions import APIError
 
-class SupabaseManager:
+from .instrumentation import StageTimer
+from .storage import NoticeStorage
+from .async_database import AsyncSupabaseClient
+
+# 행과 무관한 서버/연결 문제 SQLSTATE 클래스 (연결 예외, 트랜잭션 롤백, 자원 부족, 운영자 개입)
+TRANSIENT_SQLSTATE_CLASSES = ('08', '40', '53', '57')
+
+# 행이 아니라 스키마가 맞지 않는 오류 (컬럼/테이블 없음, 예: 004 미적용 상태에서 categories 저장)
+# 행을 나눠 재시도해도 모두 실패하므로 배치 전체의 오류로 처리 (스풀은 거부하지 않고 다시 시도)
+SCHEMA_ERROR_CODES = ('PGRST204', 'PGRST205', '42703', '42P01')
+
+class SupabaseManager(NoticeStorage):
     """Supabase 데이터베이스 매니저"""
     
-    def __init__(self, url: str, key: str, table_name: str = "university_notices"):
+    # PostgREST가 거부한 요청 (제약 조건 위반, 잘못된 값)
+    row_errors = (APIError,)
+    
+    def __init__(self, url: str, key: str, table_name: str = "university_notices", stage_timer: StageTimer = None,
+                 stats_table_name: str = "university_notice_stats", batch_size: int = 500, concurrency: int = 1,
+                 partitioned: bool = False):
+        super().__init__(table_name, stage_timer)
         self.logger = logging.getLogger(__name__)
-        self.table_name = table_name
+        self.stats_table_name = stats_table_name
+        self._stats_table_available = True
+        self.batch_size = batch_size
+        self.partitioned = partitioned
+        self.async_client: Optional[AsyncSupabaseClient] = None
         
         try:
             self.client: Client = create_client(url, key)
+            
+            # 동시 실행 한도가 2 이상이면 여러 배치를 비동기 클라이언트로 동시에 전송
+            if concurrency > 1:
+                self.async_client = AsyncSupabaseClient(url, key, table_name, concurrency, metrics=self,
+                                                        partitioned=partitioned)
+            
             self.logger.info("Supabase 클라이언트 초기화 완료")
         except Exception as e:
             self.logger.error(f"Supabase 클라이언트 초기화 실패: {str(e)}")
             raise
     
-    def save_notices(self, notices: List[Dict], university_name: str) -> int:
-        """공지사항 목록을 데이터베이스에 저장"""
-        if not notices:
-            return 0
-        
-        saved_count = 0
-        
-        try:
-            # 데이터 준비
-            insert_data = []
-            current_time = datetime.now().isoformat()
-            
-            for notice in notices:
-                # 데이터 검증 및 정제
-                processed_notice = self._prepare_notice_data(notice, university_name, current_time)
-                if processed_notice:
-                    insert_data.append(processed_notice)
-            
-            if not insert_data:
-                self.logger.warning(f"{university_name}: 저장할 유효한 공지사항이 없음")
-                return 0
-            
-            # 중복 확인 및 새로운 공지사항만 필터링
-            new_notices = self._filter_new_notices(insert_data, university_name)
-            
-            if not new_notices:
-                self.logger.info(f"{university_name}: 새로운 공지사항이 없음")
-                return 0
-            
-            # 배치 저장
-            saved_count = self._batch_insert(new_notices)
-            
-            if saved_count > 0:
-                self.logger.info(f"{university_name}: {saved_count}개 공지사항 저장 완료")
-            
-            return saved_count
-            
-        except Exception as e:
-            self.logger.error(f"{university_name} 공지사항 저장 중 오류: {str(e)}", exc_info=True)
-            return 0
+    def _execute(self, query):
+        """PostgREST 요청 실행 (왕복 횟수 집계)"""
+        self.round_trips += 1
+        with self.stage_timer.span('db_request', method=getattr(query, 'http_method', None), table=self.table_name) as span:
+            response = query.execute()
+            if isinstance(response.data, list):
+                span.set('rows', len(response.data))
+            return response
     
-    def _prepare_notice_data(self, notice: Dict, university_name: str, crawled_at: str) -> Optional[Dict]:
-        """공지사항 데이터 준비 및 검증"""
-        try:
-            # 필수 필드 확인
-            if not notice.get('notice_title'):
-                return None
-            
-            # 데이터 정제
-            prepared_data = {
-                'university_name': university_name,
-                'notice_title': self._clean_title(notice['notice_title']),
-                'notice_link': notice.get('notice_link'),
-                'crawled_at': crawled_at
-            }
-            
-            # 날짜 처리
-            notice_date = notice.get('notice_date')
-            if notice_date:
-                if isinstance(notice_date, str):
-                    prepared_data['notice_date'] = notice_date
-                elif isinstance(notice_date, (date, datetime)):
-                    prepared_data['notice_date'] = notice_date.isoformat()
-            
-            return prepared_data
-            
-        except Exception as e:
-            self.logger.error(f"공지사항 데이터 준비 중 오류: {str(e)}")
-            return None
+    def write_rows(self, rows: List[Dict]) -> List[Dict]:
+        """행 목록을 한 번의 upsert 요청으로 저장 (이미 있는 지문은 무시, 새로 삽입된 행 반환)"""
+        table = self.client.table(self.table_name)
+        # 파티션 테이블에는 fingerprint 단독 고유 제약이 없으므로 insert 후 트리거가 중복 행을 제외
+        if self.partitioned:
+            query = table.insert(rows)
+        else:
+            query = table.upsert(rows, on_conflict="fingerprint", ignore_duplicates=True)
+        response = self._execute(query)
+        
+        inserted = response.data or []
+        self.inserted_count += len(inserted)
+        return inserted
     
-    def _clean_title(self, title: str) -> str:
-        """제목 정제"""
-        if not title:
-            return ""
+    def is_row_error(self, error: Exception) -> bool:
+        """API 오류 중 게이트웨이 5xx, DB 연결 문제(PGRST000~003) 등 일시적 오류와 스키마 불일치가 아닌 것만 행 오류로 간주"""
+        if not isinstance(error, APIError):
+            return False
+        
+        # JSON이 아닌 오류 응답은 HTTP 상태 코드가 code로 들어옴
+        if isinstance(error.code, int):
+            return error.code < 500
         
-        # 불필요한 공백 제거
-        cleaned = ' '.join(title.split())
+        code = str(error.code or '')
+        if code.startswith('PGRST00') or code in SCHEMA_ERROR_CODES:
+            return False
+        return code[:2] not in TRANSIENT_SQLSTATE_CLASSES
+    
+    def upsert_rows(self, rows: List[Dict], raise_errors: bool = False) -> Tuple[List[Dict], List[Dict]]:
+        """배치가 여러 개면 비동기 클라이언트로 동시에 저장 (DB 시간이 가장 긴 배치 수준으로 줄어듦)"""
+        if self.async_client is None or len(rows) <= self.batch_size:
+            return super().upsert_rows(rows, raise_errors)
         
-        # 최대 길이 제한
-        max_length = 500
-        if len(cleaned) > max_length:
-            cleaned = cleaned[:max_length] + '...'
+        batches = [rows[i:i + self.batch_size] for i in range(0, len(rows), self.batch_size)]
+        with self.stage_timer.span('db_concurrent', batches=len(batches), rows=len(rows)):
+            inserted, failed = self.async_client.run(self.async_client.upsert_batches(batches, raise_errors))
         
-        return cleaned
+        self.failed_rows += len(failed)
+        return inserted, failed
     
-    def _filter_new_notices(self, notices: List[Dict], university_name: str) -> List[Dict]:
-        """중복되지 않은 새로운 공지사항만 필터링"""
-        try:
-            # 최근 크롤링된 공지사항 제목들 가져오기
-            existing_response = (
+    def existing_fingerprints(self, fingerprints: List[str]) -> set:
+        """이미 저장된 지문 조회 (비동기 클라이언트가 있으면 나눠서 동시에 조회)"""
+        if self.async_client is not None:
+            return self.async_client.run(self.async_client.existing_fingerprints(fingerprints))
+        
+        existing = set()
+        for i in range(0, len(fingerprints), 100):
+            response = self._execute(
                 self.client
                 .table(self.table_name)
-                .select("notice_title")
-                .eq("university_name", university_name)
-                .order("crawled_at", desc=True)
-                .limit(200)  # 최근 200개만 확인
-                .execute()
+                .select("fingerprint")
+                .in_("fingerprint", fingerprints[i:i + 100])
             )
-            
-            existing_titles = {item['notice_title'] for item in existing_response.data}
-            
-            # 새로운 공지사항만 필터링
-            new_notices = []
-            for notice in notices:
-                if notice['notice_title'] not in existing_titles:
-                    new_notices.append(notice)
-            
-            return new_notices
-            
-        except Exception as e:
-            self.logger.error(f"중복 확인 중 오류: {str(e)}")
-            # 오류 발생 시 모든 공지사항을 새것으로 간주
-            return notices
+            existing.update(row['fingerprint'] for row in response.data)
+        return existing
     
-    def _batch_insert(self, notices: List[Dict]) -> int:
-        """배치 단위로 데이터 삽입"""
-        batch_size = 100
-        total_saved = 0
-        
+    def close(self):
+        """비동기 클라이언트 연결 풀 종료"""
+        if self.async_client is not None:
+            self.async_client.shutdown()
+            self.async_client = None
+    
+    def get_university_stats(self, university_name: str) -> Dict[str, Any]:
+        """특정 대학의 공지사항 통계 조회 (서버 측 집계, 이력 크기와 무관)"""
         try:
-            for i in range(0, len(notices), batch_size):
-                batch = notices[i:i + batch_size]
-                
-                response = (
-                    self.client
-                    .table(self.table_name)
-                    .insert(batch)
-                    .execute()
-                )
-                
-                if response.data:
-                    batch_saved = len(response.data)
-                    total_saved += batch_saved
-                    self.logger.debug(f"배치 {i//batch_size + 1}: {batch_saved}개 저장")
-                
-            return total_saved
+            if self._stats_table_available:
+                try:
+                    response = self._execute(
+                        self.client
+                        .table(self.stats_table_name)
+                        .select("university_name", "total_notices", "latest_crawl", "latest_notice_date")
+                        .eq("university_name", university_name)
+                        .limit(1)
+                    )
+                    if response.data:
+                        return self._format_stats(response.data[0])
+                    return self._format_stats({'university_name': university_name})
+                    
+                except APIError as e:
+                    # 통계 테이블 마이그레이션 전이면 개별 조회로 대체
+                    self.logger.warning(f"통계 테이블 조회 실패, 개별 집계로 대체: {str(e)}")
+                    self._stats_table_available = False
+            
+            return self._query_university_stats(university_name)
             
-        except APIError as e:
-            self.logger.error(f"Supabase API 오류: {str(e)}")
-            return 0
         except Exception as e:
-            self.logger.error(f"배치 삽입 중 오류: {str(e)}")
-            return 0
+            self.logger.error(f"{university_name} 통계 조회 중 오류: {str(e)}")
+            stats = self._format_stats({'university_name': university_name})
+            stats['error'] = str(e)
+            return stats
     
-    def get_university_stats(self, university_name: str) -> Dict[str, Any]:
-        """특정 대학의 공지사항 통계 조회"""
+    def get_all_university_stats(self) -> List[Dict[str, Any]]:
+        """전체 대학의 공지사항 통계를 한 번에 조회 (통계 테이블 필요)"""
         try:
-            response = (
+            response = self._execute(
                 self.client
-                .table(self.table_name)
-                .select("id", "notice_date", "crawled_at")
-                .eq("university_name", university_name)
-                .execute()
+                .table(self.stats_table_name)
+                .select("university_name", "total_notices", "latest_crawl", "latest_notice_date")
+                .order("university_name")
             )
-            
-            data = response.data
-            total_count = len(data)
-            
-            if total_count == 0:
-                return {
-                    'university_name': university_name,
-                    'total_notices': 0,
-                    'latest_crawl': None,
-                    'latest_notice_date': None
-                }
-            
-            # 최신 크롤링 시간
-            latest_crawl = max(item['crawled_at'] for item in data if item['crawled_at'])
-            
-            # 최신 공지사항 날짜
-            latest_notice_date = None
-            notice_dates = [item['notice_date'] for item in data if item['notice_date']]
-            if notice_dates:
-                latest_notice_date = max(notice_dates)
-            
-            return {
-                'university_name': university_name,
-                'total_notices': total_count,
-                'latest_crawl': latest_crawl,
-                'latest_notice_date': latest_notice_date
-            }
+            return [self._format_stats(row) for row in response.data]
             
         except Exception as e:
-            self.logger.error(f"{university_name} 통계 조회 중 오류: {str(e)}")
-            return {
-                'university_name': university_name,
-                'total_notices': 0,
-                'latest_crawl': None,
-                'latest_notice_date': None,
-                'error': str(e)
-            }
+            self.logger.error(f"전체 대학 통계 조회 중 오류: {str(e)}")
+            return []
     
-    def get_recent_notices(self, university_name: str = None, limit: int = 50) -> List[Dict]:
-        """최근 공지사항 조회"""
-        try:
+    def _query_university_stats(self, university_name: str) -> Dict[str, Any]:
+        """정확한 개수 헤더와 정렬된 단일 행 조회로 통계 계산"""
+        # 개수는 Content-Range 헤더로만 받고 행은 하나만 전송
+        count_response = self._execute(
+            self.client
+            .table(self.table_name)
+            .select("id", count="exact")
+            .eq("university_name", university_name)
+            .limit(1)
+        )
+        
+        return self._format_stats({
+            'university_name': university_name,
+            'total_notices': count_response.count or 0,
+            'latest_crawl': self._latest_value(university_name, "crawled_at"),
+            'latest_notice_date': self._latest_value(university_name, "notice_date")
+        })
+    
+    def _latest_value(self, university_name: str, column: str) -> Optional[str]:
+        """대학의 컬럼 최대값을 인덱스 정렬 단일 행 조회로 반환"""
+        # 내림차순 정렬 시 NULL이 먼저 오므로 제외
+        response = self._execute(
+            self.client
+            .table(self.table_name)
+            .select(column)
+            .eq("university_name", university_name)
+            .not_.is_(column, "null")
+            .order(column, desc=True)
+            .limit(1)
+        )
+        return response.data[0][column] if response.data else None
+    
+    def iter_notices(self, university_name: str = None, columns: List[str] = None, page_size: int = 1000,
+                     since: str = None) -> Iterator[Dict]:
+        """공지사항을 최신순으로 (crawled_at, id) 커서 페이지 단위 조회 (offset 없이 필요한 컬럼만)"""
+        select_columns = self._cursor_columns(columns)
+        cursor = None
+        while True:
             query = (
                 self.client
                 .table(self.table_name)
-                .select("*")
+                .select(*select_columns)
             )
             
             if university_name:
                 query = query.eq("university_name", university_name)
+            if since:
+                query = query.gte("crawled_at", since)
+            if cursor:
+                # 마지막 행 다음부터: crawled_at < c OR (crawled_at = c AND id < i)
+                crawled_at, last_id = cursor
+                # OR 조건만으로는 인덱스 탐색 시작점이 정해지지 않으므로 범위 조건을 함께 전달
+                query = query.lte("crawled_at", crawled_at)
+                query.params = query.params.add(
+                    "or", f'(crawled_at.lt."{crawled_at}",and(crawled_at.eq."{crawled_at}",id.lt.{last_id}))'
+                )
             
-            response = (
-                query
-                .order("crawled_at", desc=True)
-                .limit(limit)
-                .execute()
-            )
+            # 같은 시각의 행 순서를 id로 고정 (order 파라미터는 하나로 전달)
+            query.params = query.params.add("order", "crawled_at.desc,id.desc")
+            response = self._execute(query.limit(page_size))
             
-            return response.data
+            rows = response.data or []
+            for row in rows:
+                yield self._project(row, columns)
             
-        except Exception as e:
-            self.logger.error(f"최근 공지사항 조회 중 오류: {str(e)}")
-            return []
+            if len(rows) < page_size:
+                return
+            cursor = (rows[-1]['crawled_at'], rows[-1]['id'])
     
-    def delete_old_notices(self, days: int = 365) -> int:
-        """오래된 공지사항 삭제"""
-        try:
-            cutoff_date = datetime.now() - timedelta(days=days)
-            cutoff_str = cutoff_date.isoformat()
-            
-            response = (
+    def iter_fingerprints(self, page_size: int = 1000) -> Iterator[str]:
+        """저장된 모든 공지사항 지문을 id 순서로 페이지 단위 조회 (keyset 페이지네이션)"""
+        last_id = 0
+        while True:
+            response = self._execute(
                 self.client
                 .table(self.table_name)
-                .delete()
-                .lt("crawled_at", cutoff_str)
-                .execute()
+                .select("id", "fingerprint")
+                .gt("id", last_id)
+                .order("id")
+                .limit(page_size)
             )
             
-            deleted_count = len(response.data) if response.data else 0
-            self.logger.info(f"{days}일 이전 공지사항 {deleted_count}개 삭제")
+            rows = response.data or []
+            for row in rows:
+                if row.get('fingerprint'):
+                    yield row['fingerprint']
             
-            return deleted_count
-            
-        except Exception as e:
-            self.logger.error(f"오래된 공지사항 삭제 중 오류: {str(e)}")
-            return 0
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1]['id']
+    
+    def delete_expired_chunk(self, cutoff: str, after_id: int, chunk_size: int) -> Tuple[int, Optional[int]]:
+        """cutoff 이전에 크롤링된 공지사항을 id 순서로 최대 chunk_size개 삭제 후 (삭제 수, 다음 시작 id) 반환"""
+        # 이번 묶음의 마지막 id (남은 행이 chunk_size보다 적으면 상한 없이 삭제)
+        boundary_response = self._execute(
+            self.client
+            .table(self.table_name)
+            .select("id")
+            .lt("crawled_at", cutoff)
+            .gt("id", after_id)
+            .order("id")
+            .offset(chunk_size - 1)
+            .limit(1)
+        )
+        upper_id = boundary_response.data[0]['id'] if boundary_response.data else None
+        
+        query = (
+            self.client
+            .table(self.table_name)
+            .delete(count="exact")
+            .lt("crawled_at", cutoff)
+            .gt("id", after_id)
+        )
+        if upper_id is not None:
+            query = query.lte("id", upper_id)
+        
+        # 삭제된 행 본문 대신 id만 반환 (return=minimal은 클라이언트가 개수 헤더를 버림)
+        query.params = query.params.add("select", "id")
+        response = self._execute(query)
+        
+        deleted_count = response.count if response.count is not None else len(response.data)
+        if upper_id is None:
+            return deleted_count, None
+        return deleted_count, upper_id
     
     def health_check(self) -> bool:
         """데이터베이스 연결 상태 확인"""
         try:
-            response = (
+            response = self._execute(
                 self.client
                 .table(self.table_name)
                 .select("id")
                 .limit(1)
-                .execute()
             )
             
             self.logger.info("데이터베이스 연결 정상")
@@ -287,12 +312,11 @@ class SupabaseManager:
         try:
             # Supabase에서는 보통 웹 인터페이스나 SQL 에디터로 테이블 생성
             # 여기서는 테이블 존재 여부만 확인
-            response = (
+            response = self._execute(
                 self.client
                 .table(self.table_name)
                 .select("id")
                 .limit(1)
-                .execute()
             )
             
             self.logger.info(f"테이블 '{self.table_name}' 존재 확인")
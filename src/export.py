@@ -0,0 +1,63 @@
+"""
+공지사항 내보내기 모듈
+저장소의 공지사항을 커서 페이지 단위로 읽어 NDJSON/CSV 파일로 스트리밍 (메모리 사용량 일정)
+"""
+
+import sys
+import csv
+import json
+import logging
+import argparse
+from typing import List, Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+def export_notices(db_manager, output: TextIO, fmt: str = 'ndjson', columns: List[str] = None,
+                   university_name: str = None, since: str = None, page_size: int = 1000) -> int:
+    """공지사항을 최신순으로 내보내고 내보낸 행 수 반환"""
+    rows = db_manager.iter_notices(university_name, columns, page_size=page_size, since=since)
+    count = 0
+    
+    if fmt == 'csv':
+        writer: Optional[csv.DictWriter] = None
+        for row in rows:
+            if writer is None:
+                # 컬럼을 지정하지 않았으면 첫 행의 컬럼을 헤더로 사용
+                writer = csv.DictWriter(output, fieldnames=columns or list(row.keys()), extrasaction='ignore')
+                writer.writeheader()
+            writer.writerow(row)
+            count += 1
+    elif fmt == 'ndjson':
+        for row in rows:
+            output.write(json.dumps(row, ensure_ascii=False, default=str) + '\n')
+            count += 1
+    else:
+        raise ValueError(f"지원하지 않는 형식: {fmt}")
+    
+    logger.info(f"공지사항 {count}개 내보내기 완료")
+    return count
+
+if __name__ == "__main__":
+    from src.storage import create_storage
+    from src.utils import setup_logging, load_config
+    
+    parser = argparse.ArgumentParser(description='공지사항 내보내기')
+    parser.add_argument('output', nargs='?', default='-', help='출력 파일 (기본: 표준 출력)')
+    parser.add_argument('--format', choices=['ndjson', 'csv'], default='ndjson')
+    parser.add_argument('--columns', help='내보낼 컬럼 (쉼표로 구분)')
+    parser.add_argument('--university', help='대학 이름')
+    parser.add_argument('--since', help='이 시각 이후 크롤링된 공지사항만 (ISO 8601)')
+    parser.add_argument('--page-size', type=int, default=1000)
+    args = parser.parse_args()
+    
+    setup_logging()
+    db_manager = create_storage(load_config())
+    columns = [column.strip() for column in args.columns.split(',') if column.strip()] if args.columns else None
+    
+    output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8', newline='')
+    try:
+        export_notices(db_manager, output, args.format, columns, args.university, args.since, args.page_size)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        db_manager.close()
@@ -0,0 +1,416 @@
+"""
+공지사항 지문 인덱스 모듈
+아카이브 공지사항의 (지문, 대학 키 id, 공지 날짜, 아카이브 id, 처음/마지막 확인 날짜, 멤버 위치)를 고정 길이 레코드로 정렬해 저장하고
+mmap으로 열어 이분 탐색 (전체를 읽지 않으므로 시작 비용이 거의 없고 수백만 개에서도 조회가 수 마이크로초)
+실행마다 늘어나는 새 레코드와 마지막 확인 날짜 갱신은 작은 델타 파일에 이어 붙이고 상한을 넘을 때만 병합
+"""
+
+import os
+import sys
+import json
+import mmap
+import heapq
+import struct
+import logging
+import argparse
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterator, Iterable, Tuple
+
+from .utils import university_key
+
+MAGIC = b'NFI3'
+DELTA_MAGIC = b'NFD1'
+HEADER = struct.Struct('<4sQQQ')  # 매직, 레코드 수, 포함된 아카이브 id 상한 (이 값 미만 id는 모두 포함), 반영한 확인 로그 바이트 수
+PRIMARY = struct.Struct('<32sIIIIIQ')  # 지문(sha256), 대학 키 id, 공지 날짜(YYYYMMDD, 없으면 0), 아카이브 id, 처음/마지막 확인 날짜, 멤버 위치
+SECONDARY = struct.Struct('<IIIQ')  # 대학 키 id, 공지 날짜, 아카이브 id, 멤버 위치 (대학/날짜 순 정렬)
+
+PRIMARY_NAME = 'fingerprints.idx'
+SECONDARY_NAME = 'fingerprints_by_university.idx'
+UNIVERSITIES_NAME = 'fingerprints_universities.json'
+# 병합 전까지 새 레코드와 마지막 확인 날짜 갱신을 이어 붙이는 델타 파일 (HEADER + PRIMARY 레코드, 같은 지문은 뒤의 것이 우선)
+DELTA_NAME = 'fingerprints_delta.idx'
+
+# 델타 레코드가 이 수를 넘으면 기본/보조 인덱스에 병합
+DEFAULT_DELTA_MAX = 50000
+
+# (지문 바이트, 대학 키 id, 날짜, 아카이브 id, 처음 확인 날짜, 마지막 확인 날짜, 멤버 위치)
+Entry = Tuple[bytes, int, int, int, int, int, int]
+
+def encode_date(notice_date: Optional[str]) -> int:
+    """YYYY-MM-DD → YYYYMMDD 정수 (형식이 다르면 0)"""
+    if not notice_date or len(notice_date) != 10:
+        return 0
+    try:
+        return int(notice_date[:4] + notice_date[5:7] + notice_date[8:10])
+    except ValueError:
+        return 0
+
+def decode_date(value: int) -> Optional[str]:
+    """YYYYMMDD 정수 → YYYY-MM-DD"""
+    if not value:
+        return None
+    text = str(value)
+    return f"{text[:4]}-{text[4:6]}-{text[6:]}"
+
+class _Column:
+    """mmap 레코드 배열의 정렬 키를 시퀀스로 노출 (bisect용)"""
+    
+    def __init__(self, buffer, record: struct.Struct, count: int, key):
+        self.buffer = buffer
+        self.record = record
+        self.count = count
+        self.key = key
+    
+    def __len__(self) -> int:
+        """레코드 수"""
+        return self.count
+    
+    def __getitem__(self, i: int):
+        """i번째 레코드의 정렬 키"""
+        return self.key(self.buffer, HEADER.size + i * self.record.size)
+
+class FingerprintIndex:
+    """mmap 지문 인덱스와 델타 파일 (지문 조회, 마지막 확인 날짜 갱신, 대학/날짜 범위 조회)"""
+    
+    def __init__(self, directory: str = 'data/archive', delta_max: int = DEFAULT_DELTA_MAX):
+        self.logger = logging.getLogger(__name__)
+        self.dir = Path(directory)
+        self.primary_path = self.dir / PRIMARY_NAME
+        self.secondary_path = self.dir / SECONDARY_NAME
+        self.universities_path = self.dir / UNIVERSITIES_NAME
+        self.delta_path = self.dir / DELTA_NAME
+        self.delta_max = delta_max
+        
+        self.count = 0
+        self.covered_next_id = 1
+        self.covered_seen_bytes = 0
+        self.universities: List[str] = []
+        self._university_ids: Dict[str, int] = {}
+        self._saved_universities = 0
+        self._files = []
+        self._primary = None
+        self._secondary = None
+        # 기본/보조 인덱스에 들어 있는 아카이브 id 상한 (델타에서 이 값 이상인 id는 새 레코드)
+        self._main_next_id = 1
+        # 델타 레코드 (지문 → 레코드), 델타 파일의 레코드 수, 아직 파일에 쓰지 않은 레코드
+        self._delta: Dict[bytes, Entry] = {}
+        self._delta_count = 0
+        self._unsaved: List[Entry] = []
+    
+    def open(self) -> bool:
+        """인덱스 파일을 mmap으로 열고 델타 파일 읽기 (헤더, 대학 키 목록, 델타만 읽음)"""
+        self.close()
+        if not (self.primary_path.exists() and self.secondary_path.exists() and self.universities_path.exists()):
+            return False
+        
+        try:
+            with open(self.universities_path, 'r', encoding='utf-8') as f:
+                self.universities = json.load(f)
+            self._university_ids = {name: i for i, name in enumerate(self.universities)}
+            self._saved_universities = len(self.universities)
+            
+            self._primary = self._map(self.primary_path, PRIMARY)
+            self._secondary = self._map(self.secondary_path, SECONDARY)
+            
+            header = HEADER.unpack_from(self._primary, 0)
+            if HEADER.unpack_from(self._secondary, 0)[1:] != header[1:]:
+                raise ValueError("기본/보조 인덱스 불일치")
+            self.count, self._main_next_id, self.covered_seen_bytes = header[1:]
+            self.covered_next_id = self._main_next_id
+            self._load_delta()
+            return True
+        
+        except Exception as e:
+            self.logger.error(f"지문 인덱스 열기 실패: {str(e)}")
+            self.close()
+            return False
+    
+    def _map(self, path: Path, record: struct.Struct):
+        """파일 매핑 후 헤더와 크기 검증"""
+        f = open(path, 'rb')
+        self._files.append(f)
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, _, _ = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or len(buffer) != HEADER.size + count * record.size:
+            buffer.close()
+            raise ValueError(f"잘못된 인덱스 파일: {path}")
+        return buffer
+    
+    def _load_delta(self):
+        """델타 파일 읽기 (헤더의 레코드 수까지만, 기록 중 중단된 뒷부분은 무시)"""
+        if not self.delta_path.exists():
+            return
+        
+        data = self.delta_path.read_bytes()
+        magic, count, covered_next_id, covered_seen_bytes = HEADER.unpack_from(data, 0)
+        if magic != DELTA_MAGIC or len(data) < HEADER.size + count * PRIMARY.size:
+            raise ValueError(f"잘못된 델타 파일: {self.delta_path}")
+        
+        for i in range(count):
+            entry = PRIMARY.unpack_from(data, HEADER.size + i * PRIMARY.size)
+            self._delta[entry[0]] = entry
+        if any(entry[1] >= len(self.universities) for entry in self._delta.values()):
+            raise ValueError("델타 파일의 대학 키가 목록에 없음")
+        self._delta_count = count
+        self.covered_next_id, self.covered_seen_bytes = covered_next_id, covered_seen_bytes
+    
+    def close(self):
+        """매핑 해제 (저장하지 않은 델타 레코드도 버림)"""
+        for buffer in (self._primary, self._secondary):
+            if buffer is not None:
+                buffer.close()
+        for f in self._files:
+            f.close()
+        self._primary = self._secondary = None
+        self._files = []
+        self.count = 0
+        self.covered_next_id = self._main_next_id = 1
+        self.covered_seen_bytes = 0
+        self._delta, self._delta_count, self._unsaved = {}, 0, []
+    
+    def remove(self):
+        """인덱스 파일 삭제 (다시 생성할 때 사용)"""
+        self.close()
+        self.universities, self._university_ids, self._saved_universities = [], {}, 0
+        for path in (self.primary_path, self.secondary_path, self.universities_path, self.delta_path):
+            if path.exists():
+                path.unlink()
+    
+    @property
+    def is_open(self) -> bool:
+        """인덱스가 열려 있는지 여부"""
+        return self._primary is not None
+    
+    def _primary_entry(self, i: int) -> Entry:
+        """i번째 기본 인덱스 레코드"""
+        return PRIMARY.unpack_from(self._primary, HEADER.size + i * PRIMARY.size)
+    
+    def _to_dict(self, fingerprint: bytes, university_id: int, notice_date: int, archive_id: int,
+                 first_seen: int, last_seen: int, member_offset: int) -> Dict[str, Any]:
+        """인덱스 레코드 → 딕셔너리"""
+        return {
+            'fingerprint': fingerprint.hex() if fingerprint else None,
+            'university': self.universities[university_id],
+            'notice_date': decode_date(notice_date),
+            'archive_id': archive_id,
+            'first_seen_date': decode_date(first_seen),
+            'last_seen_date': decode_date(last_seen),
+            'member_offset': member_offset
+        }
+    
+    def get(self, fingerprint: bytes) -> Optional[Entry]:
+        """지문 바이트로 레코드 조회 (델타 우선, 없으면 기본 인덱스 이분 탐색)"""
+        entry = self._delta.get(fingerprint)
+        if entry is not None or not self.is_open:
+            return entry
+        
+        column = _Column(self._primary, PRIMARY, self.count, lambda buffer, offset: buffer[offset:offset + 32])
+        i = bisect_left(column, fingerprint)
+        if i < self.count and column[i] == fingerprint:
+            return self._primary_entry(i)
+        return None
+    
+    def lookup(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """지문으로 조회 (없으면 None)"""
+        entry = self.get(bytes.fromhex(fingerprint))
+        return self._to_dict(*entry) if entry else None
+    
+    def __contains__(self, fingerprint: str) -> bool:
+        """지문이 인덱스에 있는지 확인"""
+        return self.lookup(fingerprint) is not None
+    
+    def put(self, entry: Entry):
+        """새 레코드 추가나 기존 레코드 갱신 (save 때 델타 파일에 추가)"""
+        self._delta[entry[0]] = entry
+        self._unsaved.append(entry)
+    
+    def range(self, key: str, since: str = None, until: str = None) -> Iterator[Dict[str, Any]]:
+        """대학 키의 공지 날짜 범위 조회 (보조 인덱스 이분 탐색 후 연속 구간만 읽음, 날짜 없는 공지사항은 기간 미지정 시에만 포함)"""
+        university_id = self._university_ids.get(key)
+        if university_id is None:
+            return
+        
+        low = (university_id, encode_date(since) if since else 0)
+        high = (university_id, encode_date(until) if until else 99999999)
+        if since and not low[1] or until and not high[1]:
+            raise ValueError("날짜는 YYYY-MM-DD 형식이어야 함")
+        
+        if self.is_open:
+            column = _Column(self._secondary, SECONDARY, self.count,
+                             lambda buffer, offset: struct.unpack_from('<II', buffer, offset))
+            for i in range(bisect_left(column, low), bisect_right(column, high)):
+                _, notice_date, archive_id, member_offset = SECONDARY.unpack_from(
+                    self._secondary, HEADER.size + i * SECONDARY.size)
+                yield self._to_dict(b'', university_id, notice_date, archive_id, 0, 0, member_offset)
+        
+        # 보조 인덱스에 아직 없는 새 레코드 (델타는 작으므로 선형 검색)
+        for entry in sorted(self._new_entries(), key=lambda entry: (entry[2], entry[3])):
+            if entry[1] == university_id and low[1] <= entry[2] <= high[1]:
+                yield self._to_dict(*entry)
+    
+    def _new_entries(self) -> List[Entry]:
+        """기본/보조 인덱스에 없는 델타 레코드"""
+        return [entry for entry in self._delta.values() if entry[3] >= self._main_next_id]
+    
+    def _main_entries(self) -> Iterator[Entry]:
+        """기본 인덱스 레코드를 지문 순서로 반환"""
+        for i in range(self.count if self.is_open else 0):
+            yield self._primary_entry(i)
+    
+    def _merged_entries(self, delta: List[Entry]) -> Iterator[Entry]:
+        """기본 인덱스와 정렬된 델타 레코드를 지문 순서로 병합 (같은 지문은 델타 우선)"""
+        previous = None
+        for fingerprint, _, entry in heapq.merge(((entry[0], 0, entry) for entry in self._main_entries()),
+                                                 ((entry[0], 1, entry) for entry in delta)):
+            if previous is not None and previous[0] != fingerprint:
+                yield previous
+            previous = entry
+        if previous is not None:
+            yield previous
+    
+    def entries(self) -> Iterator[Entry]:
+        """델타를 반영한 전체 레코드를 지문 순서로 반환"""
+        return self._merged_entries(sorted(self._delta.values()))
+    
+    def university_id(self, key: str) -> int:
+        """대학 키 id (처음 보는 대학은 뒤에 추가하므로 기존 id는 바뀌지 않음)"""
+        university_id = self._university_ids.get(key)
+        if university_id is None:
+            university_id = self._university_ids[key] = len(self.universities)
+            self.universities.append(key)
+        return university_id
+    
+    def entry(self, record: Dict[str, Any], member_offset: int, last_seen: str = None) -> Entry:
+        """아카이브 레코드 → 인덱스 레코드 (마지막 확인 날짜가 없으면 처음 확인 날짜)"""
+        first_seen = encode_date(record['first_seen'][:10])
+        return (bytes.fromhex(record['fingerprint']), self.university_id(university_key(record['university_name'], record.get('code'))),
+                encode_date(record.get('notice_date')), record['id'], first_seen,
+                encode_date(last_seen) if last_seen else first_seen, member_offset)
+    
+    def save(self, covered_next_id: int, covered_seen_bytes: int) -> int:
+        """새 레코드와 갱신을 델타 파일에 추가 (기본 인덱스가 없거나 델타가 상한을 넘으면 병합)"""
+        if not self.is_open or len(self._delta) > self.delta_max:
+            return self.merge(covered_next_id, covered_seen_bytes)
+        if not self._unsaved and (covered_next_id, covered_seen_bytes) == (self.covered_next_id, self.covered_seen_bytes):
+            return self.count
+        
+        # 델타가 참조하는 대학 키를 먼저 기록
+        self._save_universities()
+        with open(self.delta_path, 'r+b' if self.delta_path.exists() else 'w+b') as f:
+            f.seek(HEADER.size + self._delta_count * PRIMARY.size)
+            for entry in self._unsaved:
+                f.write(PRIMARY.pack(*entry))
+            f.flush()
+            os.fsync(f.fileno())
+            # 레코드를 쓴 뒤 헤더를 갱신하므로 중단되어도 헤더의 레코드 수까지는 온전함
+            f.seek(0)
+            f.write(HEADER.pack(DELTA_MAGIC, self._delta_count + len(self._unsaved), covered_next_id, covered_seen_bytes))
+            f.flush()
+            os.fsync(f.fileno())
+        
+        self._delta_count += len(self._unsaved)
+        self._unsaved = []
+        self.covered_next_id, self.covered_seen_bytes = covered_next_id, covered_seen_bytes
+        return self.count
+    
+    def _save_universities(self):
+        """대학 키 목록 저장 (원자적 교체, 목록은 뒤에만 추가되므로 늘었을 때만)"""
+        if len(self.universities) == self._saved_universities and self.universities_path.exists():
+            return
+        self.dir.mkdir(parents=True, exist_ok=True)
+        temp_path = self.universities_path.with_suffix('.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.universities, f, ensure_ascii=False)
+        os.replace(temp_path, self.universities_path)
+        self._saved_universities = len(self.universities)
+    
+    def merge(self, covered_next_id: int, covered_seen_bytes: int) -> int:
+        """델타를 기본/보조 인덱스에 병합해 다시 작성 (정렬된 기존 파일과 스트리밍 병합하므로 메모리는 델타 크기에 비례)"""
+        delta = sorted(self._delta.values())
+        self.dir.mkdir(parents=True, exist_ok=True)
+        primary_temp = self.primary_path.with_suffix('.tmp')
+        secondary_temp = self.secondary_path.with_suffix('.tmp')
+        
+        count = 0
+        with open(primary_temp, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, 0, covered_next_id, covered_seen_bytes))
+            for entry in self._merged_entries(delta):
+                f.write(PRIMARY.pack(*entry))
+                count += 1
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, count, covered_next_id, covered_seen_bytes))
+        
+        # 보조 인덱스의 키는 바뀌지 않으므로 새 레코드만 정렬해 기존 파일과 병합
+        added = sorted((entry[1], entry[2], entry[3], entry[6]) for entry in delta if entry[3] >= self._main_next_id)
+        secondary_count = 0
+        with open(secondary_temp, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, 0, covered_next_id, covered_seen_bytes))
+            for item in heapq.merge(self._secondary_items(), added):
+                f.write(SECONDARY.pack(*item))
+                secondary_count += 1
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, secondary_count, covered_next_id, covered_seen_bytes))
+        
+        self._save_universities()
+        self.close()
+        os.replace(primary_temp, self.primary_path)
+        os.replace(secondary_temp, self.secondary_path)
+        if self.delta_path.exists():
+            self.delta_path.unlink()
+        
+        self.open()
+        self.logger.info(f"지문 인덱스 병합: {count}개 (델타 레코드 {len(delta)}개)")
+        return count
+    
+    def _secondary_items(self) -> Iterator[Tuple[int, int, int, int]]:
+        """보조 인덱스 레코드를 (대학, 날짜, id) 순서로 반환"""
+        for i in range(self.count if self.is_open else 0):
+            yield SECONDARY.unpack_from(self._secondary, HEADER.size + i * SECONDARY.size)
+    
+    def stats(self) -> Dict[str, Any]:
+        """리포트용 통계"""
+        if not self.is_open and not self._delta:
+            self.open()
+        return {
+            'entries': self.count + len(self._new_entries()),
+            'delta_entries': len(self._delta),
+            'universities': len(self.universities),
+            'covered_next_id': self.covered_next_id,
+            'size_bytes': sum(path.stat().st_size for path in (self.primary_path, self.secondary_path, self.delta_path)
+                              if path.exists())
+        }
+
+if __name__ == "__main__":
+    from src.utils import setup_logging, load_config
+    from src.archive import NoticeArchive
+    
+    parser = argparse.ArgumentParser(description='공지사항 지문 인덱스')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('build', help='아카이브 전체로 인덱스 다시 생성')
+    subparsers.add_parser('stats', help='인덱스 통계')
+    lookup_parser = subparsers.add_parser('lookup', help='지문 조회')
+    lookup_parser.add_argument('fingerprints', nargs='+', help='sha256 지문')
+    query_parser = subparsers.add_parser('query', help='대학/공지 날짜 범위 조회 (NDJSON 출력)')
+    query_parser.add_argument('university', help='대학 코드나 이름 (이름이면 모든 캠퍼스/게시판)')
+    query_parser.add_argument('--since', help='공지 날짜 시작 (YYYY-MM-DD)')
+    query_parser.add_argument('--until', help='공지 날짜 끝 (YYYY-MM-DD)')
+    args = parser.parse_args()
+    
+    setup_logging()
+    archive = NoticeArchive(load_config().get('archive'))
+    archive.load()
+    index = archive.fingerprint_index
+    
+    if args.command == 'build':
+        print(json.dumps(archive.rebuild_fingerprint_index(), ensure_ascii=False, indent=2))
+    elif args.command == 'stats':
+        archive.ensure_index()
+        print(json.dumps(index.stats(), ensure_ascii=False, indent=2))
+    elif args.command == 'lookup':
+        archive.ensure_index()
+        for fingerprint in args.fingerprints:
+            sys.stdout.write(json.dumps(index.lookup(fingerprint), ensure_ascii=False) + '\n')
+    else:
+        for record in archive.iter_notices(args.university, args.since, args.until):
+            sys.stdout.write(json.dumps(record, ensure_ascii=False) + '\n')
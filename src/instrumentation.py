@@ -0,0 +1,140 @@
+"""
+크롤링 단계별 계측 모듈
+fetch, parse, 전략 시도, DB 저장 등 각 단계의 소요 시간을 수집하고 히스토그램으로 집계
+"""
+
+import math
+import time
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List, Any, Optional
+
+class _NullSpan:
+    """계측 비활성화 시 사용하는 빈 스팬"""
+    
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+    
+    def set(self, key: str, value: Any):
+        """속성 기록 (비활성화 상태에서는 무시)"""
+        pass
+
+NULL_SPAN = _NullSpan()
+
+class _StageSpan:
+    """단일 단계 소요 시간 측정 스팬"""
+    
+    __slots__ = ('timer', 'stage', 'university', 'attributes', 'start', 'trace_span')
+    
+    def __init__(self, timer: 'StageTimer', stage: str, university: Optional[str], attributes: Dict[str, Any]):
+        self.timer = timer
+        self.stage = stage
+        self.university = university
+        self.attributes = attributes
+        self.start = 0.0
+        self.trace_span = None
+    
+    def __enter__(self):
+        tracer = self.timer.tracer
+        if tracer is not None and tracer.enabled:
+            if self.university:
+                self.attributes.setdefault('university', self.university)
+            self.trace_span = tracer.start_span(self.stage, self.attributes)
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.timer.enabled:
+            self.timer.record(self.stage, time.perf_counter() - self.start, self.university)
+        if self.trace_span is not None:
+            self.timer.tracer.end_span(self.trace_span, exc_val)
+        return False
+    
+    def set(self, key: str, value: Any):
+        """스팬 속성 기록 (트레이스 이벤트의 args로 출력)"""
+        if self.trace_span is not None:
+            self.trace_span.attributes[key] = value
+
+class StageTimer:
+    """크롤링 단계별 소요 시간 수집기"""
+    
+    def __init__(self, enabled: bool = True, tracer=None):
+        self.enabled = enabled
+        self.tracer = tracer
+        # 스팬에 대학을 지정하지 않으면 이 스레드에서 크롤링 중인 대학으로 기록
+        # (스풀 저장 스레드 등 다른 스레드의 스팬이 메인 스레드의 대학으로 잡히지 않도록 스레드별로 유지)
+        self._local = threading.local()
+        self.stage_durations: Dict[str, List[float]] = defaultdict(list)
+        self.university_durations: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(list))
+    
+    @property
+    def current_university(self) -> Optional[str]:
+        """현재 스레드에서 처리 중인 대학"""
+        return getattr(self._local, 'university', None)
+    
+    @current_university.setter
+    def current_university(self, university: Optional[str]):
+        self._local.university = university
+    
+    @contextmanager
+    def university_scope(self, university: Optional[str]):
+        """블록 안의 스팬을 지정한 대학으로 기록 (None이면 대학별 집계 제외, 여러 대학의 행을 한 번에 저장할 때 사용)"""
+        previous = self.current_university
+        self.current_university = university
+        try:
+            yield
+        finally:
+            self.current_university = previous
+    
+    def span(self, stage: str, university: str = None, **attributes):
+        """단계 측정용 컨텍스트 매니저 반환"""
+        if not self.enabled and (self.tracer is None or not self.tracer.enabled):
+            return NULL_SPAN
+        return _StageSpan(self, stage, university or self.current_university, attributes)
+    
+    def record(self, stage: str, seconds: float, university: str = None):
+        """측정된 소요 시간 기록"""
+        self.stage_durations[stage].append(seconds)
+        if university:
+            self.university_durations[university][stage].append(seconds)
+    
+    def summary(self) -> Dict[str, Any]:
+        """단계별, 대학별 히스토그램 요약 반환"""
+        return {
+            'stages': {
+                stage: summarize_durations(durations)
+                for stage, durations in self.stage_durations.items()
+            },
+            'universities': {
+                university: {
+                    stage: summarize_durations(durations)
+                    for stage, durations in stages.items()
+                }
+                for university, stages in self.university_durations.items()
+            }
+        }
+
+def percentile(sorted_values: List[float], ratio: float) -> float:
+    """정렬된 값에서 백분위수 계산 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    
+    index = max(math.ceil(ratio * len(sorted_values)) - 1, 0)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+def summarize_durations(durations: List[float]) -> Dict[str, float]:
+    """소요 시간 목록을 p50/p95/max 히스토그램으로 요약 (초)"""
+    values = sorted(durations)
+    return {
+        'count': len(values),
+        'total': round(sum(values), 4),
+        'p50': round(percentile(values, 0.50), 4),
+        'p95': round(percentile(values, 0.95), 4),
+        'max': round(values[-1], 4) if values else 0.0
+    }
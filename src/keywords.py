@@ -0,0 +1,167 @@
+"""
+키워드 매칭 모듈
+관련/제외 키워드와 분류 사전을 하나의 정규식(접두사 트라이)으로 컴파일하여
+공지사항 제목 묶음을 한 번에 훑고 관련성, 제외 키워드, 분류를 함께 반환
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List
+
+# 기본 관련 키워드 (utils.is_notice_relevant 기본값)
+DEFAULT_RELEVANT_KEYWORDS = [
+    '공지', '안내', '모집', '전형', '입학', '합격', '발표',
+    '시험', '접수', '마감', '변경', '연기', '취소', '선발'
+]
+
+# 기본 제외 키워드 (관련 키워드가 없을 때만 적용)
+DEFAULT_EXCLUDE_KEYWORDS = ['광고', '홍보', '이벤트', '세미나', '특강']
+
+# 기본 분류 사전 (분류 이름 → 키워드 목록)
+DEFAULT_CATEGORIES = {
+    '수시': ['수시'],
+    '정시': ['정시'],
+    '편입': ['편입'],
+    '대학원': ['대학원', '석사', '박사'],
+    '재외국민': ['재외국민', '외국인'],
+    '합격자발표': ['합격자', '추가합격', '충원'],
+    '등록': ['등록금', '등록'],
+    '장학': ['장학'],
+    '기숙사': ['기숙사', '생활관']
+}
+
+# 일치 목록별 결과 캐시 크기 (넘으면 비움)
+MAX_CACHED_RESULTS = 100000
+
+EMPTY_RESULT = {'relevant': False, 'matched': [], 'excluded': [], 'categories': []}
+
+def trie_pattern(terms: Iterable[str]) -> str:
+    """키워드 목록 → 접두사를 공유하는 정규식 (긴 키워드 우선)"""
+    trie: Dict[str, Any] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = True
+    
+    def build(node: Dict[str, Any]) -> str:
+        """트리 노드 하나의 정규식"""
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            # 더 긴 키워드를 먼저 시도하고 없으면 여기서 끝남
+            pattern = ('(?:' + pattern + ')?') if len(branches) == 1 else pattern + '?'
+        return pattern
+    
+    return build(trie)
+
+class KeywordMatcher:
+    """관련/제외 키워드와 분류 사전의 컴파일된 다중 키워드 매처"""
+    
+    def __init__(self, relevant: Iterable[str] = None, exclude: Iterable[str] = None,
+                 categories: Dict[str, List[str]] = None):
+        self.relevant = list(dict.fromkeys(term.lower() for term in (DEFAULT_RELEVANT_KEYWORDS if relevant is None else relevant) if term))
+        self.exclude = list(dict.fromkeys(term.lower() for term in (DEFAULT_EXCLUDE_KEYWORDS if exclude is None else exclude) if term))
+        self.categories = {
+            name: [term.lower() for term in terms if term]
+            for name, terms in (DEFAULT_CATEGORIES if categories is None else categories).items()
+        }
+        
+        terms = set(self.relevant) | set(self.exclude)
+        for category_terms in self.categories.values():
+            terms.update(category_terms)
+        
+        # 같은 위치에서는 가장 긴 키워드만 잡히므로 그 안에 포함된 짧은 키워드도 함께 기록
+        # (예: "편입학" 일치 시 "입학"도 일치)
+        self._contained = {term: frozenset(other for other in terms if other in term) for term in terms}
+        self._relevant_terms = set(self.relevant)
+        self._category_terms = {name: set(category) for name, category in self.categories.items()}
+        
+        # 키워드 첫 글자 하나를 소비한 뒤 그 위치에서 전방 탐색하여 겹치는 키워드도 모두 찾음
+        # (첫 글자 문자 집합으로 시작하므로 정규식 엔진이 나머지 위치를 빠르게 건너뜀)
+        # 줄바꿈은 묶음 처리에서 제목 경계 표시로 함께 일치시킴
+        self._pattern = re.compile(
+            '[' + ''.join(re.escape(char) for char in sorted({term[0] for term in terms} | {'\n'})) + ']'
+            '(?<=(?=(' + trie_pattern(terms | {'\n'}) + ')).)',
+            re.DOTALL
+        )
+        self._groups: Dict[str, Dict[str, Any]] = {}
+        self._results: Dict[FrozenSet[str], Dict[str, Any]] = {}
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any] = None) -> 'KeywordMatcher':
+        """설정의 keywords 섹션으로 생성 (없는 항목은 기본값)"""
+        config = config or {}
+        return cls(config.get('relevant'), config.get('exclude'), config.get('categories'))
+    
+    def matches(self, text: str) -> FrozenSet[str]:
+        """텍스트에 포함된 모든 키워드"""
+        if not text:
+            return frozenset()
+        return frozenset(term for found in self._pattern.findall(text.replace('\n', ' ').lower()) for term in self._contained[found])
+    
+    def tag(self, title: str) -> Dict[str, Any]:
+        """제목 하나의 관련성, 제외 키워드, 분류 (결과 사전은 공유되므로 수정하지 말 것)"""
+        if not title:
+            return EMPTY_RESULT
+        key = frozenset(self._pattern.findall(title.replace('\n', ' ').lower()))
+        result = self._results.get(key)
+        if result is None:
+            if len(self._results) > MAX_CACHED_RESULTS:
+                self._results.clear()
+            result = self._results[key] = self._result(key)
+        return result
+    
+    def tag_many(self, titles: List[str]) -> List[Dict[str, Any]]:
+        """제목 묶음을 줄바꿈으로 이어 정규식 한 번으로 훑고 제목별 결과 반환 (결과 사전은 공유되므로 수정하지 말 것)"""
+        if not titles:
+            return []
+        
+        lowered = '\n'.join(title.replace('\n', ' ').lower() if title else '' for title in titles)
+        # 일치한 키워드를 \x00으로 이으면 줄바꿈 단위로 제목별 일치 목록이 됨
+        groups = '\x00'.join(self._pattern.findall(lowered)).split('\n')
+        groups_cache, results = self._groups, self._results
+        if len(groups_cache) > MAX_CACHED_RESULTS:
+            groups_cache.clear()
+            results.clear()
+        
+        # 제목은 대부분 달라도 일치 목록과 키워드 조합은 반복되므로 목록별, 조합별 결과를 재사용
+        tagged = []
+        for group, title in zip(groups, titles):
+            result = groups_cache.get(group)
+            if result is None:
+                key = frozenset(group.split('\x00'))
+                result = results.get(key)
+                if result is None:
+                    result = results[key] = self._result(key)
+                groups_cache[group] = result
+            tagged.append(result if title else EMPTY_RESULT)
+        return tagged
+    
+    def _result(self, found: FrozenSet[str]) -> Dict[str, Any]:
+        """제목 하나에서 일치한 키워드 → 결과"""
+        terms = {term for keyword in found if keyword for term in self._contained[keyword]}
+        matched = [term for term in self.relevant if term in terms]
+        excluded = [term for term in self.exclude if term in terms]
+        return {
+            # 관련 키워드가 있으면 관련, 없으면 제외 키워드가 없을 때만 관련 (기존 is_notice_relevant 규칙)
+            'relevant': bool(matched) or not excluded,
+            'matched': matched,
+            'excluded': excluded,
+            'categories': [name for name, category in self._category_terms.items() if category & terms]
+        }
+    
+    def is_relevant(self, title: str) -> bool:
+        """제목의 관련성"""
+        return self.tag(title)['relevant']
+    
+    def count(self, text: str) -> int:
+        """텍스트에 포함된 관련 키워드 수"""
+        return len(self._relevant_terms & self.matches(text))
+
+@lru_cache(maxsize=32)
+def cached_matcher(relevant: tuple = None, exclude: tuple = None) -> KeywordMatcher:
+    """키워드 목록별 매처 (같은 목록은 한 번만 컴파일)"""
+    return KeywordMatcher(relevant, exclude, {})
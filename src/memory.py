@@ -0,0 +1,87 @@
+"""
+메모리 추적 모듈
+대학별 최대 메모리 사용량을 RSS 샘플링 또는 tracemalloc으로 기록
+"""
+
+import logging
+import tracemalloc
+from typing import Dict, Any, Optional
+
+from .utils import memory_usage
+
+class MemoryTracker:
+    """대학별 최대 메모리 사용량 추적기"""
+    
+    def __init__(self, config: Dict[str, Any] = None):
+        self.logger = logging.getLogger(__name__)
+        config = config or {}
+        # 'rss' (psutil 샘플링), 'tracemalloc', 'off'
+        self.mode = config.get('tracking', 'rss')
+        self.max_page_bytes = config.get('max_page_bytes')
+        self.peaks: Dict[str, Dict[str, Any]] = {}
+        self._university: Optional[str] = None
+        self._baseline = 0
+        self._peak = 0
+        self._started_tracing = False
+    
+    def start(self, university: str):
+        """대학 단위 측정 시작"""
+        self._university = university
+        
+        if self.mode == 'tracemalloc':
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+            self._baseline = tracemalloc.get_traced_memory()[0]
+            self._peak = self._baseline
+        elif self.mode == 'rss':
+            self._baseline = self._current_rss()
+            self._peak = self._baseline
+    
+    def sample(self):
+        """현재 메모리 사용량을 샘플링하여 최대값 갱신"""
+        if self.mode == 'rss' and self._university:
+            self._peak = max(self._peak, self._current_rss())
+    
+    def finish(self, university: str, **details):
+        """대학 단위 측정 종료 후 최대값 기록"""
+        if self.mode == 'off' or self._university != university:
+            return
+        
+        if self.mode == 'tracemalloc':
+            self._peak = max(self._peak, tracemalloc.get_traced_memory()[1])
+        else:
+            self.sample()
+        
+        record = {
+            'peak_bytes': self._peak,
+            'delta_bytes': self._peak - self._baseline
+        }
+        record.update(details)
+        self.peaks[university] = record
+        self._university = None
+    
+    def exceeds_page_limit(self, size: int) -> bool:
+        """페이지 크기가 설정된 상한을 넘는지 확인"""
+        return bool(self.max_page_bytes) and size > self.max_page_bytes
+    
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """대학별 최대 메모리 사용량 반환 (증가량이 큰 순)"""
+        return dict(sorted(self.peaks.items(), key=lambda item: item[1]['delta_bytes'], reverse=True))
+    
+    def close(self):
+        """직접 시작한 tracemalloc 종료"""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+    
+    def _current_rss(self) -> int:
+        """현재 프로세스 RSS 반환 (psutil이 없으면 0)"""
+        usage = memory_usage()
+        if 'error' in usage:
+            if self.mode == 'rss':
+                self.logger.warning(f"RSS 측정 불가, 메모리 추적 비활성화: {usage['error']}")
+                self.mode = 'off'
+            return 0
+        return usage['rss']
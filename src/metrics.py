@@ -0,0 +1,145 @@
+"""
+크롤링 지표 내보내기 모듈
+크롤러와 데이터베이스 카운터, 단계별 지연 시간을 OpenMetrics 텍스트 형식으로 출력
+"""
+
+import os
+import time
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+
+# 단계별 지연 시간 히스토그램 버킷 (초)
+DEFAULT_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0]
+
+class MetricsExporter:
+    """OpenMetrics 형식 크롤링 지표 내보내기"""
+    
+    def __init__(self, crawler, db_manager=None, buckets: List[float] = None):
+        self.logger = logging.getLogger(__name__)
+        self.crawler = crawler
+        self.db_manager = db_manager
+        self.buckets = sorted(buckets or DEFAULT_BUCKETS)
+        self.started_at = time.time()
+        self.server: Optional[ThreadingHTTPServer] = None
+    
+    def render(self) -> str:
+        """현재 지표를 OpenMetrics 텍스트로 변환"""
+        stats = self.crawler.get_stats()
+        failed = stats.get('failed', 0)
+        succeeded = sum(count for method, count in stats.items() if method != 'failed')
+        
+        lines: List[str] = []
+        self._counter(lines, 'crawler_universities_attempted', '크롤링을 시도한 대학 수', succeeded + failed)
+        self._counter(lines, 'crawler_universities_succeeded', '크롤링에 성공한 대학 수', succeeded)
+        self._counter(lines, 'crawler_universities_failed', '크롤링에 실패한 대학 수', failed)
+        self._counter(lines, 'crawler_notices_extracted', '추출된 공지사항 수', self.crawler.notices_extracted)
+        self._counter(lines, 'crawler_fetched_bytes', '다운로드한 응답 본문 바이트 수', self.crawler.bytes_fetched)
+        
+        lines.append('# TYPE crawler_method counter')
+        lines.append('# HELP crawler_method 성공한 크롤링 방법별 대학 수')
+        for method, count in stats.items():
+            if method != 'failed':
+                lines.append(f'crawler_method_total{{method="{_escape(method)}"}} {count}')
+        
+        if self.db_manager is not None:
+            self._counter(lines, 'crawler_notices_inserted', '데이터베이스에 저장된 공지사항 수', self.db_manager.inserted_count)
+            self._counter(lines, 'crawler_db_round_trips', '데이터베이스 요청 왕복 횟수', self.db_manager.round_trips)
+        
+        self._stage_histogram(lines, self.crawler.stage_timer.stage_durations)
+        
+        lines.append('# TYPE crawler_run_start_timestamp_seconds gauge')
+        lines.append('# HELP crawler_run_start_timestamp_seconds 실행 시작 시각 (유닉스 시간)')
+        lines.append(f'crawler_run_start_timestamp_seconds {self.started_at:.3f}')
+        
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+    
+    def _counter(self, lines: List[str], name: str, help_text: str, value: float):
+        """카운터 지표 추가"""
+        lines.append(f'# TYPE {name} counter')
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'{name}_total {value}')
+    
+    def _stage_histogram(self, lines: List[str], stage_durations: Dict[str, List[float]]):
+        """단계별 지연 시간 히스토그램 추가"""
+        name = 'crawler_stage_duration_seconds'
+        lines.append(f'# TYPE {name} histogram')
+        lines.append(f'# HELP {name} 크롤링 단계별 소요 시간')
+        
+        for stage, durations in sorted(stage_durations.items()):
+            label = f'stage="{_escape(stage)}"'
+            values = sorted(durations)
+            index = 0
+            for bound in self.buckets:
+                while index < len(values) and values[index] <= bound:
+                    index += 1
+                lines.append(f'{name}_bucket{{{label},le="{bound}"}} {index}')
+            lines.append(f'{name}_bucket{{{label},le="+Inf"}} {len(values)}')
+            lines.append(f'{name}_sum{{{label}}} {sum(values):.6f}')
+            lines.append(f'{name}_count{{{label}}} {len(values)}')
+    
+    def write_textfile(self, path: str = 'logs/crawler.prom') -> Optional[str]:
+        """textfile collector용 파일로 저장 (원자적 교체)"""
+        try:
+            target = Path(path)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = target.with_suffix(target.suffix + '.tmp')
+            
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(self.render())
+            os.replace(temp_path, target)
+            
+            self.logger.info(f"지표 파일 저장 완료: {target}")
+            return str(target)
+        
+        except Exception as e:
+            self.logger.error(f"지표 파일 저장 실패: {str(e)}")
+            return None
+    
+    def serve(self, port: int, host: str = '127.0.0.1') -> Optional[ThreadingHTTPServer]:
+        """백그라운드 스레드에서 /metrics HTTP 엔드포인트 실행"""
+        exporter = self
+        
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                
+                body = exporter.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                exporter.logger.debug(format % args)
+        
+        try:
+            self.server = ThreadingHTTPServer((host, port), MetricsHandler)
+            thread = threading.Thread(target=self.server.serve_forever, name='metrics-server', daemon=True)
+            thread.start()
+            
+            self.logger.info(f"지표 엔드포인트 시작: http://{host}:{port}/metrics")
+            return self.server
+        
+        except Exception as e:
+            self.logger.error(f"지표 엔드포인트 시작 실패: {str(e)}")
+            return None
+    
+    def shutdown(self):
+        """HTTP 엔드포인트 종료"""
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+def _escape(value: Any) -> str:
+    """라벨 값 이스케이프"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,155 @@
+"""
+스키마 마이그레이션 모듈
+migrations/ 의 번호가 붙은 SQL 파일을 순서대로 적용하고 적용 이력을 DB에 기록
+"""
+
+import os
+import re
+import sys
+import json
+import logging
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+# 번호가 붙은 마이그레이션 파일 (예: 003_query_pattern_indexes.sql)
+MIGRATION_FILE = re.compile(r'^(\d+)_[\w-]+\.sql$')
+
+# 동시에 실행된 러너가 같은 마이그레이션을 두 번 적용하지 않도록 잡는 advisory lock 키
+LOCK_KEY = 727420044
+
+class MigrationRunner:
+    """PostgreSQL 마이그레이션 러너 (psycopg 필요)"""
+    
+    def __init__(self, database_url: str = None, config: Dict[str, Any] = None, schema: str = None):
+        self.logger = logging.getLogger(__name__)
+        config = config or {}
+        self.database_url = database_url or os.getenv('DATABASE_URL')
+        self.directory = Path(config.get('dir', 'migrations'))
+        self.history_table = config.get('history_table', 'schema_migrations')
+        self.schema = schema
+        self.conn = None
+    
+    def connect(self):
+        """DB 연결 (자동 커밋, 각 파일이 자체 트랜잭션을 가짐)"""
+        if self.conn is not None:
+            return self.conn
+        if not self.database_url:
+            raise ValueError("DATABASE_URL이 설정되지 않음")
+        
+        try:
+            import psycopg
+        except ImportError:
+            raise RuntimeError("마이그레이션 실행에는 psycopg가 필요함 (pip install 'psycopg[binary]')")
+        
+        self.conn = psycopg.connect(self.database_url, autocommit=True)
+        if self.schema:
+            self.conn.execute(f'CREATE SCHEMA IF NOT EXISTS "{self.schema}"')
+            self.conn.execute(f'SET search_path TO "{self.schema}", public')
+        
+        self.conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {self.history_table} (
+                version TEXT PRIMARY KEY,
+                applied_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+            )
+        """)
+        return self.conn
+    
+    def available(self) -> List[Path]:
+        """번호 순서로 정렬된 마이그레이션 파일 목록 (optional/ 제외)"""
+        files = [path for path in self.directory.glob('*.sql') if MIGRATION_FILE.match(path.name)]
+        return sorted(files, key=lambda path: int(MIGRATION_FILE.match(path.name).group(1)))
+    
+    def applied(self) -> List[str]:
+        """적용된 마이그레이션 버전 목록"""
+        rows = self.connect().execute(f"SELECT version FROM {self.history_table} ORDER BY applied_at, version").fetchall()
+        return [row[0] for row in rows]
+    
+    def pending(self) -> List[Path]:
+        """아직 적용되지 않은 마이그레이션 파일 목록"""
+        applied = set(self.applied())
+        return [path for path in self.available() if path.stem not in applied]
+    
+    def apply(self, target: str = None) -> List[str]:
+        """대기 중인 마이그레이션을 순서대로 적용 (target 번호까지만 적용 가능)"""
+        conn = self.connect()
+        conn.execute("SELECT pg_advisory_lock(%s)", (LOCK_KEY,))
+        try:
+            applied = []
+            for path in self.pending():
+                if target is not None and int(MIGRATION_FILE.match(path.name).group(1)) > int(target):
+                    break
+                self._apply_file(path, path.stem)
+                applied.append(path.stem)
+            
+            if not applied:
+                self.logger.info("적용할 마이그레이션 없음")
+            return applied
+        finally:
+            conn.execute("SELECT pg_advisory_unlock(%s)", (LOCK_KEY,))
+    
+    def apply_optional(self, name: str) -> Optional[str]:
+        """optional/ 의 마이그레이션 적용 (이미 적용했으면 무시)"""
+        path = self.directory / 'optional' / f"{Path(name).stem}.sql"
+        if not path.exists():
+            raise FileNotFoundError(f"선택 마이그레이션 없음: {path}")
+        
+        version = f"optional/{path.stem}"
+        if version in self.applied():
+            self.logger.info(f"{version} 이미 적용됨")
+            return None
+        
+        conn = self.connect()
+        conn.execute("SELECT pg_advisory_lock(%s)", (LOCK_KEY,))
+        try:
+            self._apply_file(path, version)
+            return version
+        finally:
+            conn.execute("SELECT pg_advisory_unlock(%s)", (LOCK_KEY,))
+    
+    def _apply_file(self, path: Path, version: str):
+        """SQL 파일 실행 후 이력 기록 (실패 시 열린 트랜잭션 롤백 후 예외 전달)"""
+        self.logger.info(f"마이그레이션 적용: {version}")
+        sql = path.read_text(encoding='utf-8')
+        
+        try:
+            # 파라미터 없이 실행하면 여러 문장을 한 번에 보낼 수 있음
+            self.conn.execute(sql)
+        except Exception as e:
+            self.conn.execute("ROLLBACK")
+            self.logger.error(f"마이그레이션 실패 ({version}): {str(e)}")
+            raise
+        
+        self.conn.execute(f"INSERT INTO {self.history_table} (version) VALUES (%s)", (version,))
+    
+    def status(self) -> Dict[str, Any]:
+        """적용/대기 마이그레이션 요약"""
+        return {
+            'applied': self.applied(),
+            'pending': [path.stem for path in self.pending()]
+        }
+    
+    def close(self):
+        """연결 종료"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+if __name__ == "__main__":
+    from src.utils import setup_logging, load_config
+    
+    setup_logging()
+    runner = MigrationRunner(config=load_config().get('migrations'))
+    command = sys.argv[1] if len(sys.argv) > 1 else 'status'
+    
+    try:
+        if command == 'status':
+            print(json.dumps(runner.status(), ensure_ascii=False, indent=2))
+        elif command == 'apply':
+            print(json.dumps(runner.apply(sys.argv[2] if len(sys.argv) > 2 else None), ensure_ascii=False))
+        elif command == 'apply-optional' and len(sys.argv) > 2:
+            print(json.dumps(runner.apply_optional(sys.argv[2]), ensure_ascii=False))
+        else:
+            print("사용법: python -m src.migrations [status | apply [번호] | apply-optional <이름>]")
+            sys.exit(1)
+    finally:
+        runner.close()
@@ -11,6 +11,8 @@ from bs4 import BeautifulSoup, Tag
 from datetime import datetime
 import difflib
 
+from .keywords import KeywordMatcher
+
 class PatternDetector:
     """공지사항 패턴 자동 감지 클래스"""
     
@@ -19,6 +21,7 @@ class PatternDetector:
         self.logger = logging.getLogger(__name__)
         self.date_patterns = [re.compile(pattern) for pattern in config['patterns']['date_patterns']]
         self.notice_keywords = config['patterns']['notice_keywords']
+        self.keyword_matcher = KeywordMatcher(self.notice_keywords, [], {})
         
     def detect_notice_structure(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """공지사항 구조 자동 감지"""
@@ -339,8 +342,7 @@ class PatternDetector:
             score += 0.1  # 너무 길면 감점
         
         # 공지사항 관련 키워드
-        element_text = structure['element'].get_text().lower()
-        keyword_count = sum(1 for keyword in self.notice_keywords if keyword in element_text)
+        keyword_count = self.keyword_matcher.count(structure['element'].get_text())
         if keyword_count > 0:
             score += 0.1
         
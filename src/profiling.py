@@ -0,0 +1,133 @@
+"""
+프로파일링 모듈
+선택한 대학 또는 실행 전체를 cProfile과 tracemalloc으로 측정하여 logs/에 저장
+"""
+
+import io
+import time
+import pstats
+import logging
+import cProfile
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any
+
+from .utils import sanitize_filename
+
+class CrawlProfiler:
+    """대학별/실행 전체 프로파일러"""
+    
+    def __init__(self, config: Dict[str, Any] = None):
+        self.logger = logging.getLogger(__name__)
+        config = config or {}
+        self.universities = set(config.get('universities', []))
+        self.profile_all = 'all' in self.universities
+        self.profile_whole_run = config.get('run', False)
+        self.top_n = config.get('top_n', 40)
+        self.trace_memory = config.get('tracemalloc', True)
+        self.output_dir = Path(config.get('output_dir', 'logs'))
+        self.run_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.profiles: List[Dict[str, Any]] = []
+        self._active = False
+    
+    def should_profile(self, univ_name: str) -> bool:
+        """해당 대학을 프로파일링할지 판단"""
+        return self.profile_all or univ_name in self.universities
+    
+    def profile_university(self, univ_name: str):
+        """대학 단위 프로파일링 컨텍스트 반환"""
+        if not self.should_profile(univ_name):
+            return nullcontext()
+        return self.profile(univ_name)
+    
+    def profile_run(self):
+        """실행 전체 프로파일링 컨텍스트 반환"""
+        if not self.profile_whole_run:
+            return nullcontext()
+        return self.profile('run')
+    
+    @contextmanager
+    def profile(self, target: str):
+        """cProfile과 tracemalloc으로 블록 측정"""
+        # cProfile은 중첩 실행이 불가능하므로 바깥 프로파일에 포함시킴
+        if self._active:
+            self.logger.debug(f"{target}: 이미 프로파일링 중이므로 건너뜀")
+            yield
+            return
+        
+        started_tracing = False
+        start_snapshot = None
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(10)
+                started_tracing = True
+            tracemalloc.reset_peak()
+            start_snapshot = tracemalloc.take_snapshot()
+        
+        profiler = cProfile.Profile()
+        self._active = True
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - started
+            self._active = False
+            
+            end_snapshot = None
+            peak_memory = None
+            if self.trace_memory:
+                end_snapshot = tracemalloc.take_snapshot()
+                peak_memory = tracemalloc.get_traced_memory()[1]
+                if started_tracing:
+                    tracemalloc.stop()
+            
+            self._write_profile(target, profiler, elapsed, start_snapshot, end_snapshot, peak_memory)
+    
+    def _write_profile(self, target: str, profiler: cProfile.Profile, elapsed: float,
+                       start_snapshot, end_snapshot, peak_memory):
+        """정렬된 통계와 메모리 할당 상위 항목을 파일로 저장"""
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            base_name = f"profile_{self.run_timestamp}_{sanitize_filename(target)}"
+            
+            # 원본 통계 (snakeviz, pstats로 재분석 가능)
+            raw_path = self.output_dir / f"{base_name}.prof"
+            profiler.dump_stats(str(raw_path))
+            
+            # 누적 시간, 자체 시간 기준 정렬 통계
+            buffer = io.StringIO()
+            stats = pstats.Stats(profiler, stream=buffer).strip_dirs()
+            buffer.write(f"대상: {target}\n소요 시간: {elapsed:.3f}초\n\n")
+            stats.sort_stats('cumulative').print_stats(self.top_n)
+            stats.sort_stats('tottime').print_stats(self.top_n)
+            
+            stats_path = self.output_dir / f"{base_name}.txt"
+            stats_path.write_text(buffer.getvalue(), encoding='utf-8')
+            
+            profile_info = {
+                'target': target,
+                'elapsed': round(elapsed, 3),
+                'stats': str(stats_path),
+                'raw': str(raw_path)
+            }
+            
+            # 메모리 할당 상위 항목 (블록 실행 중 증가분 기준)
+            if start_snapshot is not None and end_snapshot is not None:
+                memory_path = self.output_dir / f"{base_name}_memory.txt"
+                top_stats = end_snapshot.compare_to(start_snapshot, 'lineno')[:self.top_n]
+                lines = [f"대상: {target}", f"최대 추적 메모리: {peak_memory} bytes", ""]
+                lines.extend(str(stat) for stat in top_stats)
+                memory_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+                
+                profile_info['memory'] = str(memory_path)
+                profile_info['peak_memory'] = peak_memory
+            
+            self.profiles.append(profile_info)
+            self.logger.info(f"{target}: 프로파일 저장 완료 ({stats_path})")
+        
+        except Exception as e:
+            self.logger.error(f"{target}: 프로파일 저장 실패: {str(e)}")
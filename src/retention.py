@@ -0,0 +1,150 @@
+"""
+보관 기간 정리 모듈
+오래된 공지사항을 id 순서로 일정 크기씩 삭제하고 진행 상황을 체크포인트로 남겨 중단 후 이어서 실행
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+class RetentionJob:
+    """청크 단위 재개 가능한 보관 기간 정리 작업"""
+    
+    def __init__(self, db_manager, config: Dict[str, Any] = None):
+        self.logger = logging.getLogger(__name__)
+        self.db_manager = db_manager
+        config = config or {}
+        self.days = config.get('days', 365)
+        self.chunk_size = config.get('chunk_size', 500)
+        self.pause_seconds = config.get('pause_seconds', 0.5)
+        self.max_runtime = config.get('max_runtime_seconds')
+        checkpoint_file = config.get('checkpoint_file', 'data/retention_checkpoint.json')
+        self.checkpoint_file = Path(checkpoint_file) if checkpoint_file else None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_result: Optional[Dict[str, Any]] = None
+    
+    def run(self) -> Dict[str, Any]:
+        """정리 실행 (중지 요청, 최대 실행 시간 도달 시 체크포인트 저장 후 종료)"""
+        checkpoint = self._load_checkpoint()
+        if checkpoint:
+            # 이전 실행이 끝나지 않았으면 같은 기준 시각으로 이어서 삭제
+            cutoff = checkpoint['cutoff']
+            after_id = checkpoint['last_id']
+            deleted = checkpoint['deleted']
+            self.logger.info(f"보관 기간 정리 재개: id {after_id} 이후, 누적 {deleted}개 삭제")
+        else:
+            cutoff = (datetime.now() - timedelta(days=self.days)).isoformat()
+            after_id = 0
+            deleted = 0
+        
+        started = time.monotonic()
+        chunks = 0
+        completed = False
+        
+        try:
+            while not self._stop.is_set():
+                chunk_deleted, next_id = self.db_manager.delete_expired_chunk(cutoff, after_id, self.chunk_size)
+                deleted += chunk_deleted
+                chunks += 1
+                
+                if next_id is None:
+                    completed = True
+                    break
+                
+                after_id = next_id
+                self._save_checkpoint(cutoff, after_id, deleted)
+                
+                if self.max_runtime and time.monotonic() - started >= self.max_runtime:
+                    self.logger.info("최대 실행 시간 도달, 다음 실행에서 재개")
+                    break
+                
+                # 다른 쿼리가 잠금을 기다리지 않도록 묶음 사이에 쉼
+                self._stop.wait(self.pause_seconds)
+        
+        except Exception as e:
+            self.logger.error(f"보관 기간 정리 중 오류: {str(e)}")
+        
+        if completed:
+            self._clear_checkpoint()
+        
+        self.last_result = {
+            'cutoff': cutoff,
+            'deleted': deleted,
+            'chunks': chunks,
+            'last_id': after_id,
+            'completed': completed,
+            'elapsed': round(time.monotonic() - started, 3)
+        }
+        self.logger.info(f"{self.days}일 이전 공지사항 {deleted}개 삭제 (완료: {completed})")
+        return self.last_result
+    
+    def start_background(self) -> threading.Thread:
+        """백그라운드 스레드에서 정리 실행"""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name='retention-job', daemon=True)
+        self._thread.start()
+        return self._thread
+    
+    def stop(self, timeout: float = None):
+        """진행 중인 묶음까지만 처리하고 중지"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def _load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """체크포인트 로드"""
+        if not self.checkpoint_file or not self.checkpoint_file.exists():
+            return None
+        
+        try:
+            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.error(f"체크포인트 로드 실패: {str(e)}")
+            return None
+    
+    def _save_checkpoint(self, cutoff: str, last_id: int, deleted: int):
+        """체크포인트 저장 (원자적 교체)"""
+        if not self.checkpoint_file:
+            return
+        
+        try:
+            self.checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.checkpoint_file.with_suffix(self.checkpoint_file.suffix + '.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'cutoff': cutoff,
+                    'last_id': last_id,
+                    'deleted': deleted,
+                    'updated_at': datetime.now().isoformat()
+                }, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.checkpoint_file)
+        except Exception as e:
+            self.logger.error(f"체크포인트 저장 실패: {str(e)}")
+    
+    def _clear_checkpoint(self):
+        """완료 후 체크포인트 삭제"""
+        if self.checkpoint_file and self.checkpoint_file.exists():
+            self.checkpoint_file.unlink()
+
+if __name__ == "__main__":
+    from src.storage import create_storage
+    from src.utils import setup_logging, load_config
+    
+    setup_logging()
+    config = load_config()
+    retention_config = dict(config.get('retention', {}))
+    if len(sys.argv) > 1:
+        retention_config['days'] = int(sys.argv[1])
+    
+    db_manager = create_storage(config)
+    result = RetentionJob(db_manager, retention_config).run()
+    print(json.dumps(result, ensure_ascii=False, indent=2))
@@ -0,0 +1,123 @@
+"""
+크롤링 전략 라우팅 모듈
+대학별로 마지막으로 성공한 가장 저렴한 전략을 기억하고 바로 해당 전략으로 분기
+"""
+
+import json
+import logging
+from typing import Dict, Any, Optional
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 비용이 낮은 순서의 전략 목록
+STRATEGY_ORDER = ['template', 'auto_detect', 'custom', 'xhr', 'selenium']
+
+class StrategyRouter:
+    """대학별 크롤링 전략 라우팅 테이블"""
+    
+    def __init__(self, config: Dict[str, Any] = None):
+        self.logger = logging.getLogger(__name__)
+        config = config or {}
+        self.enabled = config.get('enabled', True)
+        self.routes_file = Path(config.get('routes_file', 'data/strategy_routes.json'))
+        self.recheck_interval = timedelta(hours=config.get('recheck_interval_hours', 72))
+        self.max_failures = config.get('max_failures', 2)
+        self.routes: Dict[str, Dict] = {}
+        self.dirty = False
+        
+        if self.enabled:
+            self.load_routes()
+    
+    def load_routes(self):
+        """라우팅 테이블 파일 로드"""
+        try:
+            if self.routes_file.exists():
+                with open(self.routes_file, 'r', encoding='utf-8') as f:
+                    self.routes = json.load(f)
+                self.logger.info(f"라우팅 테이블 로드 완료: {len(self.routes)}개 대학")
+        except Exception as e:
+            self.logger.error(f"라우팅 테이블 로드 실패: {str(e)}")
+            self.routes = {}
+    
+    def save_routes(self) -> bool:
+        """변경된 라우팅 테이블을 파일에 저장"""
+        if not self.enabled or not self.dirty:
+            return False
+        
+        try:
+            self.routes_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.routes_file, 'w', encoding='utf-8') as f:
+                json.dump(self.routes, f, ensure_ascii=False, indent=2, sort_keys=True)
+            
+            self.dirty = False
+            self.logger.info(f"라우팅 테이블 저장 완료: {self.routes_file}")
+            return True
+        
+        except Exception as e:
+            self.logger.error(f"라우팅 테이블 저장 실패: {str(e)}")
+            return False
+    
+    def get_route(self, univ_name: str) -> Optional[Dict]:
+        """대학의 저장된 전략 반환"""
+        if not self.enabled:
+            return None
+        return self.routes.get(univ_name)
+    
+    def needs_full_check(self, univ_name: str) -> bool:
+        """저렴한 전략들을 다시 확인할 시점인지 판단"""
+        route = self.get_route(univ_name)
+        if not route or not route.get('last_full_check'):
+            return True
+        
+        try:
+            last_check = datetime.fromisoformat(route['last_full_check'])
+        except ValueError:
+            return True
+        
+        return datetime.now() - last_check >= self.recheck_interval
+    
+    def record_success(self, univ_name: str, strategy: str, endpoint: str = None, full_check: bool = False):
+        """성공한 전략 기록"""
+        if not self.enabled:
+            return
+        
+        now = datetime.now().isoformat()
+        route = self.routes.get(univ_name, {})
+        route.update({
+            'strategy': strategy,
+            'last_success': now,
+            'failures': 0
+        })
+        
+        if endpoint:
+            route['endpoint'] = endpoint
+        if full_check:
+            route['last_full_check'] = now
+        
+        self.routes[univ_name] = route
+        self.dirty = True
+    
+    def record_failure(self, univ_name: str):
+        """저장된 전략 실패 기록 (연속 실패 시 라우팅 해제)"""
+        route = self.get_route(univ_name)
+        if not route:
+            return
+        
+        route['failures'] = route.get('failures', 0) + 1
+        if route['failures'] >= self.max_failures:
+            # XHR 엔드포인트는 수동 설정일 수 있으므로 유지
+            self.logger.info(f"{univ_name}: 저장된 전략({route['strategy']}) 연속 실패로 라우팅 해제")
+            route.pop('strategy', None)
+            route.pop('last_full_check', None)
+            route['failures'] = 0
+        
+        self.dirty = True
+    
+    def get_route_stats(self) -> Dict[str, int]:
+        """전략별 라우팅된 대학 수 반환"""
+        stats = {strategy: 0 for strategy in STRATEGY_ORDER}
+        for route in self.routes.values():
+            strategy = route.get('strategy')
+            if strategy in stats:
+                stats[strategy] += 1
+        return stats
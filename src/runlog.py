@@ -0,0 +1,148 @@
+"""
+실행 로그 모듈
+대학별 크롤링 결과와 추출된 공지사항을 생성되는 즉시 NDJSON으로 기록하고 요약을 스트리밍으로 계산
+"""
+
+import sys
+import json
+import time
+import logging
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional
+
+METHODS = ['auto_detect', 'template', 'custom', 'xhr', 'selenium']
+
+class RunSummary:
+    """실행 로그 레코드로부터 누적 계산하는 요약"""
+    
+    def __init__(self, total: int = 0):
+        self.total = total
+        self.success = 0
+        self.failed = 0
+        self.notices_count = 0
+        self.methods = {method: 0 for method in METHODS}
+        self.saved_by_university: Counter = Counter()
+        self.failed_universities: List[Dict[str, str]] = []
+    
+    def add(self, record: Dict[str, Any]):
+        """레코드 하나를 요약에 반영 (공지사항 레코드는 무시)"""
+        record_type = record.get('type')
+        
+        # 쓰기 버퍼 저장 결과 (대학 결과보다 늦게 도착할 수 있음)
+        if record_type == 'saved':
+            self.notices_count += record.get('saved', 0)
+            self.saved_by_university[record.get('university')] += record.get('saved', 0)
+            return
+        
+        if record_type != 'outcome':
+            return
+        
+        if record.get('success'):
+            self.success += 1
+            method = record.get('method')
+            if record.get('notices') and method in self.methods:
+                self.methods[method] += 1
+        else:
+            self.failed += 1
+            self.failed_universities.append({
+                'name': record.get('university'),
+                'url': record.get('url'),
+                'error': record.get('error')
+            })
+    
+    def to_results(self) -> Dict[str, Any]:
+        """리포트 생성용 결과 딕셔너리 반환"""
+        results = {
+            'total': self.total or self.success + self.failed,
+            'success': self.success,
+            'failed': self.failed,
+            'failed_universities': self.failed_universities,
+            'notices_count': self.notices_count,
+            'saved_by_university': dict(self.saved_by_university)
+        }
+        results.update(self.methods)
+        return results
+
+class RunLog:
+    """추가 전용 NDJSON 실행 로그"""
+    
+    def __init__(self, config: Dict[str, Any] = None):
+        self.logger = logging.getLogger(__name__)
+        config = config or {}
+        self.enabled = config.get('enabled', True)
+        self.include_notices = config.get('include_notices', True)
+        self.flush_every = config.get('flush_every', 50)
+        self.flush_interval = config.get('flush_interval_seconds', 5.0)
+        output_dir = Path(config.get('output_dir', 'logs'))
+        self.path = output_dir / f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ndjson"
+        self._file = None
+        self._pending = 0
+        self._last_flush = time.monotonic()
+    
+    def write(self, record: Dict[str, Any]):
+        """레코드 한 줄 추가 (일정 개수 또는 시간마다 디스크에 반영)"""
+        if not self.enabled:
+            return
+        if record.get('type') == 'notice' and not self.include_notices:
+            return
+        
+        try:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, 'a', encoding='utf-8')
+            
+            self._file.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+            self._pending += 1
+            
+            # 대학 단위 결과는 바로, 공지사항은 개수/시간 기준으로 반영
+            if (record.get('type') == 'outcome' or self._pending >= self.flush_every
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self.flush()
+        
+        except Exception as e:
+            self.logger.error(f"실행 로그 기록 실패: {str(e)}")
+            self.enabled = False
+    
+    def flush(self):
+        """버퍼 내용을 파일에 반영"""
+        if self._file is not None:
+            self._file.flush()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+    
+    def close(self) -> Optional[str]:
+        """실행 로그 닫기"""
+        if self._file is None:
+            return None
+        
+        self._file.close()
+        self._file = None
+        self.logger.info(f"실행 로그 저장 완료: {self.path}")
+        return str(self.path)
+
+def read_run_log(path: str) -> Iterable[Dict[str, Any]]:
+    """실행 로그 레코드를 한 줄씩 읽기 (중단된 실행의 마지막 불완전한 줄은 건너뜀)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+def summarize_run_log(path: str) -> Dict[str, Any]:
+    """실행 로그 파일로부터 요약 계산"""
+    summary = RunSummary()
+    for record in read_run_log(path):
+        summary.add(record)
+    return summary.to_results()
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("사용법: python -m src.runlog <run.ndjson>")
+        sys.exit(1)
+    
+    print(json.dumps(summarize_run_log(sys.argv[1]), ensure_ascii=False, indent=2))
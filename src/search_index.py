@@ -0,0 +1,527 @@
+"""
+공지사항 검색 인덱스 모듈
+아카이브 공지사항 제목을 한글 음절과 바이그램(영문/숫자는 단어)으로 나눈 역색인
+(세그먼트 파일마다 열 단위 문서 표, 정렬된 고정 길이 용어 사전, varint 차분 압축 포스팅을 두고
+실행마다 새 세그먼트를 추가한 뒤 일정 개수를 넘으면 병합, 세그먼트는 mmap으로 열어 시작 비용 없음)
+"""
+
+import os
+import re
+import sys
+import json
+import math
+import mmap
+import heapq
+import struct
+import hashlib
+import logging
+import argparse
+import unicodedata
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterator, Iterable, Tuple
+
+from .fingerprint_index import encode_date, decode_date
+
+MAGIC = b'NSI2'
+HEADER = struct.Struct('<4sIIIQ')  # 매직, 문서 수, 용어 수, 포스팅 바이트 수, 전체 제목 토큰 수
+# 문서 표는 열 단위: 아카이브 id(I), 대학 id(I), 공지 날짜 YYYYMMDD(I, 없으면 0), 제목 토큰 수(H)
+# (memoryview로 바로 읽으므로 리틀 엔디안 환경 기준)
+DOC_COLUMNS = ('I', 'I', 'I', 'H')
+TERM = struct.Struct('<32sIII')  # 용어 키, 문서 빈도, 포스팅 위치, 포스팅 길이
+TERM_BYTES = 32
+# 사전 키보다 긴 용어는 앞부분과 전체 해시로 구분 (긴 영문/숫자 단어끼리 포스팅을 공유하지 않도록)
+TERM_PREFIX_BYTES = 24
+
+MANIFEST_NAME = 'manifest.json'
+
+# 한글 음절 연속 구간 또는 영문/숫자 단어
+TOKEN_PATTERN = re.compile(r'[가-힣]+|[a-z0-9]+')
+
+# BM25 매개변수 (제목은 짧으므로 길이 보정은 약하게)
+BM25_K1 = 1.2
+BM25_B = 0.5
+
+def tokenize(text: str, unigrams: bool = True) -> List[str]:
+    """제목 토큰화 (한글은 음절과 두 글자씩 겹치는 바이그램, 영문/숫자는 소문자 단어)"""
+    tokens = []
+    for run in TOKEN_PATTERN.findall(unicodedata.normalize('NFKC', text or '').lower()):
+        if run[0] >= '가' and len(run) > 1:
+            # 문서에는 음절도 색인해 한 글자 검색어("수")가 긴 단어("수시") 안에서도 일치
+            # (검색어는 unigrams=False로 나눠 두 글자 이상이면 바이그램으로만 찾음)
+            if unigrams:
+                tokens.extend(run)
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run)
+    return tokens
+
+def _term_key(term: str) -> bytes:
+    """고정 길이 사전 키 (32바이트를 넘는 용어는 앞 24바이트 + 전체 blake2b 해시 8바이트)"""
+    encoded = term.encode('utf-8')
+    if len(encoded) > TERM_BYTES:
+        encoded = encoded[:TERM_PREFIX_BYTES] + hashlib.blake2b(encoded, digest_size=8).digest()
+    return encoded.ljust(TERM_BYTES, b'\0')
+
+def encode_postings(postings: Iterable[Tuple[int, int]]) -> bytes:
+    """(문서 번호, 빈도) 목록을 문서 번호 차분과 빈도의 varint로 압축"""
+    out = bytearray()
+    previous = -1
+    for doc, tf in postings:
+        for value in (doc - previous, tf):
+            while value >= 0x80:
+                out.append((value & 0x7f) | 0x80)
+                value >>= 7
+            out.append(value)
+        previous = doc
+    return bytes(out)
+
+def decode_postings(buffer, offset: int, length: int) -> Tuple[List[int], List[int]]:
+    """varint 포스팅 복원 → (문서 번호 목록, 빈도 목록)"""
+    blob = buffer[offset:offset + length]
+    if not blob:
+        return [], []
+    
+    # 차분과 빈도가 모두 한 바이트인 포스팅(대부분의 자주 쓰이는 용어)은 C 수준 연산으로만 복원
+    if max(blob) < 0x80:
+        return list(accumulate(blob[0::2], initial=-1))[1:], list(blob[1::2])
+    
+    docs, tfs = [], []
+    doc = -1
+    pending = None
+    value = shift = 0
+    for byte in blob:
+        value |= (byte & 0x7f) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        if pending is None:
+            pending = value
+        else:
+            doc += pending
+            docs.append(doc)
+            tfs.append(value)
+            pending = None
+        value = shift = 0
+    return docs, tfs
+
+class _TermKeys:
+    """mmap 용어 사전의 키를 시퀀스로 노출 (bisect용)"""
+    
+    def __init__(self, buffer, start: int, count: int):
+        self.buffer = buffer
+        self.start = start
+        self.count = count
+    
+    def __len__(self) -> int:
+        """용어 수"""
+        return self.count
+    
+    def __getitem__(self, i: int) -> bytes:
+        """i번째 용어 키"""
+        offset = self.start + i * TERM.size
+        return self.buffer[offset:offset + TERM_BYTES]
+
+class Segment:
+    """읽기 전용 세그먼트 (mmap)"""
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self.buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.columns = []
+        magic, self.doc_count, self.term_count, postings_bytes, self.total_tokens = HEADER.unpack_from(self.buffer, 0)
+        
+        # 문서 표 열은 복사 없이 memoryview로 접근
+        view = memoryview(self.buffer)
+        start = HEADER.size
+        for code in DOC_COLUMNS:
+            end = start + self.doc_count * array(code).itemsize
+            self.columns.append(view[start:end].cast(code))
+            start = end
+        view.release()
+        self.archive_ids, self.university_ids, self.dates, self.lengths = self.columns
+        
+        self.terms_start = start
+        self.postings_start = self.terms_start + self.term_count * TERM.size
+        if magic != MAGIC or len(self.buffer) != self.postings_start + postings_bytes:
+            self.close()
+            raise ValueError(f"잘못된 세그먼트 파일: {path}")
+        self._keys = _TermKeys(self.buffer, self.terms_start, self.term_count)
+    
+    def doc(self, number: int) -> Tuple[int, int, int, int]:
+        """문서 번호 → (아카이브 id, 대학 id, 날짜, 토큰 수)"""
+        return self.archive_ids[number], self.university_ids[number], self.dates[number], self.lengths[number]
+    
+    def docs(self) -> Iterator[Tuple[int, int, int, int]]:
+        """모든 문서 (아카이브 id 순서)"""
+        return zip(self.archive_ids, self.university_ids, self.dates, self.lengths)
+    
+    def term(self, term: str) -> Optional[Tuple[int, int, int]]:
+        """용어 → (문서 빈도, 포스팅 위치, 포스팅 길이)"""
+        key = _term_key(term)
+        i = bisect_left(self._keys, key)
+        if i < self.term_count and self._keys[i] == key:
+            return TERM.unpack_from(self.buffer, self.terms_start + i * TERM.size)[1:]
+        return None
+    
+    def document_frequency(self, term: str) -> int:
+        """용어가 나오는 문서 수"""
+        entry = self.term(term)
+        return entry[0] if entry else 0
+    
+    def postings(self, term: str) -> Dict[int, int]:
+        """용어의 문서 번호 → 빈도"""
+        entry = self.term(term)
+        if entry is None:
+            return {}
+        return dict(zip(*decode_postings(self.buffer, self.postings_start + entry[1], entry[2])))
+    
+    def terms(self, number: int = 0) -> Iterator[Tuple[bytes, int, int, int]]:
+        """(용어 키, 세그먼트 번호, 포스팅 위치, 포스팅 길이)를 용어 순서로 반환 (병합 시 세그먼트 구분용 번호 포함)"""
+        for i in range(self.term_count):
+            key, _, offset, length = TERM.unpack_from(self.buffer, self.terms_start + i * TERM.size)
+            yield key, number, offset, length
+    
+    def close(self):
+        """매핑 해제 (열 memoryview를 먼저 해제해야 mmap을 닫을 수 있음)"""
+        for column in self.columns:
+            column.release()
+        self.columns = []
+        self.buffer.close()
+        self._file.close()
+
+def write_segment(path: Path, docs: List[Tuple[int, int, int, int]], postings: Dict[bytes, List[Tuple[int, int]]]):
+    """세그먼트 파일 작성 (문서 표, 정렬된 용어 사전, 포스팅, 원자적 교체)"""
+    blobs = []
+    entries = []
+    offset = 0
+    for key in sorted(postings):
+        blob = encode_postings(postings[key])
+        entries.append(TERM.pack(key, len(postings[key]), offset, len(blob)))
+        blobs.append(blob)
+        offset += len(blob)
+    
+    temp_path = path.with_suffix('.tmp')
+    with open(temp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(docs), len(entries), offset, sum(doc[3] for doc in docs)))
+        for code, column in zip(DOC_COLUMNS, zip(*docs) if docs else [()] * len(DOC_COLUMNS)):
+            f.write(array(code, column).tobytes())
+        f.write(b''.join(entries))
+        f.write(b''.join(blobs))
+    os.replace(temp_path, path)
+
+class NoticeSearchIndex:
+    """공지사항 제목 역색인 (세그먼트 + 매니페스트)"""
+    
+    def __init__(self, directory: str = 'data/archive/search', max_segments: int = 8):
+        self.logger = logging.getLogger(__name__)
+        self.dir = Path(directory)
+        self.manifest_path = self.dir / MANIFEST_NAME
+        self.max_segments = max_segments
+        
+        self.segments: List[Segment] = []
+        self.segment_names: List[str] = []
+        self.next_segment = 1
+        # 이 값 미만의 아카이브 id는 모두 색인됨
+        self.covered_next_id = 1
+        self.universities: List[str] = []
+        self._university_ids: Dict[str, int] = {}
+        self._pending: List[Dict[str, Any]] = []
+    
+    def open(self) -> bool:
+        """매니페스트와 세그먼트 열기"""
+        self.close()
+        if not self.manifest_path.exists():
+            return False
+        
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            self.segment_names = manifest['segments']
+            self.next_segment = manifest['next_segment']
+            self.covered_next_id = manifest['covered_next_id']
+            self.universities = manifest['universities']
+            self._university_ids = {name: i for i, name in enumerate(self.universities)}
+            self.segments = [Segment(self.dir / name) for name in self.segment_names]
+            return True
+        
+        except Exception as e:
+            self.logger.error(f"검색 인덱스 열기 실패: {str(e)}")
+            self.close()
+            return False
+    
+    def close(self):
+        """세그먼트 매핑 해제 (매니페스트 상태는 다시 열 때 읽음)"""
+        for segment in self.segments:
+            segment.close()
+        self.segments = []
+        self.segment_names = []
+        self.next_segment = 1
+        self.covered_next_id = 1
+        self.universities = []
+        self._university_ids = {}
+    
+    def university_id(self, university_name: str) -> int:
+        """대학 id (처음 보는 대학은 뒤에 추가)"""
+        university_id = self._university_ids.get(university_name)
+        if university_id is None:
+            university_id = self._university_ids[university_name] = len(self.universities)
+            self.universities.append(university_name)
+        return university_id
+    
+    def add(self, record: Dict[str, Any]):
+        """아카이브 레코드 색인 대기 (id 순서로 추가해야 함)"""
+        if record['id'] >= self.covered_next_id:
+            self._pending.append(record)
+    
+    def flush(self) -> int:
+        """대기 중인 레코드로 새 세그먼트 작성 (세그먼트가 많으면 병합)"""
+        if not self._pending:
+            return 0
+        
+        docs = []
+        postings: Dict[bytes, List[Tuple[int, int]]] = {}
+        for number, record in enumerate(self._pending):
+            tokens = tokenize(record.get('notice_title'))
+            counts: Dict[bytes, int] = {}
+            for token in tokens:
+                key = _term_key(token)
+                counts[key] = counts.get(key, 0) + 1
+            for key, tf in counts.items():
+                postings.setdefault(key, []).append((number, tf))
+            docs.append((record['id'], self.university_id(record['university_name']),
+                         encode_date(record.get('notice_date')), min(len(tokens), 0xffff)))
+        
+        self.dir.mkdir(parents=True, exist_ok=True)
+        name = f"segment_{self.next_segment:06d}.nsi"
+        write_segment(self.dir / name, docs, postings)
+        self.segments.append(Segment(self.dir / name))
+        self.segment_names.append(name)
+        self.next_segment += 1
+        self.covered_next_id = self._pending[-1]['id'] + 1
+        added = len(self._pending)
+        self._pending = []
+        
+        if len(self.segments) > self.max_segments:
+            self.merge()
+        else:
+            self._save_manifest()
+        self.logger.info(f"검색 인덱스에 공지사항 {added}개 추가 (세그먼트 {len(self.segments)}개)")
+        return added
+    
+    def merge(self):
+        """모든 세그먼트를 하나로 병합 (용어 사전이 정렬되어 있으므로 세그먼트별 용어를 순서대로 병합)"""
+        docs = []
+        bases = []
+        for segment in self.segments:
+            bases.append(len(docs))
+            docs.extend(segment.docs())
+        
+        postings: Dict[bytes, List[Tuple[int, int]]] = {}
+        streams = [segment.terms(index) for index, segment in enumerate(self.segments)]
+        for key, index, offset, length in heapq.merge(*streams):
+            segment = self.segments[index]
+            base = bases[index]
+            numbers, tfs = decode_postings(segment.buffer, segment.postings_start + offset, length)
+            postings.setdefault(key, []).extend(zip((base + number for number in numbers), tfs))
+        
+        name = f"segment_{self.next_segment:06d}.nsi"
+        write_segment(self.dir / name, docs, postings)
+        old_names = self.segment_names
+        for segment in self.segments:
+            segment.close()
+        self.segments = [Segment(self.dir / name)]
+        self.segment_names = [name]
+        self.next_segment += 1
+        self._save_manifest()
+        
+        # 매니페스트 교체 후에 이전 세그먼트 삭제
+        for old_name in old_names:
+            (self.dir / old_name).unlink(missing_ok=True)
+        self.logger.info(f"검색 인덱스 세그먼트 {len(old_names)}개 병합: {len(docs)}개 공지사항")
+    
+    def _save_manifest(self):
+        """매니페스트 저장 (원자적 교체)"""
+        temp_path = self.manifest_path.with_suffix('.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'segments': self.segment_names,
+                'next_segment': self.next_segment,
+                'covered_next_id': self.covered_next_id,
+                'universities': self.universities
+            }, f, ensure_ascii=False)
+        os.replace(temp_path, self.manifest_path)
+    
+    def _average_length(self) -> float:
+        """평균 제목 토큰 수 (세그먼트 헤더의 합계로 계산)"""
+        count = sum(segment.doc_count for segment in self.segments)
+        return (sum(segment.total_tokens for segment in self.segments) / count) if count else 1.0
+    
+    def search(self, query: str, university_name: str = None, since: str = None, until: str = None,
+               limit: int = 20) -> List[Dict[str, Any]]:
+        """불리언 검색 (공백은 AND, OR는 그룹 구분, -검색어는 제외, "따옴표"는 한 검색어) 후 BM25 점수/날짜 순 상위 limit개"""
+        university_id = self._university_ids.get(university_name) if university_name else None
+        if university_name and university_id is None:
+            return []
+        since_value = encode_date(since) if since else 0
+        until_value = encode_date(until) if until else 0
+        
+        groups = self._parse(query)
+        # 검색어는 바이그램(한 글자면 음절)을 모두 포함하는 문서와 일치 (토큰이 없는 검색어는 무시)
+        tokens = {term: list(dict.fromkeys(tokenize(term, unigrams=False))) for group in groups for _, term in group}
+        
+        # idf와 평균 길이는 전체 세그먼트 기준
+        total_docs = sum(segment.doc_count for segment in self.segments) or 1
+        idf = {}
+        for token in {token for term_tokens in tokens.values() for token in term_tokens}:
+            frequency = sum(segment.document_frequency(token) for segment in self.segments)
+            idf[token] = math.log(1 + (total_docs - frequency + 0.5) / (frequency + 0.5))
+        average_length = self._average_length()
+        
+        candidates = []
+        for index, segment in enumerate(self.segments):
+            scores = self._search_segment(segment, groups, tokens, idf, average_length,
+                                          university_id, since_value, until_value)
+            dates = segment.dates
+            candidates.extend(heapq.nlargest(limit, ((score, dates[doc], index, doc) for doc, score in scores.items())))
+        
+        hits = []
+        for score, _, index, doc in heapq.nlargest(limit, candidates):
+            archive_id, doc_university, notice_date, _ = self.segments[index].doc(doc)
+            hits.append({
+                'archive_id': archive_id,
+                'university_name': self.universities[doc_university],
+                'notice_date': decode_date(notice_date),
+                'score': round(score, 4)
+            })
+        return hits
+    
+    def _search_segment(self, segment: Segment, groups: List[List[Tuple[bool, str]]], tokens: Dict[str, List[str]],
+                        idf: Dict[str, float], average_length: float, university_id: Optional[int],
+                        since_value: int, until_value: int) -> Dict[int, float]:
+        """세그먼트 하나의 검색 (문서 집합 교집합/차집합을 먼저 구하고 남은 문서만 점수 계산)"""
+        postings: Dict[str, Dict[int, int]] = {}
+        
+        def matching(term: str, matched=None):
+            """검색어의 모든 토큰을 포함하는 문서 집합 (문서 빈도가 낮은 토큰부터 교집합)"""
+            for token in sorted(tokens[term], key=segment.document_frequency):
+                if token not in postings:
+                    postings[token] = segment.postings(token)
+                matched = postings[token].keys() if matched is None else matched & postings[token].keys()
+                if not matched:
+                    return set()
+            return matched
+        
+        lengths = segment.lengths
+        norms: Dict[int, float] = {}
+        results: Dict[int, float] = {}
+        for group in groups:
+            include = [term for negated, term in group if not negated and tokens[term]]
+            if not include:
+                continue
+            
+            matched = None
+            for term in include:
+                matched = matching(term, matched)
+                if not matched:
+                    break
+            if not matched:
+                continue
+            
+            matched = set(matched)
+            if university_id is not None:
+                column = segment.university_ids
+                matched = {doc for doc in matched if column[doc] == university_id}
+            if since_value or until_value:
+                dates = segment.dates
+                matched = {doc for doc in matched
+                           if (not since_value or dates[doc] >= since_value) and (not until_value or 0 < dates[doc] <= until_value)}
+            for negated, term in group:
+                if negated and tokens[term] and matched:
+                    matched -= matching(term)
+            
+            group_tokens = [token for term in include for token in tokens[term]]
+            for doc in matched:
+                length = lengths[doc]
+                score = 0.0
+                for token in group_tokens:
+                    tf = postings[token][doc]
+                    # (빈도, 길이)별 BM25 정규화 값 재사용
+                    key = tf << 16 | length
+                    norm = norms.get(key)
+                    if norm is None:
+                        norm = norms[key] = tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * length / average_length))
+                    score += idf[token] * norm
+                if score > results.get(doc, 0.0):
+                    results[doc] = score
+        return results
+    
+    @staticmethod
+    def _parse(query: str) -> List[List[Tuple[bool, str]]]:
+        """검색식 → OR 그룹 목록 (그룹은 (제외 여부, 검색어) 목록)"""
+        groups = [[]]
+        for match in re.finditer(r'(-?)"([^"]+)"|(\S+)', query):
+            if match.group(3) == 'OR':
+                groups.append([])
+                continue
+            if match.group(2) is not None:
+                groups[-1].append((bool(match.group(1)), match.group(2)))
+            else:
+                word = match.group(3)
+                groups[-1].append((word.startswith('-') and len(word) > 1, word[1:] if word.startswith('-') else word))
+        return [group for group in groups if group]
+    
+    def stats(self) -> Dict[str, Any]:
+        """리포트용 통계"""
+        if not self.segments:
+            self.open()
+        return {
+            'segments': len(self.segments),
+            'documents': sum(segment.doc_count for segment in self.segments),
+            'terms': sum(segment.term_count for segment in self.segments),
+            'covered_next_id': self.covered_next_id,
+            'size_bytes': sum(segment.path.stat().st_size for segment in self.segments)
+        }
+
+if __name__ == "__main__":
+    from src.utils import setup_logging, load_config
+    from src.archive import NoticeArchive
+    
+    parser = argparse.ArgumentParser(description='공지사항 제목 검색')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('build', help='아카이브 전체로 검색 인덱스 다시 생성')
+    subparsers.add_parser('stats', help='검색 인덱스 통계')
+    query_parser = subparsers.add_parser('query', help='검색 (공백은 AND, OR, -제외, "구문")')
+    query_parser.add_argument('query', help='검색식 (예: "수시 -재외국민", "편입 OR 추가합격")')
+    query_parser.add_argument('--university', help='대학 이름')
+    query_parser.add_argument('--since', help='공지 날짜 시작 (YYYY-MM-DD)')
+    query_parser.add_argument('--until', help='공지 날짜 끝 (YYYY-MM-DD)')
+    query_parser.add_argument('--limit', type=int, default=20, help='결과 수')
+    query_parser.add_argument('--json', action='store_true', help='결과를 한 줄에 하나씩 JSON으로 출력')
+    args = parser.parse_args()
+    
+    setup_logging()
+    archive = NoticeArchive(load_config().get('archive'))
+    archive.load()
+    
+    if args.command == 'build':
+        print(json.dumps(archive.rebuild_search_index(), ensure_ascii=False, indent=2))
+    elif args.command == 'stats':
+        archive.sync_search_index()
+        print(json.dumps(archive.search_index.stats(), ensure_ascii=False, indent=2))
+    else:
+        # 마지막 실행 이후 추가된 공지사항(또는 이전 형식 인덱스)을 먼저 색인
+        archive.sync_search_index()
+        index = archive.search_index
+        hits = index.search(args.query, args.university, args.since, args.until, args.limit)
+        records = {record['id']: record for record in archive.iter_records(hit['archive_id'] for hit in hits)}
+        for hit in hits:
+            record = {**records.get(hit['archive_id'], {}), 'score': hit['score']}
+            if args.json:
+                sys.stdout.write(json.dumps(record, ensure_ascii=False) + '\n')
+            else:
+                sys.stdout.write(f"{hit['score']:>7.3f}  {record.get('notice_date') or '':<10}  "
+                                 f"[{record.get('university_name')}] {record.get('notice_title')}\n")
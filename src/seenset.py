@@ -0,0 +1,171 @@
+"""
+공지사항 지문 seen-set 모듈
+이미 저장된 공지사항 지문을 로컬 Bloom 필터로 기억하여 DB로 보내기 전에 제외
+"""
+
+import os
+import math
+import struct
+import logging
+from pathlib import Path
+from typing import Dict, Any, Iterable, Optional
+
+MAGIC = b'NSB1'
+HEADER = struct.Struct('<4sQQQQ')  # 매직, 비트 수, 해시 개수, 추가된 지문 수, 설계 용량
+
+class SeenSet:
+    """공지사항 지문 Bloom 필터 (파일로 유지)"""
+    
+    def __init__(self, config: Dict[str, Any] = None):
+        self.logger = logging.getLogger(__name__)
+        config = config or {}
+        self.enabled = config.get('enabled', True)
+        self.path = Path(config.get('path', 'data/seen_set.bin'))
+        self.capacity = config.get('capacity', 1000000)
+        self.target_fp_rate = config.get('false_positive_rate', 1e-6)
+        self.warm_page_size = config.get('warm_page_size', 1000)
+        self.skipped = 0
+        self.dirty = False
+        self._allocate(self.capacity)
+    
+    def _allocate(self, capacity: int):
+        """용량과 목표 오탐률에 맞는 빈 필터 생성"""
+        self.capacity = capacity
+        # m = -n ln p / (ln 2)^2, k = m/n ln 2
+        bits = max(8, int(math.ceil(-capacity * math.log(self.target_fp_rate) / (math.log(2) ** 2))))
+        self.num_bits = (bits + 7) // 8 * 8
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray(self.num_bits // 8)
+        self.count = 0
+    
+    def _positions(self, fingerprint: str) -> Iterable[int]:
+        """지문(sha256 hex)에서 비트 위치 계산 (이중 해싱)"""
+        h1 = int(fingerprint[:16], 16)
+        h2 = int(fingerprint[16:32], 16) | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+    
+    def add(self, fingerprint: str):
+        """지문 추가"""
+        new = False
+        for position in self._positions(fingerprint):
+            byte, bit = divmod(position, 8)
+            mask = 1 << bit
+            if not self.bits[byte] & mask:
+                self.bits[byte] |= mask
+                new = True
+        if new:
+            self.count += 1
+            self.dirty = True
+    
+    def __contains__(self, fingerprint: str) -> bool:
+        """지문이 이미 저장되었는지 확인 (오탐 가능, 미탐 없음)"""
+        for position in self._positions(fingerprint):
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                return False
+        return True
+    
+    def filter_new(self, rows: list) -> list:
+        """이미 본 지문의 행을 제외한 목록 반환"""
+        if not self.enabled:
+            return rows
+        
+        new_rows = [row for row in rows if row['fingerprint'] not in self]
+        self.skipped += len(rows) - len(new_rows)
+        return new_rows
+    
+    def estimated_fp_rate(self) -> float:
+        """현재 채워진 비트 비율로 추정한 오탐률"""
+        filled = int.from_bytes(self.bits, 'little').bit_count() / self.num_bits
+        return filled ** self.num_hashes
+    
+    def load(self, db_manager=None) -> bool:
+        """파일에서 필터 로드 (없거나 용량을 넘었으면 DB에서 다시 채움)"""
+        if not self.enabled:
+            return False
+        
+        try:
+            if self.path.exists():
+                with open(self.path, 'rb') as f:
+                    magic, num_bits, num_hashes, count, capacity = HEADER.unpack(f.read(HEADER.size))
+                    if magic != MAGIC:
+                        raise ValueError(f"잘못된 파일 형식: {self.path}")
+                    bits = bytearray(f.read())
+                
+                if len(bits) * 8 != num_bits:
+                    raise ValueError("비트 배열 크기 불일치")
+                
+                self.num_bits, self.num_hashes, self.count, self.capacity = num_bits, num_hashes, count, capacity
+                self.bits = bits
+                self.logger.info(f"seen-set 로드 완료: {count}개 지문, {len(bits) / 1024 / 1024:.1f}MB")
+                
+                if count <= capacity:
+                    return True
+                self.logger.warning(f"seen-set 용량 초과 ({count}/{capacity}), 재구성")
+                self._allocate(max(self.capacity, count * 2))
+        
+        except Exception as e:
+            self.logger.error(f"seen-set 로드 실패: {str(e)}")
+            self._allocate(self.capacity)
+        
+        if db_manager is None:
+            return False
+        return self.warm(db_manager)
+    
+    def warm(self, db_manager) -> bool:
+        """DB에 저장된 지문으로 필터 채우기"""
+        try:
+            added = 0
+            for fingerprint in db_manager.iter_fingerprints(self.warm_page_size):
+                self.add(fingerprint)
+                added += 1
+            
+            # 첫 실행에서 용량을 넘으면 여유를 두고 다시 구성
+            if added > self.capacity:
+                self.logger.warning(f"seen-set 용량 부족 ({added}/{self.capacity}), 재구성")
+                self._allocate(added * 2)
+                for fingerprint in db_manager.iter_fingerprints(self.warm_page_size):
+                    self.add(fingerprint)
+            
+            self.dirty = True
+            self.logger.info(f"seen-set DB에서 채움: {added}개 지문")
+            return True
+        
+        except Exception as e:
+            self.logger.error(f"seen-set DB 채우기 실패: {str(e)}")
+            # 일부만 채워진 필터는 그대로 써도 안전 (빠진 지문은 upsert가 처리)
+            return False
+    
+    def save(self) -> Optional[str]:
+        """변경된 필터를 파일에 저장 (원자적 교체)"""
+        if not self.enabled or not self.dirty:
+            return None
+        
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+            with open(temp_path, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, self.num_bits, self.num_hashes, self.count, self.capacity))
+                f.write(self.bits)
+            os.replace(temp_path, self.path)
+            
+            self.dirty = False
+            self.logger.info(f"seen-set 저장 완료: {self.path}")
+            return str(self.path)
+        
+        except Exception as e:
+            self.logger.error(f"seen-set 저장 실패: {str(e)}")
+            return None
+    
+    def stats(self) -> Dict[str, Any]:
+        """리포트용 통계"""
+        return {
+            'enabled': self.enabled,
+            'fingerprints': self.count,
+            'capacity': self.capacity,
+            'size_bytes': len(self.bits),
+            'skipped_rows': self.skipped,
+            'target_fp_rate': self.target_fp_rate,
+            'estimated_fp_rate': self.estimated_fp_rate() if self.enabled else 0.0
+        }
@@ -0,0 +1,327 @@
+"""
+공지사항 스냅샷 비교 모듈
+스냅샷 JSON 파일이나 아카이브 날짜 상태를 차례로 읽어 인접한 두 상태의 추가/삭제/변경 공지사항을 계산
+(대학 키와 공지사항 키로 해시 인덱스를 만들어 전체 작업이 공지사항 수에 선형)
+"""
+
+import sys
+import json
+import logging
+import argparse
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterator, Iterable
+
+from .utils import notice_fingerprint, clean_notice_title, parse_date
+from .archive import NoticeArchive
+
+class Snapshot:
+    """한 시점의 대학별 공지사항 상태"""
+    
+    def __init__(self, label: str, keyed_by: str = 'code'):
+        self.label = label
+        # 'code': 스냅샷에 대학 코드가 있으면 코드로, 'name': 대학 이름으로 색인
+        self.keyed_by = keyed_by
+        # 대학 키 → {'university', 'code', 'notices': {정제된 제목: 공지사항}}
+        self.universities: Dict[str, Dict[str, Any]] = {}
+        # 크롤링에 실패해 비교에서 제외할 대학 키 → 대학 이름
+        self.unavailable: Dict[str, str] = {}
+        # 이전 상태와 공유 중인 대학 키 (처음 바꿀 때 복사)
+        self._shared: set = set()
+    
+    def add(self, university_name: str, code: Optional[str], notice: Dict[str, Any]):
+        """공지사항 추가"""
+        self.add_many(university_name, code, [notice])
+    
+    def add_many(self, university_name: str, code: Optional[str], notices: Iterable[Dict[str, Any]]):
+        """한 대학의 공지사항 추가 (대학 안에서는 정제된 제목이 지문과 같은 역할을 하므로 해시 계산 없이 색인)"""
+        indexed = self._university(university_name, code)['notices']
+        for notice in notices:
+            title = clean_notice_title(notice.get('notice_title'))
+            if title:
+                indexed[title] = {
+                    'notice_title': title,
+                    'notice_link': notice.get('notice_link'),
+                    'notice_date': notice.get('notice_date')
+                }
+    
+    def remove(self, university_name: str, code: Optional[str], title: str):
+        """공지사항 제거"""
+        self._university(university_name, code)['notices'].pop(clean_notice_title(title), None)
+    
+    def next(self, label: str) -> 'Snapshot':
+        """이 상태에서 시작하는 다음 상태 (대학별 공지사항은 처음 바꿀 때 복사하므로 바뀐 대학 수에 비례)"""
+        snapshot = Snapshot(label, self.keyed_by)
+        snapshot.universities = dict(self.universities)
+        snapshot._shared = set(self.universities)
+        return snapshot
+    
+    def mark_unavailable(self, university_name: str, code: Optional[str]):
+        """크롤링 실패 대학 표시"""
+        self.unavailable[self._key(university_name, code)] = university_name
+    
+    def _key(self, university_name: str, code: Optional[str]) -> str:
+        """대학 키"""
+        if self.keyed_by == 'code' and code:
+            return code
+        return university_name
+    
+    def _university(self, university_name: str, code: Optional[str]) -> Dict[str, Any]:
+        """대학 항목 (없으면 생성)"""
+        key = self._key(university_name, code)
+        university = self.universities.get(key)
+        if university is None:
+            university = self.universities[key] = {'university': university_name, 'code': code, 'notices': {}}
+        elif key in self._shared:
+            university = self.universities[key] = {**university, 'notices': dict(university['notices'])}
+            self._shared.discard(key)
+        return university
+    
+    def keyed_by_name(self) -> 'Snapshot':
+        """대학 이름으로 다시 색인한 상태 (코드가 없는 아카이브와 비교할 때 사용)"""
+        if self.keyed_by == 'name':
+            return self
+        
+        snapshot = Snapshot(self.label, 'name')
+        for key, university in self.universities.items():
+            snapshot.universities[university['university']] = university
+        snapshot.unavailable = {name: name for name in self.unavailable.values()}
+        return snapshot
+    
+    def notice_count(self) -> int:
+        """전체 공지사항 수"""
+        return sum(len(university['notices']) for university in self.universities.values())
+
+def load_snapshot_file(path: str) -> Snapshot:
+    """notices_*.json 스냅샷 파일 읽기 ([{university, code, success, notices:[{title, date, link}]}])"""
+    with open(path, 'r', encoding='utf-8') as f:
+        results = json.load(f)
+    
+    snapshot = Snapshot(Path(path).name, 'code')
+    # 게시판의 날짜 문자열은 몇 가지로 반복되므로 파일 안에서 변환 결과를 재사용
+    dates: Dict[str, Optional[str]] = {}
+    for result in results:
+        name, code = result.get('university'), result.get('code')
+        if not result.get('success'):
+            snapshot.mark_unavailable(name, code)
+            continue
+        for notice in result.get('notices', []):
+            raw_date = notice.get('date')
+            if raw_date not in dates:
+                dates[raw_date] = parse_date(raw_date) or raw_date
+        snapshot.add_many(name, code, ({
+            'notice_title': notice.get('title'),
+            'notice_link': notice.get('link'),
+            'notice_date': dates[notice.get('date')]
+        } for notice in result.get('notices', [])))
+    return snapshot
+
+def archive_snapshots(archive: NoticeArchive, days: List[str]) -> Iterator[Snapshot]:
+    """아카이브에서 날짜별 상태 생성 (처음 확인 날짜 <= 날짜 <= 마지막 확인 날짜인 공지사항, 그날 크롤링하지 않은 대학은 제외)"""
+    days = sorted(set(days))
+    if not days:
+        return
+    
+    # 필요한 공지사항만 한 번에 읽음
+    states = [state for state in archive.iter_states() if state[2] <= days[-1] and state[3] >= days[0]]
+    records = {record['id']: record for record in archive.iter_records(state[1] for state in states)}
+    keys = archive.keys()
+    
+    # 처음/마지막 확인 날짜를 추가/삭제 이벤트로 정렬해 날짜를 한 번만 훑음 (전날 상태에서 바뀐 대학만 복사)
+    additions = sorted(states, key=lambda state: state[2])
+    removals = sorted(states, key=lambda state: state[3])
+    added = removed = 0
+    snapshot = None
+    for day in days:
+        label = f"archive:{day}"
+        snapshot = snapshot.next(label) if snapshot is not None else Snapshot(label, 'code')
+        
+        while removed < len(removals) and removals[removed][3] < day:
+            key, entry_id, _, _ = removals[removed]
+            removed += 1
+            record = records.get(entry_id)
+            if record is not None:
+                snapshot.remove(record['university_name'], record.get('code'), record['notice_title'])
+        
+        while added < len(additions) and additions[added][2] <= day:
+            key, entry_id, _, last_day = additions[added]
+            added += 1
+            record = records.get(entry_id)
+            if record is not None and last_day >= day:
+                snapshot.add(record['university_name'], record.get('code'), record)
+        
+        # 배치 범위 밖이거나 크롤링에 실패한 대학은 공지사항이 사라진 것으로 보지 않음
+        crawled = archive.crawled_on(day)
+        if crawled is not None:
+            for key in keys - crawled:
+                name = archive.university_name(key)
+                snapshot.mark_unavailable(name, key if key != name else None)
+        yield snapshot
+
+class SnapshotDiffer:
+    """인접한 두 스냅샷의 추가/삭제/변경 공지사항 계산"""
+    
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+    
+    def diff(self, previous: Snapshot, current: Snapshot) -> Dict[str, Any]:
+        """두 스냅샷 비교 (대학 키와 정제된 제목으로 해시 조회, 공지사항 수에 선형)"""
+        if previous.keyed_by != current.keyed_by:
+            previous, current = previous.keyed_by_name(), current.keyed_by_name()
+        
+        universities = []
+        totals = {'added': 0, 'removed': 0, 'changed': 0}
+        # 어느 한쪽에서 크롤링에 실패한 대학은 공지사항이 모두 사라진 것으로 보지 않음
+        unavailable = previous.unavailable.keys() | current.unavailable.keys()
+        
+        for key in previous.universities.keys() | current.universities.keys():
+            if key in unavailable:
+                continue
+            
+            before = previous.universities.get(key)
+            after = current.universities.get(key)
+            university = after or before
+            result = self._diff_university(university['university'],
+                                           before['notices'] if before else {},
+                                           after['notices'] if after else {})
+            if result['added'] or result['removed'] or result['changed']:
+                result['code'] = university['code']
+                universities.append(result)
+                for name in totals:
+                    totals[name] += len(result[name])
+        
+        universities.sort(key=lambda item: item['university'])
+        return {
+            'from': previous.label,
+            'to': current.label,
+            'summary': {
+                **totals,
+                'universities': len(previous.universities.keys() | current.universities.keys()),
+                'universities_changed': len(universities),
+                'unavailable': len(unavailable)
+            },
+            'unavailable': sorted(unavailable),
+            'universities': universities
+        }
+    
+    def _diff_university(self, university_name: str, before: Dict[str, Dict], after: Dict[str, Dict]) -> Dict[str, Any]:
+        """한 대학의 공지사항 비교"""
+        added, removed, changed = [], [], []
+        
+        for title, notice in after.items():
+            previous_notice = before.get(title)
+            if previous_notice is None:
+                added.append(notice)
+                continue
+            fields = [field for field in ('notice_link', 'notice_date') if notice.get(field) != previous_notice.get(field)]
+            if fields:
+                changed.append({**notice, 'changed': {field: [previous_notice.get(field), notice.get(field)] for field in fields}})
+        
+        for title, notice in before.items():
+            if title not in after:
+                removed.append(notice)
+        
+        # 제목만 바뀐 공지사항은 링크가 양쪽에서 유일하면 변경으로 묶음
+        if added and removed:
+            removed_by_link = self._unique_by_link(removed)
+            added_by_link = self._unique_by_link(added)
+            paired = set()
+            for link, notice in added_by_link.items():
+                previous_notice = removed_by_link.get(link)
+                if previous_notice is not None:
+                    changed.append({**notice, 'changed': {'notice_title': [previous_notice['notice_title'], notice['notice_title']]}})
+                    paired.add(link)
+            if paired:
+                added = [notice for notice in added if notice.get('notice_link') not in paired]
+                removed = [notice for notice in removed if notice.get('notice_link') not in paired]
+        
+        # 자동화에서 DB/아카이브와 대조할 수 있도록 지문은 결과에 포함되는 공지사항만 계산
+        for notice in (*added, *removed, *changed):
+            notice['fingerprint'] = notice_fingerprint(university_name, notice['notice_title'])
+        
+        return {'university': university_name, 'added': added, 'removed': removed, 'changed': changed}
+    
+    @staticmethod
+    def _unique_by_link(notices: List[Dict]) -> Dict[str, Dict]:
+        """링크 → 공지사항 (링크가 없거나 여러 공지사항이 같은 링크를 쓰면 제외)"""
+        by_link, duplicates = {}, set()
+        for notice in notices:
+            link = notice.get('notice_link')
+            if not link:
+                continue
+            if link in by_link:
+                duplicates.add(link)
+            by_link[link] = notice
+        for link in duplicates:
+            del by_link[link]
+        return by_link
+    
+    def diff_stream(self, snapshots: Iterable[Snapshot]) -> Iterator[Dict[str, Any]]:
+        """스냅샷을 차례로 읽으며 인접한 두 상태씩 비교 (메모리에는 두 스냅샷만 유지)"""
+        previous = None
+        for snapshot in snapshots:
+            if previous is not None:
+                result = self.diff(previous, snapshot)
+                self.logger.info(f"{result['from']} → {result['to']}: 추가 {result['summary']['added']}, "
+                                 f"삭제 {result['summary']['removed']}, 변경 {result['summary']['changed']}")
+                yield result
+            previous = snapshot
+
+def iter_sources(paths: List[str] = None, archive: NoticeArchive = None, days: List[str] = None) -> Iterator[Snapshot]:
+    """스냅샷 파일(이름 순서)과 아카이브 날짜 상태를 차례로 반환"""
+    for path in sorted(paths or [], key=lambda p: Path(p).name):
+        yield load_snapshot_file(path)
+    if archive is not None and days:
+        yield from archive_snapshots(archive, days)
+
+def latest_archive_days(archive: NoticeArchive, count: int = 2) -> List[str]:
+    """아카이브 상태가 바뀐 최근 날짜 목록"""
+    return archive.seen_days()[-count:]
+
+def print_diff(result: Dict[str, Any], stream=None):
+    """사람이 읽기 쉬운 형식으로 출력"""
+    stream = stream or sys.stdout
+    summary = result['summary']
+    stream.write(f"\n{result['from']} → {result['to']}: 추가 {summary['added']}개, 삭제 {summary['removed']}개, "
+                 f"변경 {summary['changed']}개 (대학 {summary['universities_changed']}/{summary['universities']}개)\n")
+    for university in result.get('universities', []):
+        stream.write(f"\n[{university['university']}]\n")
+        for notice in university['added']:
+            stream.write(f"  + {notice['notice_title']} ({notice.get('notice_date')})\n")
+        for notice in university['removed']:
+            stream.write(f"  - {notice['notice_title']}\n")
+        for notice in university['changed']:
+            changes = ', '.join(f"{field}: {old} → {new}" for field, (old, new) in notice['changed'].items())
+            stream.write(f"  ~ {notice['notice_title']} ({changes})\n")
+
+if __name__ == "__main__":
+    from src.utils import setup_logging, load_config
+    
+    parser = argparse.ArgumentParser(description='공지사항 스냅샷 비교')
+    parser.add_argument('paths', nargs='*', help='스냅샷 JSON 파일 (이름 순서로 인접한 두 파일씩 비교)')
+    parser.add_argument('--archive-days', nargs='+', metavar='YYYY-MM-DD', help='비교할 아카이브 날짜')
+    parser.add_argument('--archive-range', metavar='FROM:TO', help='범위 안에서 아카이브 상태가 바뀐 모든 날짜 비교')
+    parser.add_argument('--json', action='store_true', help='비교 결과를 한 줄에 하나씩 JSON으로 출력')
+    parser.add_argument('--summary-only', action='store_true', help='공지사항 목록 없이 요약만 출력')
+    args = parser.parse_args()
+    
+    setup_logging()
+    archive, days = None, None
+    if args.archive_days or args.archive_range or not args.paths:
+        archive = NoticeArchive(load_config().get('archive'))
+        archive.load()
+        if args.archive_range:
+            start, _, end = args.archive_range.partition(':')
+            days = [day for day in archive.seen_days() if start <= day <= (end or '9999-12-31')]
+        elif args.archive_days:
+            days = args.archive_days
+        else:
+            # 인자가 없으면 아카이브의 최근 두 상태 비교
+            days = latest_archive_days(archive)
+    
+    for result in SnapshotDiffer().diff_stream(iter_sources(args.paths, archive, days)):
+        if args.summary_only:
+            result = {key: value for key, value in result.items() if key != 'universities'}
+        if args.json:
+            sys.stdout.write(json.dumps(result, ensure_ascii=False) + '\n')
+        else:
+            print_diff(result)
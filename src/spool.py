@@ -0,0 +1,270 @@
+"""
+쓰기 스풀 모듈
+저장용 행을 로컬 추가 전용 저널에 먼저 기록하고 백그라운드에서 DB로 옮겨 DB 장애 시에도 데이터를 보존
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from .storage import PartialWriteError
+
+class WriteSpool:
+    """추가 전용 저널 기반 write-behind 스풀 (NoticeWriteBuffer 대체)"""
+    
+    def __init__(self, db_manager, config: Dict[str, Any] = None, seen_set=None):
+        self.logger = logging.getLogger(__name__)
+        self.db_manager = db_manager
+        self.seen_set = seen_set
+        config = config or {}
+        spool_dir = Path(config.get('dir', 'data/spool'))
+        self.journal_path = spool_dir / 'journal.ndjson'
+        self.offset_path = spool_dir / 'journal.offset'
+        self.rejected_path = spool_dir / 'rejected.ndjson'
+        self.batch_rows = config.get('batch_rows', 500)
+        self.flush_interval = config.get('flush_interval_seconds', 2)
+        self.max_backoff = config.get('max_backoff_seconds', 60)
+        self.drain_timeout = config.get('drain_timeout_seconds', 120)
+        self.fsync = config.get('fsync', True)
+        
+        self.saved_counts: Counter = Counter()
+        self.failed_counts: Counter = Counter()
+        self.retries = 0
+        self._pending_report: Counter = Counter()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closing = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._deadline = float('inf')
+        
+        spool_dir.mkdir(parents=True, exist_ok=True)
+        self._repair_journal()
+        self.committed = self._load_offset()
+        self._journal = open(self.journal_path, 'ab')
+        
+        leftover = self.journal_path.stat().st_size - self.committed
+        if leftover > 0:
+            self.logger.info(f"이전 실행에서 남은 스풀 {leftover}바이트를 먼저 저장")
+        self.start()
+    
+    def _repair_journal(self):
+        """비정상 종료로 잘린 마지막 줄 제거"""
+        if not self.journal_path.exists():
+            return
+        
+        with open(self.journal_path, 'rb+') as f:
+            data_end = f.seek(0, os.SEEK_END)
+            if data_end == 0:
+                return
+            
+            # 마지막 줄바꿈 위치까지 자름
+            position = data_end
+            while position > 0:
+                step = min(4096, position)
+                f.seek(position - step)
+                chunk = f.read(step)
+                index = chunk.rfind(b'\n')
+                if index >= 0:
+                    position = position - step + index + 1
+                    break
+                position -= step
+            
+            if position != data_end:
+                self.logger.warning(f"스풀 저널의 불완전한 마지막 줄 제거 ({data_end - position}바이트)")
+                f.truncate(position)
+    
+    def _load_offset(self) -> int:
+        """DB 저장이 끝난 저널 위치 로드"""
+        try:
+            offset = int(self.offset_path.read_text(encoding='utf-8').strip())
+            return min(offset, self.journal_path.stat().st_size if self.journal_path.exists() else 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+    
+    def _save_offset(self, offset: int):
+        """DB 저장이 끝난 저널 위치 저장 (원자적 교체)"""
+        temp_path = self.offset_path.with_suffix('.tmp')
+        temp_path.write_text(str(offset), encoding='utf-8')
+        os.replace(temp_path, self.offset_path)
+    
+    def start(self):
+        """백그라운드 저장 스레드 시작"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._closing.clear()
+        self._thread = threading.Thread(target=self._run, name='write-spool', daemon=True)
+        self._thread.start()
+    
+    def add(self, notices: List[Dict], university_name: str) -> Dict[str, int]:
+        """공지사항을 저널에 기록하고 바로 반환 (지난 호출 이후 DB에 저장된 대학별 개수 반환)"""
+        rows = self.db_manager.prepare_notices(notices, university_name)
+        
+        with self._lock:
+            if self.seen_set is not None:
+                rows = self.seen_set.filter_new(rows)
+            
+            if rows:
+                payload = ''.join(json.dumps(row, ensure_ascii=False) + '\n' for row in rows).encode('utf-8')
+                self._journal.write(payload)
+                self._journal.flush()
+                if self.fsync:
+                    os.fsync(self._journal.fileno())
+        
+        # 한 배치 분량(행당 약 200바이트)이 쌓이면 주기를 기다리지 않고 저장
+        if rows and self._pending_size() >= self.batch_rows * 200:
+            self._wakeup.set()
+        
+        return self._take_report()
+    
+    def _pending_size(self) -> int:
+        """아직 DB에 저장되지 않은 저널 바이트 수"""
+        return self.journal_path.stat().st_size - self.committed
+    
+    def _take_report(self) -> Dict[str, int]:
+        """보고하지 않은 대학별 저장 개수를 꺼내 반환"""
+        with self._lock:
+            report, self._pending_report = dict(self._pending_report), Counter()
+        return report
+    
+    def _run(self):
+        """저널을 읽어 DB에 저장 (실패 시 지수 백오프로 재시도)"""
+        backoff = 1.0
+        while True:
+            # 종료 대기 시간을 넘기면 남은 행은 다음 실행에 맡김
+            if self._closing.is_set() and time.monotonic() >= self._deadline:
+                return
+            
+            try:
+                drained = self._drain_once()
+                backoff = 1.0
+            except Exception as e:
+                self.retries += 1
+                self.logger.warning(f"스풀 저장 실패, {backoff:.0f}초 후 재시도: {str(e)}")
+                if self._closing.is_set():
+                    # 종료 중에는 대기 시간 안에서만 재시도
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        return
+                    time.sleep(min(backoff, remaining))
+                else:
+                    self._closing.wait(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+                continue
+            
+            if drained and self._closing.is_set():
+                return
+            if not drained:
+                continue
+            
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+    
+    def _drain_once(self) -> bool:
+        """저널에서 한 배치를 읽어 저장 후 저널이 모두 비었는지 반환"""
+        rows, end_offset = self._read_batch()
+        if not rows:
+            self._compact()
+            return True
+        
+        # 여러 대학의 행을 모아 저장하므로 대학별 단계 집계에서 제외 (스레드별 값이라 보통 이미 None)
+        try:
+            with self.db_manager.stage_timer.university_scope(None):
+                # seen-set으로 거르지 않았으면 이미 저장된 지문을 조회해 행 전체를 보내지 않음 (database.duplicate_check)
+                new_rows = rows
+                if self.seen_set is None or not self.seen_set.enabled:
+                    new_rows = self.db_manager.filter_existing(rows)
+                inserted, failed = self.db_manager.upsert_rows(new_rows, raise_errors=True) if new_rows else ([], [])
+        except PartialWriteError as e:
+            # 중단 전에 삽입된 행은 재시도 때 중복으로 무시되므로 지금 집계 (위치는 그대로 두고 배치 전체 재시도)
+            with self._lock:
+                if self.seen_set is not None:
+                    for row in e.inserted:
+                        self.seen_set.add(row['fingerprint'])
+                self._record_inserted(e.inserted)
+            raise
+        
+        # 행 자체 문제로 거부된 행은 따로 보관하고 건너뜀
+        if failed:
+            with open(self.rejected_path, 'a', encoding='utf-8') as f:
+                for row in failed:
+                    f.write(json.dumps(row, ensure_ascii=False) + '\n')
+        
+        with self._lock:
+            self.committed = end_offset
+            self._save_offset(end_offset)
+            
+            if self.seen_set is not None:
+                failed_fingerprints = {row['fingerprint'] for row in failed}
+                for row in rows:
+                    if row['fingerprint'] not in failed_fingerprints:
+                        self.seen_set.add(row['fingerprint'])
+            
+            self._record_inserted(inserted)
+            self.failed_counts.update(row.get('university_name') for row in failed)
+        
+        self.logger.info(f"스풀 저장: {len(rows)}개 중 {len(inserted)}개 신규, {len(failed)}개 거부")
+        return False
+    
+    def _record_inserted(self, inserted: List[Dict]):
+        """새로 삽입된 행을 대학별 저장 개수에 반영 (잠금 안에서 호출)"""
+        flushed = Counter(row.get('university_name') for row in inserted)
+        self.saved_counts.update(flushed)
+        self._pending_report.update(flushed)
+    
+    def _read_batch(self):
+        """저장되지 않은 위치부터 완전한 줄을 최대 batch_rows개 읽기"""
+        rows = []
+        with open(self.journal_path, 'rb') as f:
+            f.seek(self.committed)
+            offset = self.committed
+            while len(rows) < self.batch_rows:
+                line = f.readline()
+                if not line.endswith(b'\n'):
+                    break
+                offset += len(line)
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError:
+                    self.logger.error(f"스풀 저널의 손상된 줄 건너뜀 (위치 {offset - len(line)})")
+        return rows, offset
+    
+    def _compact(self):
+        """모두 저장된 저널 비우기"""
+        with self._lock:
+            if self._journal.closed or self.committed == 0 or self._journal.tell() != self.committed:
+                return
+            self._journal.truncate(0)
+            self._journal.seek(0)
+            self.committed = 0
+            self._save_offset(0)
+    
+    def close(self) -> Dict[str, int]:
+        """남은 행 저장을 기다린 후 종료 (시간 안에 못 끝내면 다음 실행에서 이어서 저장)"""
+        self._deadline = time.monotonic() + self.drain_timeout
+        self._closing.set()
+        self._wakeup.set()
+        
+        if self._thread:
+            self._thread.join(self.drain_timeout)
+            if self._thread.is_alive():
+                self.logger.warning(f"스풀 {self._pending_size()}바이트 저장 못함, 다음 실행에서 재시도")
+            self._thread = None
+        
+        with self._lock:
+            self._journal.close()
+        
+        return self._take_report()
+    
+    def stats(self) -> Dict[str, Any]:
+        """리포트용 통계"""
+        return {
+            'pending_bytes': self._pending_size() if self.journal_path.exists() else 0,
+            'saved': sum(self.saved_counts.values()),
+            'rejected': sum(self.failed_counts.values()),
+            'retries': self.retries
+        }
@@ -0,0 +1,272 @@
+"""
+SQLite 데이터베이스 관리 모듈
+Supabase 없이 로컬 파일에 공지사항을 저장 (오프라인 실행, 부하 테스트용)
+"""
+
+import json
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, Iterator
+
+from .instrumentation import StageTimer
+from .storage import NoticeStorage
+
+# 저장 컬럼 (id, created_at 제외)
+COLUMNS = ['university_name', 'notice_date', 'notice_title', 'notice_link', 'fingerprint', 'categories', 'crawled_at']
+TABLE_COLUMNS = ['id', *COLUMNS, 'created_at']
+
+class SQLiteManager(NoticeStorage):
+    """SQLite 데이터베이스 매니저 (WAL 모드)"""
+    
+    # 제약 조건 위반, 바인딩할 수 없는 값
+    row_errors = (sqlite3.IntegrityError, sqlite3.InterfaceError)
+    
+    def __init__(self, path: str = "data/notices.db", table_name: str = "university_notices", stage_timer: StageTimer = None):
+        super().__init__(table_name, stage_timer)
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self._lock = threading.Lock()
+        
+        try:
+            if path != ':memory:':
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+            
+            # 리텐션 작업, 쓰기 스풀 등 다른 스레드에서도 사용 (잠금으로 직렬화)
+            self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self.conn.row_factory = sqlite3.Row
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("PRAGMA busy_timeout=5000")
+            self.create_table_if_not_exists()
+            self.logger.info(f"SQLite 데이터베이스 초기화 완료: {path}")
+        except Exception as e:
+            self.logger.error(f"SQLite 데이터베이스 초기화 실패: {str(e)}")
+            raise
+    
+    def _query(self, sql: str, params=()) -> List[sqlite3.Row]:
+        """조회 쿼리 실행 (왕복 횟수 집계)"""
+        self.round_trips += 1
+        with self.stage_timer.span('db_request', method='SELECT', table=self.table_name) as span:
+            with self._lock:
+                rows = self.conn.execute(sql, params).fetchall()
+            span.set('rows', len(rows))
+            return rows
+    
+    def write_rows(self, rows: List[Dict]) -> List[Dict]:
+        """행 목록을 한 트랜잭션에서 executemany로 저장 (이미 있는 지문은 무시, 새로 삽입된 행 반환)"""
+        self.round_trips += 1
+        placeholders = ', '.join('?' for _ in COLUMNS)
+        insert_sql = (
+            f"INSERT INTO {self.table_name} ({', '.join(COLUMNS)}) VALUES ({placeholders}) "
+            f"ON CONFLICT(fingerprint) DO NOTHING"
+        )
+        
+        with self.stage_timer.span('db_request', method='INSERT', table=self.table_name) as span:
+            with self._lock:
+                self.conn.execute("BEGIN IMMEDIATE")
+                try:
+                    # executemany는 RETURNING을 지원하지 않으므로 같은 트랜잭션에서 기존 지문을 먼저 확인
+                    # 같은 배치 안에서 지문이 겹치면 첫 행만 삽입되므로 뒤의 행은 기존 지문처럼 제외
+                    existing = self._existing_fingerprints([row['fingerprint'] for row in rows])
+                    inserted = []
+                    for row in rows:
+                        if row['fingerprint'] not in existing:
+                            existing.add(row['fingerprint'])
+                            inserted.append(row)
+                    self.conn.executemany(insert_sql, (self._row_values(row) for row in inserted))
+                    self.conn.execute("COMMIT")
+                except BaseException:
+                    self.conn.execute("ROLLBACK")
+                    raise
+            span.set('rows', len(inserted))
+        
+        self.inserted_count += len(inserted)
+        return inserted
+    
+    @staticmethod
+    def _row_values(row: Dict) -> List[Any]:
+        """저장 컬럼 값 목록 (분류 목록은 JSON 문자열로 저장)"""
+        categories = row.get('categories')
+        return [
+            json.dumps(categories, ensure_ascii=False) if column == 'categories' and categories is not None else row.get(column)
+            for column in COLUMNS
+        ]
+    
+    def existing_fingerprints(self, fingerprints: List[str]) -> set:
+        """이미 저장된 지문 조회"""
+        self.round_trips += 1
+        with self.stage_timer.span('db_request', method='SELECT', table=self.table_name) as span:
+            with self._lock:
+                existing = self._existing_fingerprints(fingerprints)
+            span.set('rows', len(existing))
+            return existing
+    
+    def _existing_fingerprints(self, fingerprints: List[str]) -> set:
+        """이미 저장된 지문 조회 (SQLite 변수 개수 제한에 맞춰 나눠 조회, 잠금 안에서 호출)"""
+        existing = set()
+        for i in range(0, len(fingerprints), 500):
+            chunk = fingerprints[i:i + 500]
+            placeholders = ', '.join('?' for _ in chunk)
+            cursor = self.conn.execute(
+                f"SELECT fingerprint FROM {self.table_name} WHERE fingerprint IN ({placeholders})", chunk
+            )
+            existing.update(row[0] for row in cursor)
+        return existing
+    
+    def get_university_stats(self, university_name: str) -> Dict[str, Any]:
+        """특정 대학의 공지사항 통계 조회 (인덱스 집계)"""
+        try:
+            rows = self._query(
+                f"SELECT COUNT(*) AS total_notices, MAX(crawled_at) AS latest_crawl, "
+                f"MAX(notice_date) AS latest_notice_date FROM {self.table_name} WHERE university_name = ?",
+                (university_name,)
+            )
+            stats = dict(rows[0])
+            stats['university_name'] = university_name
+            return self._format_stats(stats)
+        
+        except Exception as e:
+            self.logger.error(f"{university_name} 통계 조회 중 오류: {str(e)}")
+            stats = self._format_stats({'university_name': university_name})
+            stats['error'] = str(e)
+            return stats
+    
+    def get_all_university_stats(self) -> List[Dict[str, Any]]:
+        """전체 대학의 공지사항 통계를 한 번에 조회"""
+        try:
+            rows = self._query(
+                f"SELECT university_name, COUNT(*) AS total_notices, MAX(crawled_at) AS latest_crawl, "
+                f"MAX(notice_date) AS latest_notice_date FROM {self.table_name} "
+                f"GROUP BY university_name ORDER BY university_name"
+            )
+            return [self._format_stats(dict(row)) for row in rows]
+        
+        except Exception as e:
+            self.logger.error(f"전체 대학 통계 조회 중 오류: {str(e)}")
+            return []
+    
+    def iter_notices(self, university_name: str = None, columns: List[str] = None, page_size: int = 1000,
+                     since: str = None) -> Iterator[Dict]:
+        """공지사항을 최신순으로 (crawled_at, id) 커서 페이지 단위 조회 (offset 없이 필요한 컬럼만)"""
+        select_columns = self._cursor_columns(columns)
+        unknown = set(select_columns) - set(TABLE_COLUMNS) - {'*'}
+        if unknown:
+            raise ValueError(f"알 수 없는 컬럼: {', '.join(sorted(unknown))}")
+        
+        conditions, params = [], []
+        if university_name:
+            conditions.append("university_name = ?")
+            params.append(university_name)
+        if since:
+            conditions.append("crawled_at >= ?")
+            params.append(since)
+        
+        cursor = None
+        while True:
+            page_conditions, page_params = list(conditions), list(params)
+            if cursor:
+                # 행 값 비교로 (crawled_at, id) 인덱스 순서를 그대로 이어서 읽음
+                page_conditions.append("(crawled_at, id) < (?, ?)")
+                page_params.extend(cursor)
+            
+            where = f"WHERE {' AND '.join(page_conditions)} " if page_conditions else ""
+            rows = self._query(
+                f"SELECT {', '.join(select_columns)} FROM {self.table_name} {where}"
+                f"ORDER BY crawled_at DESC, id DESC LIMIT ?",
+                (*page_params, page_size)
+            )
+            for row in rows:
+                yield self._project(dict(row), columns)
+            
+            if len(rows) < page_size:
+                return
+            cursor = (rows[-1]['crawled_at'], rows[-1]['id'])
+    
+    def iter_fingerprints(self, page_size: int = 1000) -> Iterator[str]:
+        """저장된 모든 공지사항 지문을 id 순서로 페이지 단위 조회"""
+        last_id = 0
+        while True:
+            rows = self._query(
+                f"SELECT id, fingerprint FROM {self.table_name} WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, page_size)
+            )
+            for row in rows:
+                yield row['fingerprint']
+            
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1]['id']
+    
+    def delete_expired_chunk(self, cutoff: str, after_id: int, chunk_size: int) -> Tuple[int, Optional[int]]:
+        """cutoff 이전에 크롤링된 공지사항을 id 순서로 최대 chunk_size개 삭제 후 (삭제 수, 다음 시작 id) 반환"""
+        boundary = self._query(
+            f"SELECT id FROM {self.table_name} WHERE crawled_at < ? AND id > ? ORDER BY id LIMIT 1 OFFSET ?",
+            (cutoff, after_id, chunk_size - 1)
+        )
+        upper_id = boundary[0]['id'] if boundary else None
+        
+        self.round_trips += 1
+        with self._lock:
+            if upper_id is None:
+                cursor = self.conn.execute(
+                    f"DELETE FROM {self.table_name} WHERE crawled_at < ? AND id > ?", (cutoff, after_id)
+                )
+            else:
+                cursor = self.conn.execute(
+                    f"DELETE FROM {self.table_name} WHERE crawled_at < ? AND id > ? AND id <= ?",
+                    (cutoff, after_id, upper_id)
+                )
+        
+        return cursor.rowcount, upper_id
+    
+    def health_check(self) -> bool:
+        """데이터베이스 연결 상태 확인"""
+        try:
+            self._query(f"SELECT id FROM {self.table_name} LIMIT 1")
+            self.logger.info("데이터베이스 연결 정상")
+            return True
+        
+        except Exception as e:
+            self.logger.error(f"데이터베이스 연결 실패: {str(e)}")
+            return False
+    
+    def create_table_if_not_exists(self) -> bool:
+        """테이블과 인덱스 생성"""
+        try:
+            with self._lock:
+                self.conn.executescript(f"""
+                    CREATE TABLE IF NOT EXISTS {self.table_name} (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        university_name TEXT NOT NULL,
+                        notice_date TEXT,
+                        notice_title TEXT NOT NULL,
+                        notice_link TEXT,
+                        fingerprint TEXT NOT NULL,
+                        categories TEXT,
+                        crawled_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                    );
+                    CREATE UNIQUE INDEX IF NOT EXISTS idx_notice_fingerprint ON {self.table_name}(fingerprint);
+                    CREATE INDEX IF NOT EXISTS idx_university_crawled_at ON {self.table_name}(university_name, crawled_at);
+                    CREATE INDEX IF NOT EXISTS idx_university_date ON {self.table_name}(university_name, notice_date);
+                    CREATE INDEX IF NOT EXISTS idx_crawled_at ON {self.table_name}(crawled_at);
+                """)
+                
+                # 분류 컬럼이 생기기 전에 만든 파일 (migrations/004_notice_categories.sql 과 같은 변경)
+                columns = {row[1] for row in self.conn.execute(f"PRAGMA table_info({self.table_name})")}
+                if 'categories' not in columns:
+                    self.conn.execute(f"ALTER TABLE {self.table_name} ADD COLUMN categories TEXT")
+            
+            self.logger.info(f"테이블 '{self.table_name}' 존재 확인")
+            return True
+        
+        except Exception as e:
+            self.logger.error(f"테이블 생성 실패: {str(e)}")
+            return False
+    
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            self.conn.close()
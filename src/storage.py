@@ -0,0 +1,286 @@
+"""
+공지사항 저장소 모듈
+Supabase, SQLite 등 저장소 구현이 공유하는 인터페이스와 공통 처리
+"""
+
+import os
+import logging
+from abc import ABC, abstractmethod
+from itertools import islice
+from typing import List, Dict, Any, Optional, Tuple, Iterator
+from datetime import datetime, date
+
+from .instrumentation import StageTimer
+from .keywords import KeywordMatcher
+from .utils import notice_fingerprint, clean_notice_title
+
+class PartialWriteError(Exception):
+    """저장 중 일시적 오류로 중단됨 (중단 전에 삽입된 행은 inserted로 전달)"""
+    
+    def __init__(self, error: Exception, inserted: List[Dict]):
+        super().__init__(str(error))
+        self.error = error
+        self.inserted = inserted
+
+class NoticeStorage(ABC):
+    """공지사항 저장소 인터페이스"""
+    
+    # 행 단위 문제로 간주하여 배치를 나눠 재시도할 예외
+    row_errors: Tuple[type, ...] = ()
+    
+    def __init__(self, table_name: str = "university_notices", stage_timer: StageTimer = None):
+        self.logger = logging.getLogger(__name__)
+        self.table_name = table_name
+        self.stage_timer = stage_timer or StageTimer(enabled=False)
+        self.batch_size = 500
+        self.round_trips = 0
+        self.inserted_count = 0
+        self.failed_rows = 0
+        # 설정되면 저장 행마다 제목 분류(categories) 추가 (migrations/004_notice_categories.sql 필요)
+        self.keyword_matcher: Optional[KeywordMatcher] = None
+        # 설정되면 seen-set 없이 저장할 때 이미 있는 지문을 먼저 조회해 전송에서 제외 (database.duplicate_check)
+        self.duplicate_check = False
+    
+    def save_notices(self, notices: List[Dict], university_name: str) -> int:
+        """공지사항 목록을 데이터베이스에 저장"""
+        if not notices:
+            return 0
+        
+        try:
+            # 데이터 준비
+            rows = self.prepare_notices(notices, university_name)
+            if not rows:
+                self.logger.warning(f"{university_name}: 저장할 유효한 공지사항이 없음")
+                return 0
+            
+            # 지문 충돌 시 무시하는 upsert로 중복 확인과 저장을 한 번에 처리
+            with self.stage_timer.span('db_insert', university_name):
+                inserted, _ = self.upsert_rows(rows)
+            saved_count = len(inserted)
+            
+            if saved_count > 0:
+                self.logger.info(f"{university_name}: {saved_count}개 공지사항 저장 완료")
+            else:
+                self.logger.info(f"{university_name}: 새로운 공지사항이 없음")
+            
+            return saved_count
+            
+        except Exception as e:
+            self.logger.error(f"{university_name} 공지사항 저장 중 오류: {str(e)}", exc_info=True)
+            return 0
+    
+    def prepare_notices(self, notices: List[Dict], university_name: str) -> List[Dict]:
+        """공지사항 목록을 저장용 행으로 변환 (같은 페이지 안의 중복은 지문 기준으로 제거)"""
+        rows = {}
+        current_time = datetime.now().isoformat()
+        
+        for notice in notices:
+            # 데이터 검증 및 정제
+            processed_notice = self._prepare_notice_data(notice, university_name, current_time)
+            if processed_notice:
+                rows[processed_notice['fingerprint']] = processed_notice
+        
+        rows = list(rows.values())
+        if self.keyword_matcher and rows:
+            # 페이지의 제목을 한 번에 분류
+            for row, tags in zip(rows, self.keyword_matcher.tag_many([row['notice_title'] for row in rows])):
+                row['categories'] = list(tags['categories'])
+        
+        return rows
+    
+    def _prepare_notice_data(self, notice: Dict, university_name: str, crawled_at: str) -> Optional[Dict]:
+        """공지사항 데이터 준비 및 검증"""
+        try:
+            # 필수 필드 확인
+            if not notice.get('notice_title'):
+                return None
+            
+            # 데이터 정제
+            title = self._clean_title(notice['notice_title'])
+            prepared_data = {
+                'university_name': university_name,
+                'notice_title': title,
+                'notice_link': notice.get('notice_link'),
+                'fingerprint': notice_fingerprint(university_name, title),
+                'crawled_at': crawled_at
+            }
+            
+            # 날짜 처리
+            notice_date = notice.get('notice_date')
+            if notice_date:
+                if isinstance(notice_date, str):
+                    prepared_data['notice_date'] = notice_date
+                elif isinstance(notice_date, (date, datetime)):
+                    prepared_data['notice_date'] = notice_date.isoformat()
+            
+            return prepared_data
+            
+        except Exception as e:
+            self.logger.error(f"공지사항 데이터 준비 중 오류: {str(e)}")
+            return None
+    
+    def _clean_title(self, title: str) -> str:
+        """제목 정제 (아카이브와 같은 지문이 나오도록 공통 함수 사용)"""
+        return clean_notice_title(title)
+    
+    @abstractmethod
+    def write_rows(self, rows: List[Dict]) -> List[Dict]:
+        """행 목록을 한 번에 저장 (이미 있는 지문은 무시, 새로 삽입된 행 반환)"""
+    
+    def upsert_rows(self, rows: List[Dict], raise_errors: bool = False) -> Tuple[List[Dict], List[Dict]]:
+        """배치 단위로 저장하고 (삽입된 행, 실패한 행) 반환 (raise_errors면 행 오류가 아닌 예외를 PartialWriteError로 전달)"""
+        inserted: List[Dict] = []
+        failed: List[Dict] = []
+        
+        for i in range(0, len(rows), self.batch_size):
+            batch = rows[i:i + self.batch_size]
+            try:
+                self._write_isolating_failures(batch, inserted, failed, raise_errors)
+            except Exception as e:
+                # 앞 배치에서 이미 삽입된 행을 호출자가 집계할 수 있도록 함께 전달
+                self.failed_rows += len(failed)
+                raise PartialWriteError(e, inserted) from e
+            self.logger.debug(f"배치 {i//self.batch_size + 1}: {len(batch)}개 요청")
+        
+        self.failed_rows += len(failed)
+        return inserted, failed
+    
+    def _write_isolating_failures(self, rows: List[Dict], inserted: List[Dict], failed: List[Dict],
+                                  raise_errors: bool = False):
+        """배치 저장이 행 오류로 실패하면 절반씩 나눠 재시도하여 문제 행만 제외"""
+        try:
+            inserted.extend(self.write_rows(rows))
+            
+        except Exception as e:
+            if not self.is_row_error(e):
+                if raise_errors:
+                    raise
+                # 네트워크 오류 등은 행 문제가 아니므로 나누지 않고 배치 전체를 실패로 처리
+                self.logger.error(f"배치 저장 중 오류 ({len(rows)}개): {str(e)}")
+                failed.extend(rows)
+                return
+            
+            if len(rows) == 1:
+                row = rows[0]
+                self.logger.error(f"{row.get('university_name')} 공지사항 저장 실패 ({row.get('notice_title')}): {str(e)}")
+                failed.append(row)
+                return
+            
+            middle = len(rows) // 2
+            self._write_isolating_failures(rows[:middle], inserted, failed, raise_errors)
+            self._write_isolating_failures(rows[middle:], inserted, failed, raise_errors)
+    
+    def is_row_error(self, error: Exception) -> bool:
+        """배치를 나눠 재시도할 행 단위 오류인지 확인"""
+        return isinstance(error, self.row_errors)
+    
+    @abstractmethod
+    def existing_fingerprints(self, fingerprints: List[str]) -> set:
+        """이미 저장된 지문 조회"""
+    
+    def filter_existing(self, rows: List[Dict]) -> List[Dict]:
+        """이미 저장된 지문의 행을 제외 (duplicate_check가 꺼져 있으면 그대로 반환)"""
+        if not self.duplicate_check or not rows:
+            return rows
+        existing = self.existing_fingerprints([row['fingerprint'] for row in rows])
+        return [row for row in rows if row['fingerprint'] not in existing]
+    
+    @abstractmethod
+    def get_university_stats(self, university_name: str) -> Dict[str, Any]:
+        """특정 대학의 공지사항 통계 조회"""
+    
+    @abstractmethod
+    def get_all_university_stats(self) -> List[Dict[str, Any]]:
+        """전체 대학의 공지사항 통계 조회"""
+    
+    def get_recent_notices(self, university_name: str = None, limit: int = 50, columns: List[str] = None) -> List[Dict]:
+        """최근 공지사항 조회 (limit개만 받도록 페이지 크기를 맞춤)"""
+        try:
+            return list(islice(self.iter_notices(university_name, columns, page_size=max(1, min(limit, 1000))), limit))
+        
+        except Exception as e:
+            self.logger.error(f"최근 공지사항 조회 중 오류: {str(e)}")
+            return []
+    
+    @abstractmethod
+    def iter_notices(self, university_name: str = None, columns: List[str] = None, page_size: int = 1000,
+                     since: str = None) -> Iterator[Dict]:
+        """공지사항을 최신순으로 (crawled_at, id) 커서 페이지 단위 조회"""
+    
+    @staticmethod
+    def _cursor_columns(columns: Optional[List[str]]) -> List[str]:
+        """요청한 컬럼에 커서용 컬럼(crawled_at, id)을 더한 조회 컬럼 목록"""
+        if not columns:
+            return ['*']
+        return list(dict.fromkeys([*columns, 'crawled_at', 'id']))
+    
+    @staticmethod
+    def _project(row: Dict, columns: Optional[List[str]]) -> Dict:
+        """요청한 컬럼만 남긴 행"""
+        if not columns:
+            return row
+        return {column: row.get(column) for column in columns}
+    
+    @abstractmethod
+    def iter_fingerprints(self, page_size: int = 1000) -> Iterator[str]:
+        """저장된 모든 공지사항 지문 조회"""
+    
+    def delete_old_notices(self, days: int = 365, chunk_size: int = 500) -> int:
+        """오래된 공지사항을 일정 크기씩 나눠 삭제"""
+        from .retention import RetentionJob
+        
+        result = RetentionJob(self, {'days': days, 'chunk_size': chunk_size, 'checkpoint_file': None}).run()
+        return result['deleted']
+    
+    @abstractmethod
+    def delete_expired_chunk(self, cutoff: str, after_id: int, chunk_size: int) -> Tuple[int, Optional[int]]:
+        """cutoff 이전 공지사항을 최대 chunk_size개 삭제 후 (삭제 수, 다음 시작 id) 반환"""
+    
+    @abstractmethod
+    def health_check(self) -> bool:
+        """저장소 연결 상태 확인"""
+    
+    @abstractmethod
+    def create_table_if_not_exists(self) -> bool:
+        """테이블 확인 또는 생성"""
+    
+    def close(self):
+        """연결 종료"""
+    
+    def _format_stats(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """통계 응답 형식으로 변환"""
+        return {
+            'university_name': row.get('university_name'),
+            'total_notices': row.get('total_notices') or 0,
+            'latest_crawl': row.get('latest_crawl'),
+            'latest_notice_date': row.get('latest_notice_date')
+        }
+
+def create_storage(config: Dict[str, Any], stage_timer: StageTimer = None) -> NoticeStorage:
+    """설정의 database.backend에 맞는 저장소 생성"""
+    db_config = config.get('database', {})
+    backend = db_config.get('backend', 'supabase')
+    table_name = db_config.get('table_name', 'university_notices')
+    
+    if backend == 'supabase':
+        from .database import SupabaseManager
+        storage = SupabaseManager(
+            url=os.getenv('SUPABASE_URL'),
+            key=os.getenv('SUPABASE_KEY'),
+            table_name=table_name,
+            stage_timer=stage_timer,
+            batch_size=db_config.get('batch_size', 500),
+            concurrency=db_config.get('concurrency', 1),
+            partitioned=db_config.get('partitioned', False)
+        )
+    elif backend == 'sqlite':
+        from .sqlite_database import SQLiteManager
+        storage = SQLiteManager(db_config.get('sqlite_path', 'data/notices.db'), table_name, stage_timer)
+    else:
+        raise ValueError(f"지원하지 않는 저장소: {backend}")
+    
+    keywords_config = config.get('keywords', {})
+    if keywords_config.get('store_categories', False):
+        storage.keyword_matcher = KeywordMatcher.from_config(keywords_config)
+    storage.duplicate_check = db_config.get('duplicate_check', False)
+    return storage
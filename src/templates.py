@@ -19,6 +19,7 @@ class TemplateManager:
         self.templates = {}
         self.domain_templates = {}
         self.system_templates = {}
+        self._indicator_patterns: Dict[str, Any] = {}
         self.load_templates(templates_file)
     
     def load_templates(self, templates_file: str):
@@ -187,24 +188,32 @@ class TemplateManager:
     
     def _match_by_system(self, soup: BeautifulSoup, url: str) -> Optional[Dict]:
         """시스템 지표로 템플릿 매칭"""
-        html_content = str(soup).lower()
-        url_lower = url.lower()
+        # 페이지 전체의 소문자 사본을 만들지 않도록 대소문자 무시 정규식으로 검색
+        html_content = str(soup)
         
         for system_name, system_data in self.system_templates.items():
-            indicators = system_data.get('indicators', [])
+            patterns = self._get_indicator_patterns(system_name, system_data.get('indicators', []))
             match_count = 0
             
-            for indicator in indicators:
-                indicator_lower = indicator.lower()
-                if indicator_lower in html_content or indicator_lower in url_lower:
+            for pattern in patterns:
+                if pattern.search(html_content) or pattern.search(url):
                     match_count += 1
             
             # 지표의 절반 이상 매칭되면 해당 시스템으로 판단
-            if match_count >= len(indicators) * 0.5:
+            if match_count >= len(patterns) * 0.5:
                 return system_data
         
         return None
     
+    def _get_indicator_patterns(self, system_name: str, indicators: List[str]) -> List[re.Pattern]:
+        """시스템 지표를 대소문자 무시 정규식으로 컴파일 (캐시 사용)"""
+        cached = self._indicator_patterns.get(system_name)
+        if cached is None or cached[0] != indicators:
+            patterns = [re.compile(re.escape(indicator), re.IGNORECASE) for indicator in indicators]
+            cached = (list(indicators), patterns)
+            self._indicator_patterns[system_name] = cached
+        return cached[1]
+    
     def _match_generic_patterns(self, soup: BeautifulSoup) -> Optional[Dict]:
         """일반적인 패턴으로 매칭"""
         generic_patterns = [
@@ -0,0 +1,127 @@
+"""
+트레이싱 모듈
+대학별 부모 스팬과 HTTP 요청, 파싱, 전략 시도, DB 호출 자식 스팬을 NDJSON 트레이스로 기록
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+class TraceSpan:
+    """진행 중인 트레이스 스팬"""
+    
+    __slots__ = ('name', 'span_id', 'parent_id', 'start_us', 'start', 'attributes')
+    
+    def __init__(self, name: str, span_id: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.name = name
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.start_us = time.time_ns() // 1000
+        self.start = time.perf_counter()
+        self.attributes = attributes
+
+class Tracer:
+    """Chrome trace 이벤트 형식의 NDJSON 트레이스 기록기"""
+    
+    def __init__(self, enabled: bool = False, output_dir: str = 'logs'):
+        self.logger = logging.getLogger(__name__)
+        self.enabled = enabled
+        self.trace_id = uuid.uuid4().hex
+        self.pid = os.getpid()
+        self.path = Path(output_dir) / f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ndjson"
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._file = None
+    
+    def _stack(self) -> List[TraceSpan]:
+        """현재 스레드의 스팬 스택 반환"""
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+    
+    def start_span(self, name: str, attributes: Dict[str, Any] = None) -> TraceSpan:
+        """스팬 시작 (현재 열려 있는 스팬을 부모로 지정)"""
+        stack = self._stack()
+        parent_id = stack[-1].span_id if stack else None
+        span = TraceSpan(name, uuid.uuid4().hex[:16], parent_id, dict(attributes or {}))
+        stack.append(span)
+        return span
+    
+    def end_span(self, span: TraceSpan, error: BaseException = None):
+        """스팬 종료 후 이벤트 기록"""
+        duration_us = int((time.perf_counter() - span.start) * 1_000_000)
+        
+        stack = self._stack()
+        if span in stack:
+            stack.remove(span)
+        
+        args = {
+            'trace_id': self.trace_id,
+            'span_id': span.span_id,
+            'parent_id': span.parent_id
+        }
+        args.update(span.attributes)
+        if error is not None:
+            args['error'] = f"{type(error).__name__}: {error}"
+        
+        self._write({
+            'name': span.name,
+            'cat': 'crawler',
+            'ph': 'X',
+            'ts': span.start_us,
+            'dur': duration_us,
+            'pid': self.pid,
+            'tid': threading.get_ident(),
+            'args': args
+        })
+    
+    def _write(self, event: Dict[str, Any]):
+        """이벤트 한 줄 추가"""
+        try:
+            with self._lock:
+                if self._file is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._file = open(self.path, 'a', encoding='utf-8')
+                self._file.write(json.dumps(event, ensure_ascii=False, default=str) + '\n')
+        except Exception as e:
+            self.logger.error(f"트레이스 기록 실패: {str(e)}")
+            self.enabled = False
+    
+    def close(self) -> Optional[str]:
+        """트레이스 파일 닫기"""
+        with self._lock:
+            if self._file is None:
+                return None
+            self._file.close()
+            self._file = None
+        
+        self.logger.info(f"트레이스 저장 완료: {self.path}")
+        return str(self.path)
+
+def convert_to_chrome_trace(ndjson_path: str, output_path: str = None) -> str:
+    """NDJSON 트레이스를 chrome://tracing, Perfetto용 JSON으로 변환"""
+    source = Path(ndjson_path)
+    target = Path(output_path) if output_path else source.with_suffix('.json')
+    
+    with open(source, 'r', encoding='utf-8') as f:
+        events = [json.loads(line) for line in f if line.strip()]
+    
+    with open(target, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+    
+    return str(target)
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("사용법: python -m src.tracing <trace.ndjson> [output.json]")
+        sys.exit(1)
+    
+    print(convert_to_chrome_trace(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None))
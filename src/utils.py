@@ -4,6 +4,7 @@
 """
 
 import re
+import hashlib
 import logging
 import json
 import os
@@ -13,6 +14,8 @@ from pathlib import Path
 from urllib.parse import urlparse, urljoin
 import logging.handlers
 
+from .keywords import cached_matcher
+
 def setup_logging():
     """로깅 설정"""
     # 로그 디렉토리 생성
@@ -85,6 +88,18 @@ def override_config_with_env(config: Dict[str, Any]) -> Dict[str, Any]:
         'CRAWLER_RETRY_COUNT': ['crawler', 'retry_count'],
         'BATCH_SIZE': ['batch_size'],
         'SELENIUM_HEADLESS': ['selenium', 'headless'],
+        'INSTRUMENTATION_ENABLED': ['instrumentation', 'enabled'],
+        'METRICS_PORT': ['metrics', 'port'],
+        'PROFILE_UNIVERSITIES': ['profiling', 'universities'],
+        'PROFILE_RUN': ['profiling', 'run'],
+        'TRACING_ENABLED': ['tracing', 'enabled'],
+        'RUN_LOG_ENABLED': ['run_log', 'enabled'],
+        'ARCHIVE_ENABLED': ['archive', 'enabled'],
+        'NOTICE_CATEGORIES_ENABLED': ['keywords', 'store_categories'],
+        'DATABASE_BACKEND': ['database', 'backend'],
+        'DB_CONCURRENCY': ['database', 'concurrency'],
+        'SPOOL_ENABLED': ['spool', 'enabled'],
+        'SQLITE_PATH': ['database', 'sqlite_path'],
         'LOG_LEVEL': ['logging', 'level']
     }
     
@@ -92,10 +107,13 @@ def override_config_with_env(config: Dict[str, Any]) -> Dict[str, Any]:
         env_value = os.getenv(env_var)
         if env_value is not None:
             # 타입 변환
-            if env_var in ['CRAWLER_TIMEOUT', 'CRAWLER_RETRY_COUNT', 'BATCH_SIZE']:
+            if env_var in ['CRAWLER_TIMEOUT', 'CRAWLER_RETRY_COUNT', 'BATCH_SIZE', 'METRICS_PORT', 'DB_CONCURRENCY']:
                 env_value = int(env_value)
-            elif env_var == 'SELENIUM_HEADLESS':
+            elif env_var in ['SELENIUM_HEADLESS', 'INSTRUMENTATION_ENABLED', 'PROFILE_RUN', 'TRACING_ENABLED', 'RUN_LOG_ENABLED', 'SPOOL_ENABLED',
+                             'ARCHIVE_ENABLED', 'NOTICE_CATEGORIES_ENABLED']:
                 env_value = env_value.lower() in ['true', '1', 'yes']
+            elif env_var == 'PROFILE_UNIVERSITIES':
+                env_value = [name.strip() for name in env_value.split(',') if name.strip()]
             
             # 중첩된 딕셔너리에 값 설정
             current = config
@@ -140,8 +158,8 @@ def parse_date(date_string: str) -> Optional[str]:
     
     # 날짜 패턴 정의
     date_patterns = [
-        # YYYY-MM-DD, YYYY.MM.DD, YYYY/MM/DD
-        (r'(\d{4})[-./](\d{1,2})[-./](\d{1,2})', lambda m: f"{m.group(1)}-{m.group(2).zfill(2)}-{m.group(3).zfill(2)}"),
+        # YYYY-MM-DD, YYYY.MM.DD, YYYY/MM/DD, YYYY. M. D.
+        (r'(\d{4})[-./]\s*(\d{1,2})[-./]\s*(\d{1,2})', lambda m: f"{m.group(1)}-{m.group(2).zfill(2)}-{m.group(3).zfill(2)}"),
         
         # YY-MM-DD, YY.MM.DD, YY/MM/DD (2000년대 가정)
         (r'(\d{2})[-./](\d{1,2})[-./](\d{1,2})', lambda m: f"20{m.group(1)}-{m.group(2).zfill(2)}-{m.group(3).zfill(2)}"),
@@ -205,32 +223,12 @@ def extract_domain(url: str) -> str:
         return ""
 
 def is_notice_relevant(title: str, keywords: list = None) -> bool:
-    """공지사항 제목의 관련성 검사"""
+    """공지사항 제목의 관련성 검사 (관련 키워드가 있으면 관련, 없으면 제외 키워드가 없을 때만 관련)"""
     if not title:
         return False
     
-    title_lower = title.lower()
-    
-    # 기본 키워드
-    default_keywords = [
-        '공지', '안내', '모집', '전형', '입학', '합격', '발표',
-        '시험', '접수', '마감', '변경', '연기', '취소', '선발'
-    ]
-    
-    keywords = keywords or default_keywords
-    
-    # 키워드 포함 여부 확인
-    for keyword in keywords:
-        if keyword in title_lower:
-            return True
-    
-    # 제외할 키워드 확인
-    exclude_keywords = ['광고', '홍보', '이벤트', '세미나', '특강']
-    for exclude in exclude_keywords:
-        if exclude in title_lower:
-            return False
-    
-    return True
+    # 키워드 목록별로 컴파일된 매처 재사용 (제목 묶음은 KeywordMatcher.tag_many 사용)
+    return cached_matcher(tuple(keywords) if keywords else None).is_relevant(title)
 
 def validate_notice_data(notice: Dict[str, Any]) -> bool:
     """공지사항 데이터 유효성 검사"""
@@ -323,6 +321,26 @@ def save_json_file(data: Any, file_path: str) -> bool:
     except Exception:
         return False
 
+def notice_fingerprint(university_name: str, title: str) -> str:
+    """대학명과 제목으로 공지사항 고유 지문 생성 (sha256 hex)"""
+    # DB 마이그레이션의 backfill 식과 동일해야 함: digest(university_name || chr(31) || notice_title, 'sha256')
+    return hashlib.sha256(f"{university_name}\x1f{title}".encode('utf-8')).hexdigest()
+
+def university_key(university_name: str, code: Optional[str] = None) -> str:
+    """아카이브의 대학 키 (같은 이름의 캠퍼스/전형별 게시판을 구분하도록 코드 우선, 없으면 이름)"""
+    return code or university_name
+
+def clean_notice_title(title: str, max_length: int = 500) -> str:
+    """저장용 공지사항 제목 정제 (공백 정리, 최대 길이 제한)"""
+    if not title:
+        return ""
+    
+    cleaned = ' '.join(title.split())
+    if len(cleaned) > max_length:
+        cleaned = cleaned[:max_length] + '...'
+    
+    return cleaned
+
 def get_current_timestamp() -> str:
     """현재 타임스탬프 반환 (ISO 형식)"""
     return datetime.now().isoformat()
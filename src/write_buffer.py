@@ -0,0 +1,95 @@
+"""
+공지사항 쓰기 버퍼 모듈
+여러 대학의 저장용 행을 모아 크기 또는 시간 기준으로 한 번에 저장
+"""
+
+import time
+import logging
+from collections import Counter
+from typing import Dict, List, Any
+
+class NoticeWriteBuffer:
+    """실행 전체가 공유하는 공지사항 쓰기 버퍼"""
+    
+    def __init__(self, db_manager, config: Dict[str, Any] = None, seen_set=None):
+        self.logger = logging.getLogger(__name__)
+        self.db_manager = db_manager
+        self.seen_set = seen_set
+        config = config or {}
+        self.max_rows = config.get('buffer_rows', 500)
+        self.max_wait = config.get('buffer_seconds', 30)
+        self.rows: List[Dict] = []
+        self.saved_counts: Counter = Counter()
+        self.failed_counts: Counter = Counter()
+        self._first_added = None
+    
+    def add(self, notices: List[Dict], university_name: str) -> Dict[str, int]:
+        """공지사항을 버퍼에 추가하고, 기준을 넘으면 저장 후 대학별 저장 개수 반환"""
+        rows = self.db_manager.prepare_notices(notices, university_name)
+        
+        # 이미 저장된 것으로 확인된 지문은 DB로 보내지 않음
+        if self.seen_set is not None:
+            rows = self.seen_set.filter_new(rows)
+        if not rows:
+            return {}
+        
+        if not self.rows:
+            self._first_added = time.monotonic()
+        self.rows.extend(rows)
+        
+        if self.should_flush():
+            return self.flush()
+        return {}
+    
+    def should_flush(self) -> bool:
+        """버퍼 크기 또는 대기 시간 기준 확인"""
+        if not self.rows:
+            return False
+        return len(self.rows) >= self.max_rows or time.monotonic() - self._first_added >= self.max_wait
+    
+    def flush(self) -> Dict[str, int]:
+        """버퍼의 행을 저장하고 이번 저장의 대학별 저장 개수 반환"""
+        if not self.rows:
+            return {}
+        
+        rows, self.rows = self.rows, []
+        
+        # 여러 대학에서 같은 지문이 들어온 경우 하나만 전송
+        rows = list({row['fingerprint']: row for row in rows}.values())
+        
+        # seen-set으로 거르지 않았으면 이미 저장된 지문을 조회해 행 전체를 보내지 않음 (database.duplicate_check)
+        if self.seen_set is None or not self.seen_set.enabled:
+            rows = self.db_manager.filter_existing(rows)
+            if not rows:
+                return {}
+        
+        # 여러 대학의 행이므로 지금 크롤링 중인 대학의 저장 시간으로 잡히지 않도록 대학 없이 기록
+        stage_timer = self.db_manager.stage_timer
+        with stage_timer.university_scope(None), stage_timer.span('db_insert', rows=len(rows)):
+            inserted, failed = self.db_manager.upsert_rows(rows)
+        
+        # 실패하지 않은 행은 새로 삽입되었거나 이미 DB에 있는 행
+        if self.seen_set is not None:
+            failed_fingerprints = {row['fingerprint'] for row in failed}
+            for row in rows:
+                if row['fingerprint'] not in failed_fingerprints:
+                    self.seen_set.add(row['fingerprint'])
+        
+        flushed = Counter(row.get('university_name') for row in inserted)
+        self.saved_counts.update(flushed)
+        self.failed_counts.update(row.get('university_name') for row in failed)
+        
+        self.logger.info(f"버퍼 저장: {len(rows)}개 중 {len(inserted)}개 신규, {len(failed)}개 실패")
+        return dict(flushed)
+    
+    def close(self) -> Dict[str, int]:
+        """남은 행 최종 저장"""
+        return self.flush()
+    
+    def stats(self) -> Dict[str, Any]:
+        """리포트용 통계"""
+        return {
+            'pending_rows': len(self.rows),
+            'saved': sum(self.saved_counts.values()),
+            'rejected': sum(self.failed_counts.values())
+        }